@@ -55,6 +55,8 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.request_context.RequestContextMiddleware',
+    'core.middleware.request_logging.RequestLoggingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -88,6 +90,23 @@ DATABASES = {
     )
 }
 
+# Optional separate database for the audit log tables (see core.db_routers.LogRouter).
+# Run `migrate --database logs` as well when this is set.
+LOG_DATABASE_URL = os.getenv('LOG_DATABASE_URL')
+if LOG_DATABASE_URL:
+    DATABASES['logs'] = dj_database_url.parse(
+        LOG_DATABASE_URL,
+        conn_max_age=600,
+        conn_health_checks=True,
+    )
+    if 'sqlite' in DATABASES['logs']['ENGINE']:
+        DATABASES['logs']['OPTIONS'] = {
+            'init_command': 'PRAGMA journal_mode=WAL;PRAGMA synchronous=NORMAL;PRAGMA busy_timeout=5000',
+            'transaction_mode': 'IMMEDIATE',
+        }
+
+DATABASE_ROUTERS = ['core.db_routers.LogRouter']
+
 # Log database configuration
 import logging
 logger = logging.getLogger('django')
@@ -160,9 +179,10 @@ LOGGING = {
             'datefmt': '%Y-%m-%d %H:%M:%S',
         },
     },
+    # Queued handlers write from a background thread, so logging calls never block on I/O.
     'handlers': {
         'console': {
-            'class': 'logging.StreamHandler',
+            'class': 'core.utils.log_handlers.QueuedStreamHandler',
             'formatter': 'detailed',
         },
     },
@@ -182,14 +202,20 @@ LOGGING = {
 
 # Add file logging only if logs directory exists (for local development)
 if os.path.exists(BASE_DIR / 'logs'):
+    LOG_FILE_MAX_BYTES = int(os.getenv('LOG_FILE_MAX_BYTES', str(20 * 1024 * 1024)))
+    LOG_FILE_BACKUP_COUNT = int(os.getenv('LOG_FILE_BACKUP_COUNT', '5'))
     LOGGING['handlers']['file'] = {
-        'class': 'logging.FileHandler',
+        'class': 'core.utils.log_handlers.QueuedRotatingFileHandler',
         'filename': BASE_DIR / 'logs' / 'billdr.log',
+        'maxBytes': LOG_FILE_MAX_BYTES,
+        'backupCount': LOG_FILE_BACKUP_COUNT,
         'formatter': 'detailed',
     }
     LOGGING['handlers']['error_file'] = {
-        'class': 'logging.FileHandler',
+        'class': 'core.utils.log_handlers.QueuedRotatingFileHandler',
         'filename': BASE_DIR / 'logs' / 'errors.log',
+        'maxBytes': LOG_FILE_MAX_BYTES,
+        'backupCount': LOG_FILE_BACKUP_COUNT,
         'formatter': 'verbose',
         'level': 'ERROR',
     }
@@ -205,6 +231,65 @@ if os.path.exists(BASE_DIR / 'logs'):
     }
     LOGGING['loggers']['django.request']['handlers'].append('error_file')
 
+# Audit log (DatabaseLogger) configuration
+DB_LOGGER = {
+    'DATABASE_ALIAS': 'logs' if LOG_DATABASE_URL else 'default',
+    # 'database', 'jsonl', or a dotted path to a LogSink class taking the config
+    'SINK': os.getenv('DB_LOGGER_SINK', 'database'),
+    'JSONL_DIRECTORY': os.getenv('DB_LOGGER_JSONL_DIRECTORY', str(BASE_DIR / 'logs' / 'events')),
+    'JSONL_MAX_BYTES': int(os.getenv('DB_LOGGER_JSONL_MAX_BYTES', str(64 * 1024 * 1024))),
+    'JSONL_BACKUP_COUNT': int(os.getenv('DB_LOGGER_JSONL_BACKUP_COUNT', '20')),
+    'BUFFERED': os.getenv('DB_LOGGER_BUFFERED', 'False').lower() == 'true',
+    'BUFFER_MAX_SIZE': int(os.getenv('DB_LOGGER_BUFFER_MAX_SIZE', '10000')),
+    'FLUSH_BATCH_SIZE': int(os.getenv('DB_LOGGER_FLUSH_BATCH_SIZE', '500')),
+    'FLUSH_INTERVAL_SECONDS': float(os.getenv('DB_LOGGER_FLUSH_INTERVAL_SECONDS', '2')),
+    'OVERFLOW_POLICY': os.getenv('DB_LOGGER_OVERFLOW_POLICY', 'flush'),
+    # 'auto' flushes with COPY on PostgreSQL and bulk_create elsewhere
+    'BULK_INSERT_METHOD': os.getenv('DB_LOGGER_BULK_INSERT_METHOD', 'auto'),
+    # Events below these levels are dropped before any formatting happens.
+    # MIN_LEVELS overrides MIN_LEVEL per category, e.g. {'DATABASE': 'WARNING'}.
+    'MIN_LEVEL': os.getenv('DB_LOGGER_MIN_LEVEL', 'DEBUG' if DEBUG else 'INFO'),
+    'MIN_LEVELS': {},
+    'PARTITION_MONTHS_AHEAD': int(os.getenv('DB_LOGGER_PARTITION_MONTHS_AHEAD', '3')),
+    'RETENTION_MONTHS': int(os.getenv('DB_LOGGER_RETENTION_MONTHS', '12')),
+    'ROLLUP_GRACE_MINUTES': int(os.getenv('DB_LOGGER_ROLLUP_GRACE_MINUTES', '5')),
+    'ROLLUP_ARCHIVE_DIR': os.getenv('DB_LOGGER_ROLLUP_ARCHIVE_DIR') or None,
+    # Rows older than ARCHIVE_AFTER_DAYS move to compressed files here; queries read through to them
+    'ARCHIVE_DIR': os.getenv('DB_LOGGER_ARCHIVE_DIR', str(BASE_DIR / 'logs' / 'archive')),
+    'ARCHIVE_AFTER_DAYS': int(os.getenv('DB_LOGGER_ARCHIVE_AFTER_DAYS', '30')),
+    # Caps for the frontend's batched client events; the rate limit is per client IP, in events
+    'CLIENT_EVENTS_MAX_BATCH': int(os.getenv('DB_LOGGER_CLIENT_EVENTS_MAX_BATCH', '100')),
+    'CLIENT_EVENTS_MAX_BODY_BYTES': int(os.getenv('DB_LOGGER_CLIENT_EVENTS_MAX_BODY_BYTES', str(256 * 1024))),
+    'CLIENT_EVENT_MAX_CONTEXT_BYTES': int(os.getenv('DB_LOGGER_CLIENT_EVENT_MAX_CONTEXT_BYTES', '4096')),
+    'CLIENT_EVENTS_RATE_PER_SECOND': float(os.getenv('DB_LOGGER_CLIENT_EVENTS_RATE_PER_SECOND', '10')),
+    'CLIENT_EVENTS_BURST': float(os.getenv('DB_LOGGER_CLIENT_EVENTS_BURST', '300')),
+    # Reverse proxies in front of the app whose X-Forwarded-For hops the rate limit trusts
+    'CLIENT_EVENTS_TRUSTED_PROXIES': int(os.getenv('DB_LOGGER_CLIENT_EVENTS_TRUSTED_PROXIES', '0')),
+    # Path prefixes RequestLoggingMiddleware neither logs nor times
+    'REQUEST_LOG_EXCLUDED_PATHS': [
+        path.strip()
+        for path in os.getenv('DB_LOGGER_REQUEST_LOG_EXCLUDED_PATHS', '/health/,/static/,/admin/').split(',')
+        if path.strip()
+    ],
+    # First matching rule wins; ERROR and CRITICAL events are never sampled.
+    'SAMPLING_RULES': [
+        {
+            'category': 'HEALTH',
+            'sample_rate': float(os.getenv('DB_LOGGER_HEALTH_SAMPLE_RATE', '0.05')),
+        },
+        {
+            'category': 'API',
+            'level': 'INFO',
+            'rate_per_second': float(os.getenv('DB_LOGGER_API_RATE_PER_SECOND', '20')),
+            'burst': float(os.getenv('DB_LOGGER_API_RATE_BURST', '50')),
+        },
+    ],
+    # Identical untimed events within this many seconds are folded into one
+    # row with a repeat_count; 0 disables coalescing.
+    'COALESCE_WINDOW_SECONDS': float(os.getenv('DB_LOGGER_COALESCE_WINDOW_SECONDS', '10')),
+    'COALESCE_MAX_KEYS': int(os.getenv('DB_LOGGER_COALESCE_MAX_KEYS', '10000')),
+}
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
     "http://localhost:3001",
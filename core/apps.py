@@ -1,6 +1,11 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from core.services.log_indexes import ensure_context_columns_after_migrate
+        post_migrate.connect(ensure_context_columns_after_migrate, sender=self)
@@ -1,11 +1,15 @@
 
 HTTP_200_OK = 200
 HTTP_201_CREATED = 201
+HTTP_202_ACCEPTED = 202
 HTTP_400_BAD_REQUEST = 400
 HTTP_401_UNAUTHORIZED = 401
 HTTP_403_FORBIDDEN = 403
 HTTP_404_NOT_FOUND = 404
 HTTP_409_CONFLICT = 409
+HTTP_411_LENGTH_REQUIRED = 411
+HTTP_413_REQUEST_ENTITY_TOO_LARGE = 413
+HTTP_429_TOO_MANY_REQUESTS = 429
 HTTP_500_INTERNAL_SERVER_ERROR = 500
 HTTP_503_SERVICE_UNAVAILABLE = 503
 
@@ -35,6 +39,9 @@ INVOICE_RETRIEVAL_SUCCESS_MESSAGE = "Invoices retrieved successfully"
 INVOICE_RETRIEVAL_FAILED_MESSAGE = "Invoices retrieval failed"
 INVOICE_INDIVIDUAL_RETRIEVAL_SUCCESS_MESSAGE = "Invoice retrieved successfully"
 INVOICE_INDIVIDUAL_RETRIEVAL_FAILED_MESSAGE = "Invoice not found"
+INVOICE_BULK_CREATION_SUCCESS_MESSAGE = "Invoices created successfully"
+INVOICE_BULK_CREATION_FAILED_MESSAGE = "Invoice batch creation failed"
+INVOICE_BULK_MAX_BATCH = 500
 
 BUSINESS_OWNER_INDIVIDUAL_RETRIEVAL_SUCCESS_MESSAGE = "Business owner retrieved successfully"
 BUSINESS_OWNER_INDIVIDUAL_RETRIEVAL_FAILED_MESSAGE = "Business owner not found"
@@ -203,6 +210,7 @@ INVOICE_STATUS_FIELD = "invoice_status"
 INVOICE_PAYMENT_STATUS_FIELD = "invoice_payment_status"
 
 INVOICE_NUMBER_SERIALIZER_FIELD = "invoice_number"
+PREFETCHED_RELATIONS_CONTEXT_KEY = "prefetched_relations"
 
 EXCEEDS_AMOUNT_DUE_VALIDATION = "exceeds amount due"
 MUST_BE_AT_LEAST_VALIDATION = "must be at least"
@@ -257,4 +265,31 @@ FAILED_TO_CREATE_PAYMENT_INTENT_MESSAGE = "Failed to create payment intent: {err
 
 STRIPE_ERROR_CODE_CHARGE_ALREADY_REFUNDED = "charge_already_refunded"
 PAYMENT_ALREADY_REFUNDED_MESSAGE = "This payment has already been refunded"
-STRIPE_REFUND_ERROR_MESSAGE_TEMPLATE = "Stripe refund error: {error}"
\ No newline at end of file
+STRIPE_REFUND_ERROR_MESSAGE_TEMPLATE = "Stripe refund error: {error}"
+
+LOG_EVENTS_RETRIEVAL_SUCCESS_MESSAGE = "Log events retrieved successfully"
+LOG_EVENTS_QUERY_INVALID_MESSAGE = "Invalid log event query"
+LOG_EVENTS_CURSOR_INVALID_MESSAGE = "Invalid pagination cursor"
+LOG_EVENTS_DEFAULT_PAGE_SIZE = 50
+LOG_EVENTS_MAX_PAGE_SIZE = 200
+LOG_EVENTS_RESULTS_FIELD = "results"
+LOG_EVENTS_NEXT_CURSOR_FIELD = "next_cursor"
+LATENCY_REPORT_RETRIEVAL_SUCCESS_MESSAGE = "Latency report retrieved successfully"
+ERROR_GROUPS_RETRIEVAL_SUCCESS_MESSAGE = "Error groups retrieved successfully"
+ERROR_GROUPS_QUERY_INVALID_MESSAGE = "Invalid error group query"
+ERROR_GROUPS_DEFAULT_LIMIT = 20
+ERROR_GROUPS_MAX_LIMIT = 100
+LOG_ANALYTICS_RETRIEVAL_SUCCESS_MESSAGE = "Log analytics retrieved successfully"
+LOG_ANALYTICS_QUERY_INVALID_MESSAGE = "Invalid log analytics query"
+CLIENT_EVENTS_ACCEPTED_MESSAGE = "Client events accepted"
+CLIENT_EVENTS_INVALID_MESSAGE = "Invalid client events"
+CLIENT_EVENTS_TOO_LARGE_MESSAGE = "Client events payload is too large"
+CLIENT_EVENTS_LENGTH_REQUIRED_MESSAGE = "Client events require a Content-Length header"
+CLIENT_EVENTS_RATE_LIMITED_MESSAGE = "Too many client events, slow down"
+CLIENT_EVENT_CONTEXT_TOO_LARGE_MESSAGE = "context_data is too large"
+CLIENT_EVENTS_RECEIVED_FIELD = "received"
+CLIENT_EVENTS_STORED_FIELD = "stored"
+LOG_EXPORT_QUERY_INVALID_MESSAGE = "Invalid log export query"
+LOG_EXPORT_RANGE_INVALID_MESSAGE = "since must be before until"
+LOG_EXPORT_CONTENT_TYPE = "application/gzip"
+LOG_EXPORT_FILENAME = "log-events-{since}-{until}.ndjson.gz"
@@ -21,6 +21,7 @@ INVOICE_DELETED = "Invoice deleted successfully: {invoice_id}"
 INVOICE_DELETION_FAILED = "Failed to delete invoice: {invoice_id}"
 INVOICE_STATUS_CHANGED = "Invoice status changed: {invoice_id} from {old_status} to {new_status}"
 INVOICE_NUMBER_GENERATED = "Invoice number generated: {invoice_number} for invoice {invoice_id}"
+INVOICES_BULK_CREATED = "Invoices created in bulk: {invoice_count} invoices, numbers {first_number} to {last_number}"
 
 # Payment-related logging messages
 PAYMENT_INITIATED = "Payment initiated: {payment_id} for invoice {invoice_id}"
@@ -45,6 +46,8 @@ DB_QUERY_FAILED = "Database query failed: {query_type} - {error}"
 # API-related logging messages
 API_REQUEST_RECEIVED = "API request received: {method} {endpoint} from {ip_address}"
 API_REQUEST_COMPLETED = "API request completed: {method} {endpoint} - {status_code}"
+# Latency key shared by every request that did not resolve to a URL route
+LATENCY_UNMATCHED_ROUTE = "<unmatched>"
 API_REQUEST_FAILED = "API request failed: {method} {endpoint} - {error}"
 INVALID_REQUEST_DATA = "Invalid request data received: {endpoint} - {errors}"
 AUTHENTICATION_FAILED = "Authentication failed for request: {endpoint}"
@@ -54,6 +57,9 @@ AUTHORIZATION_FAILED = "Authorization failed for user {user_id} on {endpoint}"
 HEALTH_CHECK_SUCCESS = "Health check passed: {check_type}"
 HEALTH_CHECK_FAILED = "Health check failed: {check_type} - {error}"
 
+# Client-reported logging messages; the client's text is context, never the template
+CLIENT_EVENT_REPORTED = "Client event: {message}"
+
 # Error logging messages
 UNEXPECTED_ERROR = "Unexpected error occurred: {error}"
 VALIDATION_ERROR = "Validation error: {field} - {error}"
@@ -64,4 +70,117 @@ APPLICATION_STARTUP = "Billdr application starting up"
 APPLICATION_SHUTDOWN = "Billdr application shutting down"
 MIGRATION_STARTED = "Database migration started"
 MIGRATION_COMPLETED = "Database migration completed"
-MIGRATION_FAILED = "Database migration failed: {error}"
\ No newline at end of file
+MIGRATION_FAILED = "Database migration failed: {error}"
+
+# DatabaseLogger configuration
+DB_LOGGER_SETTINGS_KEY = "DB_LOGGER"
+
+LOG_BUFFER_OVERFLOW_DROP_OLDEST = "drop_oldest"
+LOG_BUFFER_OVERFLOW_DROP_NEWEST = "drop_newest"
+LOG_BUFFER_OVERFLOW_FLUSH = "flush"
+LOG_BUFFER_OVERFLOW_POLICIES = [
+    LOG_BUFFER_OVERFLOW_DROP_OLDEST,
+    LOG_BUFFER_OVERFLOW_DROP_NEWEST,
+    LOG_BUFFER_OVERFLOW_FLUSH,
+]
+
+LOG_SINK_DATABASE = "database"
+LOG_SINK_JSONL = "jsonl"
+
+JSONL_ACTIVE_FILENAME = "events.jsonl"
+JSONL_ROTATED_FILENAME = "events-{suffix}.jsonl"
+JSONL_ROTATED_GLOB = "events-*.jsonl"
+
+LOG_BULK_INSERT_AUTO = "auto"
+LOG_BULK_INSERT_COPY = "copy"
+LOG_BULK_INSERT_BULK_CREATE = "bulk_create"
+LOG_BULK_INSERT_METHODS = [LOG_BULK_INSERT_AUTO, LOG_BULK_INSERT_COPY, LOG_BULK_INSERT_BULK_CREATE]
+
+# context_data keys SQLite mirrors into indexed generated columns
+LOG_CONTEXT_INDEXED_KEYS = ("invoice_id", "customer_id", "user_type")
+LOG_CONTEXT_COLUMN = "context_{key}"
+LOG_CONTEXT_INDEX = "core_logevent_context_{key}_idx"
+
+# Incoming X-Request-ID values are kept when they look like an id, else a new one is issued
+REQUEST_ID_META_KEY = "HTTP_X_REQUEST_ID"
+REQUEST_ID_HEADER = "X-Request-ID"
+REQUEST_ID_PATTERN = r"[A-Za-z0-9._-]{1,64}"
+
+LOG_ANALYTICS_WINDOW_HOUR = "hour"
+LOG_ANALYTICS_WINDOW_DAY = "day"
+LOG_ANALYTICS_WINDOW_WEEK = "week"
+LOG_ANALYTICS_WINDOWS = [LOG_ANALYTICS_WINDOW_HOUR, LOG_ANALYTICS_WINDOW_DAY, LOG_ANALYTICS_WINDOW_WEEK]
+LOG_ANALYTICS_INTERVAL_HOUR = "hour"
+LOG_ANALYTICS_INTERVAL_DAY = "day"
+LOG_ANALYTICS_INTERVALS = [LOG_ANALYTICS_INTERVAL_HOUR, LOG_ANALYTICS_INTERVAL_DAY]
+LOG_ANALYTICS_CACHE_KEY = "log-analytics:{interval}:{bucket}:{filters}"
+LOG_ANALYTICS_CACHE_TIMEOUT_SECONDS = 8 * 24 * 60 * 60
+
+LOG_ARCHIVE_FILENAME = "logevents-{day}-{batch_id}.columns.json.gz"
+LOG_ARCHIVE_MANIFEST_FILENAME = "manifest.json"
+
+LOG_APP_LABEL = "core"
+LOG_MODEL_NAMES = frozenset({"errorgroup", "logevent", "logeventrollup", "logmessagetemplate"})
+
+DB_LOGGER_DEFAULTS = {
+    "DATABASE_ALIAS": "default",
+    "SINK": LOG_SINK_DATABASE,
+    "JSONL_DIRECTORY": "logs/events",
+    "JSONL_MAX_BYTES": 64 * 1024 * 1024,
+    "JSONL_BACKUP_COUNT": 20,
+    "BUFFERED": False,
+    "BUFFER_MAX_SIZE": 10000,
+    "FLUSH_BATCH_SIZE": 500,
+    "FLUSH_INTERVAL_SECONDS": 2.0,
+    "OVERFLOW_POLICY": LOG_BUFFER_OVERFLOW_FLUSH,
+    "BULK_INSERT_METHOD": LOG_BULK_INSERT_AUTO,
+    "MIN_LEVEL": "DEBUG",
+    "MIN_LEVELS": {},
+    "SAMPLING_RULES": [],
+    "COALESCE_WINDOW_SECONDS": 0,
+    "COALESCE_MAX_KEYS": 10000,
+    "PARTITION_MONTHS_AHEAD": 3,
+    "RETENTION_MONTHS": 12,
+    "ROLLUP_GRACE_MINUTES": 5,
+    "ROLLUP_ARCHIVE_DIR": None,
+    "ARCHIVE_DIR": "logs/archive",
+    "ARCHIVE_AFTER_DAYS": 30,
+    "CLIENT_EVENTS_MAX_BATCH": 100,
+    "CLIENT_EVENTS_MAX_BODY_BYTES": 256 * 1024,
+    "CLIENT_EVENT_MAX_CONTEXT_BYTES": 4096,
+    "CLIENT_EVENTS_RATE_PER_SECOND": 10.0,
+    "CLIENT_EVENTS_BURST": 300,
+    "CLIENT_EVENTS_MAX_CLIENTS": 10000,
+    "CLIENT_EVENTS_TRUSTED_PROXIES": 0,
+    "REQUEST_LOG_EXCLUDED_PATHS": ["/health/", "/static/", "/admin/"],
+}
+
+LOG_FLUSHER_THREAD_NAME = "billdr-log-flusher"
+LOG_BUFFER_SHUTDOWN_TIMEOUT_SECONDS = 10.0
+LOG_BUFFER_FLUSH_FAILED = "Failed to flush {count} buffered log entries: {error}"
+LOG_BUFFER_OVERFLOW_DROPPED = "Log buffer full ({max_size} entries), dropped {dropped} log entries so far"
+LOG_COALESCER_THREAD_NAME = "billdr-log-coalescer"
+LOG_COALESCE_SWEEP_FAILED = "Failed to record repeats of {count} coalesced log entries: {error}"
+
+# Log maintenance command messages
+MANAGE_LOG_PARTITIONS_HELP = "Create upcoming monthly LogEvent partitions and drop expired ones"
+LOG_PARTITION_CREATED_MESSAGE = "Created partition {name}"
+LOG_PARTITION_DROPPED_MESSAGE = "Dropped expired partition {name}"
+LOG_PARTITION_WOULD_DROP_MESSAGE = "Would drop expired partition {name}"
+LOG_PARTITION_SUMMARY_MESSAGE = "LogEvent partitions up to date: {created} created, {dropped} dropped"
+LOG_PARTITIONS_UNSUPPORTED_MESSAGE = "LogEvent table is not partitioned on this database; deleting expired rows instead"
+LOG_EXPIRED_ROWS_DELETED_MESSAGE = "Deleted {count} LogEvent rows older than {cutoff}"
+LOG_EXPIRED_ROWS_WOULD_DELETE_MESSAGE = "Would delete {count} LogEvent rows older than {cutoff}"
+
+ROLLUP_LOG_EVENTS_HELP = "Fold closed hours of LogEvent rows into hourly rollups and remove the raw rows"
+LOG_ROLLUP_HOUR_MESSAGE = "Rolled up {count} LogEvent rows for {hour}"
+LOG_ROLLUP_SUMMARY_MESSAGE = "Rolled up {count} LogEvent rows across {hours} hours"
+ARCHIVE_LOG_EVENTS_HELP = "Move LogEvent rows older than the hot window into per-day compressed archive files"
+LOG_ARCHIVE_DAY_MESSAGE = "Archived {count} LogEvent rows for {day}"
+LOG_ARCHIVE_SUMMARY_MESSAGE = "Archived {count} LogEvent rows across {days} days"
+EXPORT_LOG_EVENTS_HELP = "Stream LogEvents in a time range to a gzip-compressed NDJSON file"
+LOG_EXPORT_SUMMARY_MESSAGE = "Exported {count} LogEvent rows to {path}"
+SEARCH_LOG_FILES_HELP = "Stream LogEvents from the JSON-lines sink files, optionally filtered"
+BENCHMARK_LOG_INGEST_HELP = "Compare COPY and bulk_create LogEvent insert throughput; all rows are rolled back"
+LOG_INGEST_BENCHMARK_RESULT_MESSAGE = "{method:>12} {rows:>8} rows  {seconds:8.3f}s  {rate:>10,.0f} rows/s"
+LOG_INGEST_BENCHMARK_SKIPPED_MESSAGE = "COPY is only available on PostgreSQL; benchmarking bulk_create only"
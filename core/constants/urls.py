@@ -19,6 +19,7 @@ CUSTOMERS_INVOICES_PATH = "customers/<uuid:customer_id>/invoices/"
 CUSTOMERS_TRANSACTIONS_PATH = "customers/<uuid:customer_id>/transactions/"
 
 INVOICES_ROOT_PATH = ""
+INVOICES_BULK_PATH = "bulk/"
 INVOICE_DETAIL_PATH = "<uuid:invoice_id>/"
 INVOICE_TRANSACTIONS_PATH = "<uuid:invoice_id>/transactions/"
 INVOICE_CREATE_PAYMENT_INTENT_PATH = "<uuid:invoice_id>/create-payment-intent/"
@@ -30,6 +31,14 @@ PAYMENTS_ROOT_PATH = ""
 PAYMENT_DETAIL_PATH = "<uuid:stripe_payment_id>/"
 PAYMENT_REFUND_PATH = "<uuid:stripe_payment_id>/refund/"
 
+LOGS_PATH = "logs/"
+LOG_EVENTS_ROOT_PATH = ""
+LOG_LATENCY_PATH = "latency/"
+LOG_ERRORS_PATH = "errors/"
+LOG_ANALYTICS_PATH = "analytics/"
+LOG_EXPORT_PATH = "export/"
+LOG_CLIENT_EVENTS_PATH = "client-events/"
+
 WEBHOOKS_PATH = "webhooks/"
 STRIPE_WEBHOOK_PATH = "webhooks/stripe/"
 
@@ -44,6 +53,7 @@ CUSTOMER_DETAIL_NAME = "customer_detail"
 CUSTOMER_INVOICES_NAME = "customer_invoices"
 CUSTOMER_TRANSACTIONS_NAME = "customer_transactions"
 INVOICES_NAME = "invoices"
+INVOICES_BULK_NAME = "invoices_bulk"
 INVOICE_DETAIL_NAME = "invoice_detail"
 INVOICE_TRANSACTIONS_NAME = "invoice_transactions"
 CREATE_PAYMENT_INTENT_NAME = "create_payment_intent"
@@ -51,9 +61,16 @@ PAYMENT_HISTORY_NAME = "payment_history"
 PAYMENT_DETAIL_NAME = "payment_detail"
 STRIPE_WEBHOOK_NAME = "stripe_webhook"
 REFUND_PAYMENT_NAME = "refund_payment"
+LOG_EVENTS_NAME = "log_events"
+LOG_LATENCY_NAME = "log_latency"
+LOG_ERRORS_NAME = "log_errors"
+LOG_ANALYTICS_NAME = "log_analytics"
+LOG_EXPORT_NAME = "log_export"
+LOG_CLIENT_EVENTS_NAME = "log_client_events"
 
 CORE_APP_NAME = "core"
 USERS_APP_NAME = "users"
 INVOICES_APP_NAME = "invoices"
 TRANSACTIONS_APP_NAME = "transactions"
-PAYMENTS_APP_NAME = "payments"
\ No newline at end of file
+PAYMENTS_APP_NAME = "payments"
+LOGS_APP_NAME = "logs"
\ No newline at end of file
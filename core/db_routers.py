@@ -0,0 +1,56 @@
+from django.conf import settings
+from core.constants.logging import (
+    DB_LOGGER_SETTINGS_KEY,
+    DB_LOGGER_DEFAULTS,
+    LOG_APP_LABEL,
+    LOG_MODEL_NAMES,
+)
+
+
+def log_database_alias() -> str:
+    config = getattr(settings, DB_LOGGER_SETTINGS_KEY, {})
+    return config.get('DATABASE_ALIAS', DB_LOGGER_DEFAULTS['DATABASE_ALIAS'])
+
+
+def is_log_model(app_label: str, model_name: str) -> bool:
+    return app_label == LOG_APP_LABEL and model_name in LOG_MODEL_NAMES
+
+
+class LogRouter:
+    """
+    Sends the audit log models to DB_LOGGER['DATABASE_ALIAS'].
+
+    With a dedicated alias, log writes use their own connection, so they commit
+    independently of (and survive rollbacks of) business transactions. That
+    alias only receives the log tables, and the log tables only go there.
+    """
+
+    def _route(self, model):
+        if is_log_model(model._meta.app_label, model._meta.model_name):
+            return log_database_alias()
+        return None
+
+    def db_for_read(self, model, **hints):
+        return self._route(model)
+
+    def db_for_write(self, model, **hints):
+        return self._route(model)
+
+    def allow_relation(self, obj1, obj2, **hints):
+        first = is_log_model(obj1._meta.app_label, obj1._meta.model_name)
+        second = is_log_model(obj2._meta.app_label, obj2._meta.model_name)
+        if first and second:
+            return True
+        if first or second:
+            return log_database_alias() == 'default'
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        alias = log_database_alias()
+        if alias == 'default':
+            return None
+        if model_name is not None and is_log_model(app_label, model_name):
+            return db == alias
+        if db == alias:
+            return False
+        return None
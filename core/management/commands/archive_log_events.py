@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from django.db import router
+from django.utils import timezone
+from core.models.logger import LogEvent
+from core.services.logger_service import get_logger_config
+from core.services.log_archive import archive_cutoff, archive_day, oldest_unarchived_day
+from core.constants.logging import (
+    ARCHIVE_LOG_EVENTS_HELP,
+    LOG_ARCHIVE_DAY_MESSAGE,
+    LOG_ARCHIVE_SUMMARY_MESSAGE,
+)
+
+
+class Command(BaseCommand):
+    help = ARCHIVE_LOG_EVENTS_HELP
+
+    def add_arguments(self, parser):
+        config = get_logger_config()
+        parser.add_argument(
+            '--older-than-days', type=int, default=config['ARCHIVE_AFTER_DAYS'],
+            help='Archive whole days that ended at least this many days ago',
+        )
+        parser.add_argument('--archive-dir', default=config['ARCHIVE_DIR'])
+        parser.add_argument(
+            '--max-days', type=int, default=None,
+            help='Stop after this many days (default: all eligible days)',
+        )
+
+    def handle(self, *args, **options):
+        alias = router.db_for_write(LogEvent)
+        cutoff = archive_cutoff(timezone.now(), options['older_than_days'])
+
+        days = 0
+        total = 0
+        while options['max_days'] is None or days < options['max_days']:
+            day = oldest_unarchived_day(alias, cutoff)
+            if day is None:
+                break
+            count = archive_day(day, alias, options['archive_dir'])
+            days += 1
+            total += count
+            self.stdout.write(LOG_ARCHIVE_DAY_MESSAGE.format(count=count, day=f"{day:%Y-%m-%d}"))
+
+        self.stdout.write(self.style.SUCCESS(LOG_ARCHIVE_SUMMARY_MESSAGE.format(count=total, days=days)))
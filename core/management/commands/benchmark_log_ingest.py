@@ -0,0 +1,64 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import connections, router, transaction
+from django.utils import timezone
+from core.models.logger import LogEvent, LogLevel, LogCategory
+from core.services.log_buffer import bulk_create_log_events
+from core.constants.logging import (
+    BENCHMARK_LOG_INGEST_HELP,
+    LOG_INGEST_BENCHMARK_RESULT_MESSAGE,
+    LOG_INGEST_BENCHMARK_SKIPPED_MESSAGE,
+    LOG_BULK_INSERT_COPY,
+    LOG_BULK_INSERT_BULK_CREATE,
+    API_REQUEST_COMPLETED,
+)
+
+
+class Command(BaseCommand):
+    help = BENCHMARK_LOG_INGEST_HELP
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+            help='Rows per flush to benchmark',
+        )
+
+    def make_events(self, count):
+        now = timezone.now()
+        return [
+            LogEvent(
+                level=LogLevel.INFO,
+                category=LogCategory.API,
+                message_template=API_REQUEST_COMPLETED,
+                context_data={'method': 'GET', 'endpoint': f'/api/invoices/{i}/', 'status_code': 200},
+                ip_address='10.0.0.1',
+                endpoint=f'/api/invoices/{i}/',
+                request_method='GET',
+                execution_time_ms=i % 250,
+                timestamp=now,
+            )
+            for i in range(count)
+        ]
+
+    def handle(self, *args, **options):
+        alias = router.db_for_write(LogEvent)
+        methods = [LOG_BULK_INSERT_BULK_CREATE]
+        if connections[alias].vendor == 'postgresql':
+            methods.insert(0, LOG_BULK_INSERT_COPY)
+        else:
+            self.stdout.write(self.style.WARNING(LOG_INGEST_BENCHMARK_SKIPPED_MESSAGE))
+
+        for size in options['sizes']:
+            for method in methods:
+                events = self.make_events(size)
+                with transaction.atomic(using=alias):
+                    # Template lookup is the same for both paths; keep it out of the timing.
+                    for event in events:
+                        event.resolve_template(alias)
+                    start = time.perf_counter()
+                    bulk_create_log_events(events, method=method)
+                    elapsed = time.perf_counter() - start
+                    transaction.set_rollback(True, using=alias)
+                self.stdout.write(LOG_INGEST_BENCHMARK_RESULT_MESSAGE.format(
+                    method=method, rows=size, seconds=elapsed, rate=size / elapsed if elapsed else 0,
+                ))
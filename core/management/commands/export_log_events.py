@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+from django.utils import timezone
+from core.services.log_export import export_log_event_rows, write_ndjson_gz
+from core.constants.logging import EXPORT_LOG_EVENTS_HELP, LOG_EXPORT_SUMMARY_MESSAGE
+
+
+class Command(BaseCommand):
+    help = EXPORT_LOG_EVENTS_HELP
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help='Path of the .ndjson.gz file to write')
+        parser.add_argument('--since', required=True, help='ISO 8601 timestamp, inclusive')
+        parser.add_argument('--until', required=True, help='ISO 8601 timestamp, exclusive')
+        parser.add_argument('--level')
+        parser.add_argument('--category')
+        parser.add_argument('--user-id')
+        parser.add_argument('--endpoint')
+
+    def handle(self, *args, **options):
+        filters = {
+            field: options[field]
+            for field in ('level', 'category', 'user_id', 'endpoint')
+            if options[field]
+        }
+        for bound in ('since', 'until'):
+            value = parse_datetime(options[bound])
+            if value is None:
+                raise CommandError(f"Invalid --{bound} timestamp: {options[bound]}")
+            filters[bound] = value if timezone.is_aware(value) else timezone.make_aware(value)
+
+        count = write_ndjson_gz(options['output'], export_log_event_rows(filters))
+        self.stdout.write(self.style.SUCCESS(LOG_EXPORT_SUMMARY_MESSAGE.format(count=count, path=options['output'])))
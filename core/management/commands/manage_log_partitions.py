@@ -0,0 +1,91 @@
+from django.core.management.base import BaseCommand
+from django.db import connections, router, transaction
+from django.utils import timezone
+from core.models.logger import LogEvent
+from core.services.logger_service import get_logger_config
+from core.services.log_partitions import (
+    month_start,
+    add_months,
+    partition_name,
+    is_partitioned,
+    list_monthly_partitions,
+    create_month_partition,
+    drop_month_partition,
+    delete_expired_default_rows,
+)
+from core.constants.logging import (
+    MANAGE_LOG_PARTITIONS_HELP,
+    LOG_PARTITION_CREATED_MESSAGE,
+    LOG_PARTITION_DROPPED_MESSAGE,
+    LOG_PARTITION_WOULD_DROP_MESSAGE,
+    LOG_PARTITION_SUMMARY_MESSAGE,
+    LOG_PARTITIONS_UNSUPPORTED_MESSAGE,
+    LOG_EXPIRED_ROWS_DELETED_MESSAGE,
+    LOG_EXPIRED_ROWS_WOULD_DELETE_MESSAGE,
+)
+
+
+class Command(BaseCommand):
+    help = MANAGE_LOG_PARTITIONS_HELP
+
+    def add_arguments(self, parser):
+        config = get_logger_config()
+        parser.add_argument(
+            '--months-ahead', type=int, default=config['PARTITION_MONTHS_AHEAD'],
+            help='Number of future monthly partitions to keep ready',
+        )
+        parser.add_argument(
+            '--retention-months', type=int, default=config['RETENTION_MONTHS'],
+            help='Drop partitions whose whole month is older than this many months',
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Report what would be dropped without dropping anything',
+        )
+
+    def handle(self, *args, **options):
+        alias = router.db_for_write(LogEvent)
+        connection = connections[alias]
+        current = month_start(timezone.now())
+        cutoff = add_months(current, -options['retention_months'])
+
+        if not is_partitioned(connection):
+            self.stdout.write(self.style.WARNING(LOG_PARTITIONS_UNSUPPORTED_MESSAGE))
+            expired = LogEvent.objects.using(alias).filter(timestamp__lt=cutoff)
+            if options['dry_run']:
+                message = LOG_EXPIRED_ROWS_WOULD_DELETE_MESSAGE.format(count=expired.count(), cutoff=cutoff.date())
+            else:
+                message = LOG_EXPIRED_ROWS_DELETED_MESSAGE.format(count=expired.delete()[0], cutoff=cutoff.date())
+            self.stdout.write(message)
+            return
+
+        created = 0
+        for offset in range(options['months_ahead'] + 1):
+            month = add_months(current, offset)
+            with transaction.atomic(using=alias):
+                if create_month_partition(connection, month):
+                    created += 1
+                    self.stdout.write(LOG_PARTITION_CREATED_MESSAGE.format(name=partition_name(month)))
+
+        dropped = 0
+        for name, month in list_monthly_partitions(connection):
+            if add_months(month, 1) > cutoff:
+                continue
+            if options['dry_run']:
+                self.stdout.write(LOG_PARTITION_WOULD_DROP_MESSAGE.format(name=name))
+                continue
+            with transaction.atomic(using=alias):
+                drop_month_partition(connection, name)
+            dropped += 1
+            self.stdout.write(LOG_PARTITION_DROPPED_MESSAGE.format(name=name))
+
+        if not options['dry_run']:
+            # Rows that fell outside every monthly range live in the default partition.
+            with transaction.atomic(using=alias):
+                count = delete_expired_default_rows(connection, cutoff)
+            if count:
+                self.stdout.write(LOG_EXPIRED_ROWS_DELETED_MESSAGE.format(count=count, cutoff=cutoff.date()))
+
+        self.stdout.write(
+            self.style.SUCCESS(LOG_PARTITION_SUMMARY_MESSAGE.format(created=created, dropped=dropped))
+        )
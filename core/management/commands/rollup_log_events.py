@@ -0,0 +1,48 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import router
+from django.utils import timezone
+from core.models.logger import LogEvent
+from core.services.logger_service import get_logger_config
+from core.services.log_rollup import hour_start, oldest_pending_hour, rollup_hour
+from core.constants.logging import (
+    ROLLUP_LOG_EVENTS_HELP,
+    LOG_ROLLUP_HOUR_MESSAGE,
+    LOG_ROLLUP_SUMMARY_MESSAGE,
+)
+
+
+class Command(BaseCommand):
+    help = ROLLUP_LOG_EVENTS_HELP
+
+    def add_arguments(self, parser):
+        config = get_logger_config()
+        parser.add_argument(
+            '--grace-minutes', type=int, default=config['ROLLUP_GRACE_MINUTES'],
+            help='Only roll up hours that closed at least this many minutes ago',
+        )
+        parser.add_argument(
+            '--archive-dir', default=config['ROLLUP_ARCHIVE_DIR'],
+            help='Write raw rows to gzipped NDJSON under this directory before deleting them',
+        )
+        parser.add_argument(
+            '--max-hours', type=int, default=None,
+            help='Stop after this many hours (default: all closed hours)',
+        )
+
+    def handle(self, *args, **options):
+        alias = router.db_for_write(LogEvent)
+        cutoff = hour_start(timezone.now() - timedelta(minutes=options['grace_minutes']))
+
+        hours = 0
+        total = 0
+        while options['max_hours'] is None or hours < options['max_hours']:
+            hour = oldest_pending_hour(alias, cutoff)
+            if hour is None:
+                break
+            count = rollup_hour(hour, alias, archive_dir=options['archive_dir'])
+            hours += 1
+            total += count
+            self.stdout.write(LOG_ROLLUP_HOUR_MESSAGE.format(count=count, hour=hour.isoformat()))
+
+        self.stdout.write(self.style.SUCCESS(LOG_ROLLUP_SUMMARY_MESSAGE.format(count=total, hours=hours)))
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+from django.utils import timezone
+from core.services.logger_service import get_logger_config
+from core.services.log_files import read_log_files
+from core.services.log_export import log_event_to_json
+from core.constants.logging import SEARCH_LOG_FILES_HELP
+
+
+class Command(BaseCommand):
+    help = SEARCH_LOG_FILES_HELP
+
+    def add_arguments(self, parser):
+        parser.add_argument('--directory', default=get_logger_config()['JSONL_DIRECTORY'])
+        parser.add_argument('--level')
+        parser.add_argument('--category')
+        parser.add_argument('--user-id')
+        parser.add_argument('--endpoint')
+        parser.add_argument('--since', help='ISO 8601 timestamp, inclusive')
+        parser.add_argument('--until', help='ISO 8601 timestamp, exclusive')
+        parser.add_argument('--limit', type=int, default=None)
+
+    def handle(self, *args, **options):
+        filters = {
+            field: options[field]
+            for field in ('level', 'category', 'user_id', 'endpoint')
+            if options[field]
+        }
+        for bound in ('since', 'until'):
+            if options[bound]:
+                value = parse_datetime(options[bound])
+                if value is None:
+                    raise CommandError(f"Invalid --{bound} timestamp: {options[bound]}")
+                filters[bound] = value if timezone.is_aware(value) else timezone.make_aware(value)
+
+        for count, row in enumerate(read_log_files(options['directory'], filters), start=1):
+            self.stdout.write(log_event_to_json(row))
+            if options['limit'] and count >= options['limit']:
+                break
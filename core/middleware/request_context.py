@@ -0,0 +1,22 @@
+from core.services.logger_service import get_request_context, use_request_context
+from core.constants.logging import REQUEST_ID_HEADER
+
+
+class RequestContextMiddleware:
+    """
+    Computes the request's attribution fields (request id, client IP,
+    session, user, endpoint and method) once and makes them the defaults for
+    every db_logger event logged while the request is handled, including
+    those logged from model saves. The request id is echoed back in the
+    X-Request-ID response header.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        context = get_request_context(request)
+        with use_request_context(context):
+            response = self.get_response(request)
+        response[REQUEST_ID_HEADER] = context['request_id']
+        return response
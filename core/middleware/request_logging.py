@@ -0,0 +1,78 @@
+import time
+from core.models.logger import LogCategory, LogLevel
+from core.services.latency import latency_recorder
+from core.services.logger_service import (
+    LEVEL_VALUES,
+    collect_request_logs,
+    db_logger,
+    get_logger_config,
+)
+from core.constants.logging import API_REQUEST_COMPLETED, LATENCY_UNMATCHED_ROUTE
+
+
+class RequestLoggingMiddleware:
+    """
+    Writes one API_REQUEST_COMPLETED event per request, with status and
+    execution time, and feeds the per-process latency histograms keyed by
+    method and URL route. Requests that match no route share one histogram,
+    so arbitrary 404 paths cannot grow the recorder. Paths in
+    REQUEST_LOG_EXCLUDED_PATHS are skipped.
+
+    Non-error db_logger events logged while the request is handled are folded
+    into that record as an ordered `events` list, so a request costs one row
+    however much it logs; ERROR and CRITICAL events are still written on
+    their own, straight away.
+
+    The record goes through the level gate and sampler like any other API
+    event and carries the weight it was admitted with, so a sampled-out
+    record drops the DEBUG and INFO events folded into it. Only records
+    holding a WARNING event are always written. Folded events never reach
+    the coalescer one by one; repeats within a request stay in its list.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.excluded_paths = tuple(get_logger_config()['REQUEST_LOG_EXCLUDED_PATHS'])
+
+    def __call__(self, request):
+        if request.path.startswith(self.excluded_paths):
+            return self.get_response(request)
+
+        start = time.perf_counter_ns()
+        with collect_request_logs() as collector:
+            response = self.get_response(request)
+        duration_ns = time.perf_counter_ns() - start
+
+        match = getattr(request, 'resolver_match', None)
+        route = f"/{match.route}" if match and match.route else LATENCY_UNMATCHED_ROUTE
+        latency_recorder.record(f"{request.method} {route}", duration_ns)
+
+        status_code = response.status_code
+        if status_code >= 500:
+            level = LogLevel.ERROR
+        elif status_code >= 400:
+            level = LogLevel.WARNING
+        else:
+            level = LogLevel.INFO
+        if LEVEL_VALUES[collector.level] > LEVEL_VALUES[level]:
+            level = collector.level
+
+        context_data = {
+            'method': request.method,
+            'endpoint': request.path,
+            'status_code': status_code,
+        }
+        if collector.events:
+            context_data = {**collector.indexed_context(), **context_data, 'events': collector.events}
+
+        force = LEVEL_VALUES[collector.level] >= LEVEL_VALUES[LogLevel.WARNING]
+        if force or db_logger.is_enabled(level, LogCategory.API):
+            db_logger.log(
+                level,
+                LogCategory.API,
+                API_REQUEST_COMPLETED,
+                context_data=context_data,
+                execution_time_ms=duration_ns // 1_000_000,
+                force=force
+            )
+        return response
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='logevent',
+            name='sample_weight',
+            field=models.FloatField(default=1.0),
+        ),
+    ]
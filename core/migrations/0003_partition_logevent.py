@@ -0,0 +1,103 @@
+# Converts core_logevent into a table range-partitioned by month on "timestamp".
+# Only PostgreSQL is affected; other backends keep the plain table.
+
+from datetime import datetime, timezone as dt_timezone
+from django.db import migrations
+
+TABLE = 'core_logevent'
+LEGACY_TABLE = 'core_logevent_unpartitioned'
+DEFAULT_PARTITION = 'core_logevent_default'
+MONTHS_AHEAD = 3
+
+INDEXES = [
+    ('core_logeve_timesta_295f1d_idx', ['timestamp', 'level']),
+    ('core_logeve_categor_60223e_idx', ['category', 'timestamp']),
+    ('core_logeve_user_id_2f02d4_idx', ['user_id', 'timestamp']),
+    ('core_logeve_level_22f257_idx', ['level', 'timestamp']),
+]
+
+
+def _month_start(value):
+    return value.astimezone(dt_timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(month, count):
+    index = month.year * 12 + (month.month - 1) + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def _create_indexes(cursor, qn):
+    for name, columns in INDEXES:
+        cursor.execute(
+            f"CREATE INDEX {qn(name)} ON {qn(TABLE)} ({', '.join(qn(c) for c in columns)})"
+        )
+
+
+def partition_logevent(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {qn(TABLE)} RENAME TO {qn(LEGACY_TABLE)}")
+        cursor.execute(
+            f"CREATE TABLE {qn(TABLE)} (LIKE {qn(LEGACY_TABLE)} INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE (\"timestamp\")"
+        )
+        cursor.execute(f"CREATE TABLE {qn(DEFAULT_PARTITION)} PARTITION OF {qn(TABLE)} DEFAULT")
+
+        cursor.execute(f"SELECT MIN(\"timestamp\") FROM {qn(LEGACY_TABLE)}")
+        oldest = cursor.fetchone()[0]
+        current = _month_start(datetime.now(dt_timezone.utc))
+        month = _month_start(oldest) if oldest else current
+        last = _add_months(current, MONTHS_AHEAD)
+        while month <= last:
+            cursor.execute(
+                f"CREATE TABLE {qn(f'{TABLE}_p{month.year:04d}{month.month:02d}')} "
+                f"PARTITION OF {qn(TABLE)} FOR VALUES FROM (%s) TO (%s)",
+                [month, _add_months(month, 1)],
+            )
+            month = _add_months(month, 1)
+
+        cursor.execute(f"INSERT INTO {qn(TABLE)} SELECT * FROM {qn(LEGACY_TABLE)}")
+        cursor.execute(f"DROP TABLE {qn(LEGACY_TABLE)}")
+
+        # The partition key has to be part of the primary key.
+        cursor.execute(
+            f"ALTER TABLE {qn(TABLE)} ADD CONSTRAINT {qn(TABLE + '_pkey')} "
+            f"PRIMARY KEY (\"id\", \"timestamp\")"
+        )
+        _create_indexes(cursor, qn)
+
+
+def unpartition_logevent(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(f"CREATE TABLE {qn(LEGACY_TABLE)} (LIKE {qn(TABLE)} INCLUDING DEFAULTS)")
+        cursor.execute(f"INSERT INTO {qn(LEGACY_TABLE)} SELECT * FROM {qn(TABLE)}")
+        cursor.execute(f"DROP TABLE {qn(TABLE)} CASCADE")
+        cursor.execute(f"ALTER TABLE {qn(LEGACY_TABLE)} RENAME TO {qn(TABLE)}")
+        cursor.execute(
+            f"ALTER TABLE {qn(TABLE)} ADD CONSTRAINT {qn(TABLE + '_pkey')} PRIMARY KEY (\"id\")"
+        )
+        _create_indexes(cursor, qn)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_logevent_sample_weight'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            partition_logevent,
+            unpartition_logevent,
+            hints={'model_name': 'logevent'},
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_partition_logevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LogEventRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.DateTimeField()),
+                ('category', models.CharField(choices=[('USER', 'User'), ('INVOICE', 'Invoice'), ('PAYMENT', 'Payment'), ('TRANSACTION', 'Transaction'), ('DATABASE', 'Database'), ('API', 'API'), ('HEALTH', 'Health'), ('SYSTEM', 'System'), ('ERROR', 'Error')], max_length=20)),
+                ('level', models.CharField(choices=[('DEBUG', 'Debug'), ('INFO', 'Info'), ('WARNING', 'Warning'), ('ERROR', 'Error'), ('CRITICAL', 'Critical')], max_length=10)),
+                ('endpoint', models.CharField(blank=True, default='', max_length=255)),
+                ('row_count', models.IntegerField(default=0)),
+                ('event_count', models.FloatField(default=0)),
+                ('error_count', models.FloatField(default=0)),
+                ('timed_count', models.IntegerField(default=0)),
+                ('execution_time_sum_ms', models.BigIntegerField(default=0)),
+                ('execution_time_max_ms', models.IntegerField(blank=True, null=True)),
+                ('execution_time_sketch', models.JSONField(blank=True, default=dict)),
+            ],
+            options={
+                'ordering': ['-bucket'],
+                'indexes': [models.Index(fields=['category', 'bucket'], name='core_logeve_categor_eed8f9_idx'), models.Index(fields=['endpoint', 'bucket'], name='core_logeve_endpoin_f5aa64_idx')],
+                'constraints': [models.UniqueConstraint(fields=('bucket', 'category', 'level', 'endpoint'), name='unique_log_event_rollup')],
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_logeventrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LogMessageTemplate',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('template', models.TextField(unique=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='logevent',
+            name='template',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='log_events', to='core.logmessagetemplate'),
+        ),
+        # Nullable while both representations coexist, so the columns can be
+        # dropped and re-added without a table-wide default.
+        migrations.AlterField(
+            model_name='logevent',
+            name='message_template',
+            field=models.TextField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='logevent',
+            name='formatted_message',
+            field=models.TextField(null=True),
+        ),
+    ]
@@ -0,0 +1,43 @@
+from django.db import migrations
+
+
+def intern_templates(apps, schema_editor):
+    LogEvent = apps.get_model('core', 'LogEvent')
+    LogMessageTemplate = apps.get_model('core', 'LogMessageTemplate')
+    alias = schema_editor.connection.alias
+
+    texts = (
+        LogEvent.objects.using(alias)
+        .filter(template__isnull=True)
+        .order_by()
+        .values_list('message_template', flat=True)
+        .distinct()
+    )
+    for text in list(texts):
+        template, _ = LogMessageTemplate.objects.using(alias).get_or_create(template=text)
+        LogEvent.objects.using(alias).filter(template__isnull=True, message_template=text).update(template=template)
+
+
+def restore_templates(apps, schema_editor):
+    LogEvent = apps.get_model('core', 'LogEvent')
+    alias = schema_editor.connection.alias
+
+    events = LogEvent.objects.using(alias).select_related('template').only('id', 'context_data', 'template__template')
+    for event in events.iterator(chunk_size=2000):
+        text = event.template.template
+        try:
+            formatted = text.format(**(event.context_data or {}))
+        except Exception as e:
+            formatted = f"{text} (formatting error: {e})"
+        LogEvent.objects.using(alias).filter(pk=event.pk).update(message_template=text, formatted_message=formatted)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_logmessagetemplate'),
+    ]
+
+    operations = [
+        migrations.RunPython(intern_templates, restore_templates, hints={'model_name': 'logevent'}),
+    ]
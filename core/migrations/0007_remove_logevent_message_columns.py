@@ -0,0 +1,25 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_intern_logevent_templates'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='logevent',
+            name='formatted_message',
+        ),
+        migrations.RemoveField(
+            model_name='logevent',
+            name='message_template',
+        ),
+        migrations.AlterField(
+            model_name='logevent',
+            name='template',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='log_events', to='core.logmessagetemplate'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_remove_logevent_message_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='logevent',
+            name='last_seen',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logevent',
+            name='repeat_count',
+            field=models.IntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# PostgreSQL indexes for searching LogEvent: a GIN index serving
+# `context_data @> {...}` containment and a BRIN index on the
+# append-ordered "timestamp" column. Both are created on the partitioned
+# parent, so every partition (current and future) gets its own copy.
+# SQLite gets generated columns instead, see core.services.log_indexes.
+
+from django.db import migrations
+
+TABLE = 'core_logevent'
+GIN_INDEX = 'core_logevent_context_gin'
+BRIN_INDEX = 'core_logevent_timestamp_brin'
+
+
+def create_indexes(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {qn(GIN_INDEX)} ON {qn(TABLE)} "
+            f"USING gin (\"context_data\" jsonb_path_ops)"
+        )
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {qn(BRIN_INDEX)} ON {qn(TABLE)} USING brin (\"timestamp\")"
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP INDEX IF EXISTS {qn(GIN_INDEX)}")
+        cursor.execute(f"DROP INDEX IF EXISTS {qn(BRIN_INDEX)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_logevent_repeat_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_indexes,
+            drop_indexes,
+            hints={'model_name': 'logevent'},
+        ),
+    ]
@@ -0,0 +1,37 @@
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_logevent_context_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ErrorGroup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(max_length=64, unique=True)),
+                ('error_type', models.CharField(blank=True, max_length=255, null=True)),
+                ('stack_trace', models.TextField()),
+                ('occurrence_count', models.BigIntegerField(default=0)),
+                ('first_seen', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_seen', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['-occurrence_count'],
+                'indexes': [
+                    models.Index(fields=['-occurrence_count'], name='core_errorg_occurre_5e280b_idx'),
+                    models.Index(fields=['-last_seen'], name='core_errorg_last_se_b72cd1_idx'),
+                ],
+            },
+        ),
+        migrations.AddField(
+            model_name='logevent',
+            name='error_group',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='log_events', to='core.errorgroup'),
+        ),
+    ]
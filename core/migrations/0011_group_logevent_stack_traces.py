@@ -0,0 +1,93 @@
+import hashlib
+import re
+from pathlib import Path
+from django.db import migrations
+from django.db.models import Count, Max, Min
+
+# A frozen copy of the fingerprinting in core.services.error_groups at the time
+# of this migration, so later changes there do not change what it computes.
+FRAME_PATTERN = re.compile(r'^\s*File "(?P<path>[^"]+)", line \d+, in (?P<function>.+)$')
+EXCEPTION_PATTERN = re.compile(r'^(?P<type>[A-Za-z_][\w.]*)(:|$)')
+PACKAGE_MARKERS = ('site-packages/', 'dist-packages/')
+# The project root, i.e. settings.BASE_DIR.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+def _frame_path(path):
+    for marker in PACKAGE_MARKERS:
+        if marker in path:
+            return path.rsplit(marker, 1)[1]
+    base_dir = f"{BASE_DIR}/"
+    return path[len(base_dir):] if path.startswith(base_dir) else path
+
+
+def fingerprint_stack_trace(stack_trace, error_type=None):
+    lines = []
+    for line in stack_trace.splitlines():
+        frame = FRAME_PATTERN.match(line)
+        if frame:
+            lines.append(f"{_frame_path(frame['path'])}:{frame['function']}")
+            continue
+        if line.startswith('Traceback ') or line.startswith(' '):
+            continue
+        exception = EXCEPTION_PATTERN.match(line)
+        if exception:
+            lines.append(exception['type'])
+    normalized = f"{error_type or ''}\n" + '\n'.join(lines)
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def group_stack_traces(apps, schema_editor):
+    LogEvent = apps.get_model('core', 'LogEvent')
+    ErrorGroup = apps.get_model('core', 'ErrorGroup')
+    alias = schema_editor.connection.alias
+
+    traces = (
+        LogEvent.objects.using(alias)
+        .filter(stack_trace__isnull=False, error_group__isnull=True)
+        .exclude(stack_trace='')
+        .order_by()
+        .values('stack_trace', 'error_type')
+        .annotate(count=Count('id'), first_seen=Min('timestamp'), last_seen=Max('timestamp'))
+    )
+    for trace in list(traces):
+        group, created = ErrorGroup.objects.using(alias).get_or_create(
+            fingerprint=fingerprint_stack_trace(trace['stack_trace'], trace['error_type']),
+            defaults={
+                'error_type': trace['error_type'],
+                'stack_trace': trace['stack_trace'],
+                'occurrence_count': trace['count'],
+                'first_seen': trace['first_seen'],
+                'last_seen': trace['last_seen'],
+            },
+        )
+        if not created:
+            group.occurrence_count += trace['count']
+            group.first_seen = min(group.first_seen, trace['first_seen'])
+            group.last_seen = max(group.last_seen, trace['last_seen'])
+            group.save(update_fields=['occurrence_count', 'first_seen', 'last_seen'])
+        LogEvent.objects.using(alias).filter(
+            stack_trace=trace['stack_trace'], error_type=trace['error_type'], error_group__isnull=True,
+        ).update(error_group=group)
+
+
+def restore_stack_traces(apps, schema_editor):
+    # Events get their group's first trace back, not necessarily their own.
+    LogEvent = apps.get_model('core', 'LogEvent')
+    ErrorGroup = apps.get_model('core', 'ErrorGroup')
+    alias = schema_editor.connection.alias
+
+    for group in ErrorGroup.objects.using(alias).iterator():
+        LogEvent.objects.using(alias).filter(error_group=group).update(stack_trace=group.stack_trace, error_group=None)
+    ErrorGroup.objects.using(alias).all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_errorgroup'),
+    ]
+
+    operations = [
+        migrations.RunPython(group_stack_traces, restore_stack_traces, hints={'model_name': 'logevent'}),
+    ]
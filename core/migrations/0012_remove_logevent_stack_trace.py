@@ -0,0 +1,15 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_group_logevent_stack_traces'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='logevent',
+            name='stack_trace',
+        ),
+    ]
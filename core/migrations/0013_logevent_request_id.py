@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_remove_logevent_stack_trace'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='logevent',
+            name='request_id',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='logevent',
+            index=models.Index(fields=['request_id', 'timestamp'], name='core_logeve_request_9ff00d_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:15
+
+import re
+from django.db import migrations, models
+
+INVOICE_NUMBER_RE = re.compile(r'^INV-(\d{4})(\d{2})-(\d+)$')
+
+
+def seed_sequences(apps, schema_editor):
+    # Continue each month after the highest number already issued in it.
+    Invoice = apps.get_model('core', 'Invoice')
+    InvoiceNumberSequence = apps.get_model('core', 'InvoiceNumberSequence')
+    alias = schema_editor.connection.alias
+
+    last_values = {}
+    for number in Invoice.objects.using(alias).values_list('number', flat=True).iterator(chunk_size=2000):
+        match = INVOICE_NUMBER_RE.match(number or '')
+        if match:
+            key = (int(match.group(1)), int(match.group(2)))
+            last_values[key] = max(last_values.get(key, 0), int(match.group(3)))
+    InvoiceNumberSequence.objects.using(alias).bulk_create([
+        InvoiceNumberSequence(year=year, month=month, last_value=last_value)
+        for (year, month), last_value in last_values.items()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_logevent_request_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InvoiceNumberSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('last_value', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('year', 'month'), name='invoice_number_sequence_month_uniq')],
+            },
+        ),
+        migrations.RunPython(seed_sequences, migrations.RunPython.noop, hints={'model_name': 'invoicenumbersequence'}),
+    ]
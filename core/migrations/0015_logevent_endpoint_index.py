@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_invoicenumbersequence'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='logevent',
+            index=models.Index(fields=['endpoint', 'timestamp'], name='core_logeve_endpoin_6cf2f1_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_logevent_endpoint_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='logevent',
+            name='category',
+            field=models.CharField(choices=[('USER', 'User'), ('INVOICE', 'Invoice'), ('PAYMENT', 'Payment'), ('TRANSACTION', 'Transaction'), ('DATABASE', 'Database'), ('API', 'API'), ('HEALTH', 'Health'), ('SYSTEM', 'System'), ('ERROR', 'Error'), ('CLIENT', 'Client')], max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='logeventrollup',
+            name='category',
+            field=models.CharField(choices=[('USER', 'User'), ('INVOICE', 'Invoice'), ('PAYMENT', 'Payment'), ('TRANSACTION', 'Transaction'), ('DATABASE', 'Database'), ('API', 'API'), ('HEALTH', 'Health'), ('SYSTEM', 'System'), ('ERROR', 'Error'), ('CLIENT', 'Client')], max_length=20),
+        ),
+    ]
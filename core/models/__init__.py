@@ -1,6 +1,6 @@
 from .user import BusinessOwner, Customer
-from .invoices import Invoice
+from .invoices import Invoice, InvoiceNumberSequence
 from .payments import StripePayment
-from .logger import LogEvent, LogLevel, LogCategory
+from .logger import ErrorGroup, LogEvent, LogEventRollup, LogMessageTemplate, LogLevel, LogCategory
 
-__all__ = ['BusinessOwner', 'Customer', 'Invoice', 'StripePayment', 'LogEvent', 'LogLevel', 'LogCategory']
\ No newline at end of file
+__all__ = ['BusinessOwner', 'Customer', 'Invoice', 'InvoiceNumberSequence', 'StripePayment', 'ErrorGroup', 'LogEvent', 'LogEventRollup', 'LogMessageTemplate', 'LogLevel', 'LogCategory']
\ No newline at end of file
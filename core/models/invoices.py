@@ -1,5 +1,5 @@
 import uuid
-from django.db import models
+from django.db import models, transaction
 from core.constants.db import (
     INVOICE_RELATED_NAME,
     DEFAULT_CURRENCY,
@@ -11,19 +11,35 @@ from core.constants.db import (
 from core.constants.api import (
     PAYMENT_STATUS_HELP_TEXT,
     ORDERING_NEWEST_FIRST,
-    INVOICE_NUMBER_FORMAT,
 )
 from core.constants.logging import (
     INVOICE_CREATED,
     INVOICE_UPDATED,
     INVOICE_DELETED,
     INVOICE_NUMBER_GENERATED,
-    INVOICE_STATUS_CHANGED
+    INVOICE_STATUS_CHANGED,
+    INVOICES_BULK_CREATED,
 )
+from core.models.mixins import DirtyFieldsMixin
 from core.models.user import BusinessOwner, Customer
 
 
-class Invoice(models.Model):
+class InvoiceNumberSequence(models.Model):
+    """Last invoice number handed out for one calendar month."""
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    last_value = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['year', 'month'], name='invoice_number_sequence_month_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.year}-{self.month:02d}: {self.last_value}"
+
+
+class Invoice(DirtyFieldsMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     owner = models.ForeignKey(
         BusinessOwner, on_delete=models.CASCADE, related_name=INVOICE_RELATED_NAME
@@ -66,13 +82,8 @@ class Invoice(models.Model):
         return self.amount_paid > 0 and self.amount_paid < self.total_amount
 
     def save(self, *args, **kwargs):
-        is_new = self.pk is None
-        old_status = None
-        if not is_new and self.pk:
-            try:
-                old_status = Invoice.objects.get(pk=self.pk).status
-            except Invoice.DoesNotExist:
-                pass
+        is_new = self._state.adding
+        old_status = self.get_dirty_fields().get('status')
 
         if not self.number:
             self.number = self.generate_invoice_number()
@@ -87,6 +98,26 @@ class Invoice(models.Model):
             if old_status and old_status != self.status:
                 self._log_status_changed(old_status)
 
+    @classmethod
+    def create_batch(cls, invoices):
+        """
+        Number and insert unsaved invoices in one transaction, with one
+        number reservation per issue month and a single bulk insert.
+
+        The batch is audited by one aggregated log event instead of the
+        per-invoice events `save()` writes.
+        """
+        from core.services.invoice_numbers import assign_invoice_numbers
+
+        with transaction.atomic():
+            assign_invoice_numbers(invoices)
+            created = cls.objects.bulk_create(invoices)
+        for invoice in created:
+            invoice._take_snapshot()
+        if created:
+            cls._log_invoices_bulk_created(created)
+        return created
+
     def delete(self, *args, **kwargs):
         invoice_id = str(self.id)
         super().delete(*args, **kwargs)
@@ -130,6 +161,22 @@ class Invoice(models.Model):
             }
         )
 
+    @staticmethod
+    def _log_invoices_bulk_created(invoices):
+        from core.services.logger_service import db_logger
+        from core.models.logger import LogCategory
+
+        db_logger.info(
+            category=LogCategory.INVOICE,
+            message_template=INVOICES_BULK_CREATED,
+            context_data={
+                'invoice_count': len(invoices),
+                'first_number': invoices[0].number,
+                'last_number': invoices[-1].number,
+                'invoice_ids': [str(invoice.id) for invoice in invoices]
+            }
+        )
+
     def _log_status_changed(self, old_status):
         from core.services.logger_service import db_logger
         from core.models.logger import LogCategory
@@ -145,12 +192,6 @@ class Invoice(models.Model):
         )
 
     def generate_invoice_number(self):
-        year = self.issued_at.year
-        month = self.issued_at.month
-
-        count = Invoice.objects.filter(
-            issued_at__year=year,
-            issued_at__month=month
-        ).count() + 1
+        from core.services.invoice_numbers import reserve_invoice_numbers
 
-        return INVOICE_NUMBER_FORMAT.format(year=year, month=month, count=count)
+        return reserve_invoice_numbers(self.issued_at.year, self.issued_at.month)[0]
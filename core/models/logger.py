@@ -1,7 +1,9 @@
 import uuid
-from django.db import models
+from django.db import connections, models, router
+from django.db.models.expressions import RawSQL
 from django.contrib.auth.models import User
 from django.utils import timezone
+from core.constants.logging import LOG_CONTEXT_INDEXED_KEYS, LOG_CONTEXT_COLUMN
 
 
 class LogLevel(models.TextChoices):
@@ -22,6 +24,65 @@ class LogCategory(models.TextChoices):
     HEALTH = 'HEALTH', 'Health'
     SYSTEM = 'SYSTEM', 'System'
     ERROR = 'ERROR', 'Error'
+    # Events reported by the frontend through the unauthenticated client-events endpoint
+    CLIENT = 'CLIENT', 'Client'
+
+
+class LogMessageTemplate(models.Model):
+    id = models.AutoField(primary_key=True)
+    template = models.TextField(unique=True)
+
+    def __str__(self):
+        return self.template
+
+
+class ErrorGroup(models.Model):
+    # sha256 of the error type and the normalized frames of its stack trace
+    fingerprint = models.CharField(max_length=64, unique=True)
+    error_type = models.CharField(max_length=255, blank=True, null=True)
+    # Trace of the first occurrence; later ones only bump the counters
+    stack_trace = models.TextField()
+
+    occurrence_count = models.BigIntegerField(default=0)
+    first_seen = models.DateTimeField(default=timezone.now)
+    last_seen = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-occurrence_count']
+        indexes = [
+            models.Index(fields=['-occurrence_count']),
+            models.Index(fields=['-last_seen']),
+        ]
+
+    def __str__(self):
+        return f"{self.error_type or 'Error'} ({self.fingerprint[:12]}): {self.occurrence_count}"
+
+
+class LogEventQuerySet(models.QuerySet):
+
+    def with_context(self, **values):
+        """
+        Filter on top-level context_data keys equal to the given scalars.
+
+        On PostgreSQL all pairs become one `context_data @> {...}` test served
+        by the GIN index. On SQLite each key in LOG_CONTEXT_INDEXED_KEYS is
+        compared against its indexed generated column; other keys fall back to
+        an unindexed JSON lookup.
+        """
+        connection = connections[self.db]
+        if connection.vendor == 'postgresql':
+            return self.filter(context_data__contains=values)
+
+        queryset = self
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        for key, value in values.items():
+            if connection.vendor == 'sqlite' and key in LOG_CONTEXT_INDEXED_KEYS:
+                column = LOG_CONTEXT_COLUMN.format(key=key)
+                expression = RawSQL(f"{table}.{connection.ops.quote_name(column)}", (), output_field=models.Field())
+                queryset = queryset.alias(**{column: expression}).filter(**{column: value})
+            else:
+                queryset = queryset.filter(**{f'context_data__{key}': value})
+        return queryset
 
 
 class LogEvent(models.Model):
@@ -29,8 +90,7 @@ class LogEvent(models.Model):
     timestamp = models.DateTimeField(default=timezone.now)
     level = models.CharField(max_length=10, choices=LogLevel.choices)
     category = models.CharField(max_length=20, choices=LogCategory.choices)
-    message_template = models.TextField()
-    formatted_message = models.TextField()
+    template = models.ForeignKey(LogMessageTemplate, on_delete=models.PROTECT, related_name='log_events')
     context_data = models.JSONField(default=dict, blank=True)
 
     # Optional fields for tracking
@@ -39,13 +99,26 @@ class LogEvent(models.Model):
     ip_address = models.GenericIPAddressField(blank=True, null=True)
     endpoint = models.CharField(max_length=255, blank=True, null=True)
     request_method = models.CharField(max_length=10, blank=True, null=True)
+    # X-Request-ID of the request that logged the event, shared by all of its events
+    request_id = models.CharField(max_length=64, blank=True, null=True)
 
     # Performance tracking
     execution_time_ms = models.IntegerField(blank=True, null=True)
 
+    # Number of real events this row stands for after sampling / rate limiting
+    sample_weight = models.FloatField(default=1.0)
+
+    # Identical events folded into this row; `last_seen` is set once there were repeats
+    repeat_count = models.IntegerField(default=1)
+    last_seen = models.DateTimeField(blank=True, null=True)
+
     # Error tracking
     error_type = models.CharField(max_length=255, blank=True, null=True)
-    stack_trace = models.TextField(blank=True, null=True)
+    error_group = models.ForeignKey(
+        ErrorGroup, on_delete=models.PROTECT, related_name='log_events', blank=True, null=True
+    )
+
+    objects = LogEventQuerySet.as_manager()
 
     class Meta:
         ordering = ['-timestamp']
@@ -53,8 +126,97 @@ class LogEvent(models.Model):
             models.Index(fields=['timestamp', 'level']),
             models.Index(fields=['category', 'timestamp']),
             models.Index(fields=['user_id', 'timestamp']),
+            models.Index(fields=['endpoint', 'timestamp']),
             models.Index(fields=['level', 'timestamp']),
+            models.Index(fields=['request_id', 'timestamp']),
+        ]
+
+    # Template text set on an unsaved event; resolved to `template` when written
+    _message_template = None
+    # Stack trace set on an unsaved event; resolved to `error_group` when written
+    _stack_trace = None
+
+    def __str__(self):
+        return f"{self.timestamp.strftime('%Y-%m-%d %H:%M:%S')} [{self.level}] {self.category}: {self.formatted_message[:100]}"
+
+    @property
+    def message_template(self):
+        if self._message_template is None and self.template_id is not None:
+            from core.services.log_templates import template_cache
+            self._message_template = template_cache.text(self.template_id, self._state.db)
+        return self._message_template
+
+    @message_template.setter
+    def message_template(self, value):
+        self._message_template = value
+        self.template_id = None
+
+    @property
+    def stack_trace(self):
+        if self._stack_trace is None and self.error_group_id is not None:
+            self._stack_trace = self.error_group.stack_trace
+        return self._stack_trace
+
+    @stack_trace.setter
+    def stack_trace(self, value):
+        self._stack_trace = value
+        self.error_group_id = None
+
+    @property
+    def formatted_message(self):
+        template = self.message_template or ''
+        try:
+            return template.format(**(self.context_data or {}))
+        except Exception as e:
+            return f"{template} (formatting error: {e})"
+
+    def resolve_template(self, using=None):
+        if self.template_id is None and self._message_template is not None:
+            from core.services.log_templates import template_cache
+            using = using or router.db_for_write(LogEvent, instance=self)
+            self.template_id = template_cache.resolve(self._message_template, using)
+
+    def resolve_error_group(self, using=None):
+        if self.error_group_id is None and self._stack_trace:
+            from core.services.error_groups import record_error_groups
+            record_error_groups([self], using or router.db_for_write(LogEvent, instance=self))
+
+    def save(self, *args, **kwargs):
+        self.resolve_template(kwargs.get('using'))
+        self.resolve_error_group(kwargs.get('using'))
+        super().save(*args, **kwargs)
+
+
+class LogEventRollup(models.Model):
+    # Start of the hour (UTC) this row summarises
+    bucket = models.DateTimeField()
+    category = models.CharField(max_length=20, choices=LogCategory.choices)
+    level = models.CharField(max_length=10, choices=LogLevel.choices)
+    endpoint = models.CharField(max_length=255, blank=True, default='')
+
+    # Raw rows folded in, and the real events they stand for after sampling
+    row_count = models.IntegerField(default=0)
+    event_count = models.FloatField(default=0)
+    error_count = models.FloatField(default=0)
+
+    # execution_time_ms aggregates over the rows that carried a timing
+    timed_count = models.IntegerField(default=0)
+    execution_time_sum_ms = models.BigIntegerField(default=0)
+    execution_time_max_ms = models.IntegerField(blank=True, null=True)
+    execution_time_sketch = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        ordering = ['-bucket']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['bucket', 'category', 'level', 'endpoint'],
+                name='unique_log_event_rollup',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['category', 'bucket']),
+            models.Index(fields=['endpoint', 'bucket']),
         ]
 
     def __str__(self):
-        return f"{self.timestamp.strftime('%Y-%m-%d %H:%M:%S')} [{self.level}] {self.category}: {self.formatted_message[:100]}"
\ No newline at end of file
+        return f"{self.bucket.strftime('%Y-%m-%d %H:00')} [{self.level}] {self.category} {self.endpoint}: {self.event_count:g}"
@@ -0,0 +1,81 @@
+import copy
+from typing import Any, Dict
+from django.db import models
+
+
+class DirtyFieldsMixin(models.Model):
+    """
+    Remembers the field values an instance was loaded or last saved with.
+
+    `save()` on an existing row writes only the fields that changed since
+    (plus `auto_now` fields), and skips the query altogether when none did.
+    `get_dirty_fields()` gives the previous value of every changed field,
+    so subclasses can react to a change without re-reading the row.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._take_snapshot(field_names)
+        return instance
+
+    def _take_snapshot(self, attnames=None):
+        if attnames is None:
+            attnames = [field.attname for field in self._meta.concrete_fields]
+        snapshot = getattr(self, '_loaded_values', {})
+        for attname in attnames:
+            if attname in self.__dict__:
+                # Copy JSON values so in-place edits still register as changes.
+                snapshot[attname] = copy.deepcopy(self.__dict__[attname])
+        self._loaded_values = snapshot
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        self._take_snapshot([self._meta.get_field(name).attname for name in fields] if fields else None)
+
+    def get_dirty_fields(self) -> Dict[str, Any]:
+        """
+        Previous values of the fields changed since the last load or save, keyed
+        by field name. A field that was deferred at load and then assigned counts
+        as changed, with a previous value of None since it was never read.
+        """
+        loaded = getattr(self, '_loaded_values', None)
+        if self._state.adding or loaded is None:
+            return {}
+        dirty = {}
+        for field in self._meta.concrete_fields:
+            if field.attname not in self.__dict__:
+                continue
+            if field.attname not in loaded:
+                dirty[field.name] = None
+            elif self.__dict__[field.attname] != loaded[field.attname]:
+                dirty[field.name] = loaded[field.attname]
+        return dirty
+
+    def save(self, *args, **kwargs):
+        tracked = (
+            not self._state.adding
+            and hasattr(self, '_loaded_values')
+            and kwargs.get('update_fields') is None
+            and not kwargs.get('force_insert')
+        )
+        if tracked:
+            dirty = self.get_dirty_fields()
+            if not dirty:
+                return
+            auto_now = [
+                field.name for field in self._meta.concrete_fields
+                if getattr(field, 'auto_now', False)
+            ]
+            kwargs['update_fields'] = list(dict.fromkeys([*dirty, *auto_now]))
+
+        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            self._take_snapshot()
+        else:
+            self._take_snapshot([self._meta.get_field(name).attname for name in update_fields])
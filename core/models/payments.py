@@ -14,9 +14,10 @@ from core.constants.api import (
     STRIPE_PAYMENT_INTENT_FAILED_ERROR_KEYS,
 )
 from core.models.invoices import Invoice
+from core.models.mixins import DirtyFieldsMixin
 
 
-class StripePayment(models.Model):
+class StripePayment(DirtyFieldsMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     stripe_payment_intent_id = models.CharField(max_length=255, unique=True)
     stripe_payment_method_id = models.CharField(max_length=255, blank=True)
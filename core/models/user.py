@@ -1,9 +1,10 @@
 import uuid
 from django.db import models
+from core.models.mixins import DirtyFieldsMixin
 from core.constants.logging import USER_CREATED, USER_UPDATED, USER_DELETED
 
 
-class BusinessOwner(models.Model):
+class BusinessOwner(DirtyFieldsMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     company_name = models.CharField(max_length=255)
 
@@ -11,7 +12,7 @@ class BusinessOwner(models.Model):
         return self.company_name
 
     def save(self, *args, **kwargs):
-        is_new = self.pk is None
+        is_new = self._state.adding
         super().save(*args, **kwargs)
 
         if is_new:
@@ -49,7 +50,7 @@ class BusinessOwner(models.Model):
         )
 
 
-class Customer(models.Model):
+class Customer(DirtyFieldsMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=255)
     email = models.EmailField(max_length=255)
@@ -58,7 +59,7 @@ class Customer(models.Model):
         return self.name
 
     def save(self, *args, **kwargs):
-        is_new = self.pk is None
+        is_new = self._state.adding
         super().save(*args, **kwargs)
 
         if is_new:
@@ -1,7 +1,9 @@
 from datetime import datetime
 from datetime import timezone as dt_timezone
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
 from core.models.invoices import Invoice
+from core.models.user import BusinessOwner, Customer
 from core.constants.db import (
     ID_FIELD_NAME,
     ISSUED_AT_FIELD_NAME,
@@ -30,16 +32,78 @@ from core.constants.api import (
     INVOICE_OWNER_REQUIRED_MESSAGE,
     INVOICE_CUSTOMER_REQUIRED_MESSAGE,
     INVOICE_NUMBER_SERIALIZER_FIELD,
+    PREFETCHED_RELATIONS_CONTEXT_KEY,
 )
 
 
+def _in_bulk(model, values):
+    pks = set()
+    for value in values:
+        try:
+            pk = model._meta.pk.to_python(value)
+        except DjangoValidationError:
+            continue
+        if pk is not None:
+            pks.add(pk)
+    return model.objects.in_bulk(pks) if pks else {}
+
+
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Resolves ids against the objects prefetched into the serializer context
+    under PREFETCHED_RELATIONS_CONTEXT_KEY, and queries per value otherwise.
+    """
+
+    def to_internal_value(self, data):
+        prefetched = self.context.get(PREFETCHED_RELATIONS_CONTEXT_KEY, {}).get(self.queryset.model)
+        if prefetched is None:
+            return super().to_internal_value(data)
+        try:
+            pk = self.queryset.model._meta.pk.to_python(data)
+        except DjangoValidationError:
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        if pk not in prefetched:
+            self.fail('does_not_exist', pk_value=data)
+        return prefetched[pk]
+
+
+class InvoiceListSerializer(serializers.ListSerializer):
+    """
+    A batch of invoices, validated item by item and created together.
+
+    The owners and customers the batch refers to are loaded with one query
+    each before validation, and the valid batch is written by
+    `Invoice.create_batch`.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            items = [item for item in data if isinstance(item, dict)]
+            self._context[PREFETCHED_RELATIONS_CONTEXT_KEY] = {
+                BusinessOwner: _in_bulk(BusinessOwner, [item.get(OWNER_FIELD_NAME) for item in items]),
+                Customer: _in_bulk(Customer, [item.get(CUSTOMER_FIELD_NAME) for item in items]),
+            }
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        issued_at = datetime.now(dt_timezone.utc)
+        invoices = [
+            Invoice(**{**attrs, ISSUED_AT_FIELD_NAME: issued_at})
+            for attrs in validated_data
+        ]
+        return Invoice.create_batch(invoices)
+
+
 class InvoiceSerializer(serializers.ModelSerializer):
+    serializer_related_field = PrefetchedPrimaryKeyRelatedField
+
     owner_name = serializers.CharField(source=OWNER_COMPANY_NAME_SOURCE, read_only=True)
     customer_name = serializers.CharField(source=CUSTOMER_NAME_SOURCE, read_only=True)
     invoice_number = serializers.CharField(source=NUMBER_FIELD_NAME, read_only=True)
     
     class Meta:
         model = Invoice
+        list_serializer_class = InvoiceListSerializer
         fields = [
             ID_FIELD_NAME,
             OWNER_FIELD_NAME,
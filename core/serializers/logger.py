@@ -0,0 +1,134 @@
+import json
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework import serializers
+from core.models.logger import ErrorGroup, LogEvent, LogLevel, LogCategory
+from core.services.logger_service import get_logger_config
+from core.constants.api import (
+    LOG_EVENTS_DEFAULT_PAGE_SIZE,
+    ERROR_GROUPS_DEFAULT_LIMIT,
+    LOG_EXPORT_RANGE_INVALID_MESSAGE,
+    CLIENT_EVENT_CONTEXT_TOO_LARGE_MESSAGE,
+)
+from core.constants.logging import (
+    LOG_ANALYTICS_WINDOWS,
+    LOG_ANALYTICS_WINDOW_DAY,
+    LOG_ANALYTICS_INTERVALS,
+    CLIENT_EVENT_REPORTED,
+)
+
+
+class LogEventSerializer(serializers.ModelSerializer):
+    message_template = serializers.CharField(read_only=True)
+    formatted_message = serializers.CharField(read_only=True)
+    stack_trace = serializers.CharField(read_only=True)
+
+    class Meta:
+        model = LogEvent
+        fields = [
+            'id',
+            'timestamp',
+            'level',
+            'category',
+            'message_template',
+            'formatted_message',
+            'context_data',
+            'user_id',
+            'session_id',
+            'ip_address',
+            'endpoint',
+            'request_method',
+            'request_id',
+            'execution_time_ms',
+            'sample_weight',
+            'repeat_count',
+            'last_seen',
+            'error_type',
+            'error_group',
+            'stack_trace',
+        ]
+        read_only_fields = fields
+
+
+class LogEventQuerySerializer(serializers.Serializer):
+    level = serializers.ChoiceField(choices=LogLevel.choices, required=False)
+    category = serializers.ChoiceField(choices=LogCategory.choices, required=False)
+    user_id = serializers.CharField(max_length=255, required=False)
+    endpoint = serializers.CharField(max_length=255, required=False)
+    request_id = serializers.CharField(max_length=64, required=False)
+    since = serializers.DateTimeField(required=False)
+    until = serializers.DateTimeField(required=False)
+    cursor = serializers.CharField(required=False)
+    page_size = serializers.IntegerField(min_value=1, required=False, default=LOG_EVENTS_DEFAULT_PAGE_SIZE)
+
+
+class ErrorGroupSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ErrorGroup
+        fields = [
+            'id',
+            'fingerprint',
+            'error_type',
+            'stack_trace',
+            'occurrence_count',
+            'first_seen',
+            'last_seen',
+        ]
+        read_only_fields = fields
+
+
+class ErrorGroupQuerySerializer(serializers.Serializer):
+    error_type = serializers.CharField(max_length=255, required=False)
+    since = serializers.DateTimeField(required=False)
+    limit = serializers.IntegerField(min_value=1, required=False, default=ERROR_GROUPS_DEFAULT_LIMIT)
+
+
+class LogAnalyticsQuerySerializer(serializers.Serializer):
+    window = serializers.ChoiceField(choices=LOG_ANALYTICS_WINDOWS, required=False, default=LOG_ANALYTICS_WINDOW_DAY)
+    interval = serializers.ChoiceField(choices=LOG_ANALYTICS_INTERVALS, required=False)
+    category = serializers.ChoiceField(choices=LogCategory.choices, required=False)
+    endpoint = serializers.CharField(max_length=255, required=False)
+
+
+class LogExportQuerySerializer(serializers.Serializer):
+    level = serializers.ChoiceField(choices=LogLevel.choices, required=False)
+    category = serializers.ChoiceField(choices=LogCategory.choices, required=False)
+    user_id = serializers.CharField(max_length=255, required=False)
+    endpoint = serializers.CharField(max_length=255, required=False)
+    since = serializers.DateTimeField()
+    until = serializers.DateTimeField()
+
+    def validate(self, data):
+        if data['since'] >= data['until']:
+            raise serializers.ValidationError(LOG_EXPORT_RANGE_INVALID_MESSAGE)
+        return data
+
+
+class ClientEventSerializer(serializers.Serializer):
+    """
+    One frontend event, validated into a `DatabaseLogger.log_many` item.
+
+    Clients pick neither the category nor the template: every event is stored
+    under LogCategory.CLIENT with the fixed CLIENT_EVENT_REPORTED template, and
+    the client's text and context only ever appear as context_data values.
+    """
+    # CRITICAL is reserved for the server
+    level = serializers.ChoiceField(choices=[choice for choice in LogLevel.choices if choice[0] != LogLevel.CRITICAL])
+    message = serializers.CharField(max_length=255)
+    context_data = serializers.DictField(required=False, default=dict)
+    execution_time_ms = serializers.IntegerField(min_value=0, required=False)
+
+    def validate_context_data(self, value):
+        size = len(json.dumps(value, cls=DjangoJSONEncoder))
+        if size > get_logger_config()['CLIENT_EVENT_MAX_CONTEXT_BYTES']:
+            raise serializers.ValidationError(CLIENT_EVENT_CONTEXT_TOO_LARGE_MESSAGE)
+        return value
+
+    def validate(self, data):
+        return {
+            'level': data['level'],
+            'category': LogCategory.CLIENT,
+            'message_template': CLIENT_EVENT_REPORTED,
+            'context_data': {'message': data['message'], 'context': data['context_data']},
+            'execution_time_ms': data.get('execution_time_ms'),
+        }
+
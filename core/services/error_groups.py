@@ -0,0 +1,89 @@
+import hashlib
+import re
+from typing import Dict, Iterable, List, Optional
+from django.conf import settings
+from django.db.models import DateTimeField, F, Value
+from django.db.models.functions import Greatest
+from core.models.logger import ErrorGroup, LogEvent
+
+FRAME_PATTERN = re.compile(r'^\s*File "(?P<path>[^"]+)", line \d+, in (?P<function>.+)$')
+EXCEPTION_PATTERN = re.compile(r'^(?P<type>[A-Za-z_][\w.]*)(:|$)')
+PACKAGE_MARKERS = ('site-packages/', 'dist-packages/')
+
+
+def _frame_path(path: str) -> str:
+    # Install locations differ between hosts and releases; the import path does not.
+    for marker in PACKAGE_MARKERS:
+        if marker in path:
+            return path.rsplit(marker, 1)[1]
+    base_dir = f"{settings.BASE_DIR}/"
+    return path[len(base_dir):] if path.startswith(base_dir) else path
+
+
+def normalize_stack_trace(stack_trace: str) -> str:
+    """
+    Reduce a formatted traceback to one `path:function` line per frame plus the
+    exception types. Line numbers, source lines and exception messages are
+    dropped, so a failure keeps its fingerprint across deploys and inputs.
+    """
+    lines = []
+    for line in stack_trace.splitlines():
+        frame = FRAME_PATTERN.match(line)
+        if frame:
+            lines.append(f"{_frame_path(frame['path'])}:{frame['function']}")
+            continue
+        if line.startswith('Traceback ') or line.startswith(' '):
+            continue
+        exception = EXCEPTION_PATTERN.match(line)
+        if exception:
+            lines.append(exception['type'])
+    return '\n'.join(lines)
+
+
+def fingerprint_stack_trace(stack_trace: str, error_type: Optional[str] = None) -> str:
+    normalized = f"{error_type or ''}\n{normalize_stack_trace(stack_trace)}"
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def record_error_groups(entries: Iterable[LogEvent], using: str) -> None:
+    """
+    Point every entry carrying a stack trace at its ErrorGroup, creating groups
+    as needed, and add the entries to the group counters. Takes one query per
+    distinct group in `entries` (two for a group seen for the first time).
+    """
+    batches: Dict[str, List[LogEvent]] = {}
+    for entry in entries:
+        if entry.error_group_id is None and entry.stack_trace:
+            batches.setdefault(fingerprint_stack_trace(entry.stack_trace, entry.error_type), []).append(entry)
+    if not batches:
+        return
+
+    groups = ErrorGroup.objects.using(using)
+    known = dict(groups.filter(fingerprint__in=list(batches)).values_list('fingerprint', 'id'))
+    for fingerprint, batch in batches.items():
+        count = sum(entry.repeat_count for entry in batch)
+        first_seen = min(entry.timestamp for entry in batch)
+        last_seen = max(entry.timestamp for entry in batch)
+
+        group_id = known.get(fingerprint)
+        created = False
+        if group_id is None:
+            group, created = groups.get_or_create(
+                fingerprint=fingerprint,
+                defaults={
+                    'error_type': batch[0].error_type,
+                    'stack_trace': batch[0].stack_trace,
+                    'occurrence_count': count,
+                    'first_seen': first_seen,
+                    'last_seen': last_seen,
+                },
+            )
+            group_id = group.pk
+        if not created:
+            groups.filter(pk=group_id).update(
+                occurrence_count=F('occurrence_count') + count,
+                last_seen=Greatest('last_seen', Value(last_seen, output_field=DateTimeField())),
+            )
+
+        for entry in batch:
+            entry.error_group_id = group_id
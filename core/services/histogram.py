@@ -0,0 +1,73 @@
+import math
+from typing import Dict, Iterable, Optional
+
+SUB_BUCKET_BITS = 4
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+
+
+def bucket_index(value: int) -> int:
+    """
+    Map a non-negative integer onto a log-linear bucket.
+
+    Values below 2 * SUB_BUCKET_COUNT get a bucket each; above that every power
+    of two is split into SUB_BUCKET_COUNT equal buckets, which bounds the
+    relative error of any reported value to roughly 1 / SUB_BUCKET_COUNT.
+    """
+    value = max(int(value), 0)
+    if value < 2 * SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return SUB_BUCKET_COUNT * shift + (value >> shift)
+
+
+def bucket_bounds(index: int):
+    if index < 2 * SUB_BUCKET_COUNT:
+        return index, index
+    shift = index // SUB_BUCKET_COUNT - 1
+    mantissa = index % SUB_BUCKET_COUNT + SUB_BUCKET_COUNT
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class LogLinearHistogram:
+
+    def __init__(self, counts: Optional[Dict[int, int]] = None):
+        self.counts: Dict[int, int] = dict(counts or {})
+
+    def __len__(self):
+        return sum(self.counts.values())
+
+    def record(self, value: int, count: int = 1) -> None:
+        index = bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+
+    def record_many(self, values: Iterable[int]) -> None:
+        for value in values:
+            self.record(value)
+
+    def merge(self, other: 'LogLinearHistogram') -> 'LogLinearHistogram':
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        return self
+
+    def quantile(self, q: float) -> Optional[int]:
+        total = len(self)
+        if total == 0:
+            return None
+        rank = max(1, math.ceil(q * total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                lower, upper = bucket_bounds(index)
+                return (lower + upper) // 2
+        return None
+
+    def percentiles(self, quantiles=(0.5, 0.95, 0.99)) -> Dict[str, Optional[int]]:
+        return {f"p{round(q * 100):g}": self.quantile(q) for q in quantiles}
+
+    def to_dict(self) -> Dict[str, int]:
+        return {str(index): count for index, count in sorted(self.counts.items())}
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, int]]) -> 'LogLinearHistogram':
+        return cls({int(index): count for index, count in (data or {}).items()})
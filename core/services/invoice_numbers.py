@@ -0,0 +1,84 @@
+from collections import defaultdict
+from typing import Iterable, List, Optional
+from django.db import connections, router, transaction
+from core.models.invoices import Invoice, InvoiceNumberSequence
+from core.constants.api import INVOICE_NUMBER_FORMAT
+
+# Backends whose INSERT ... ON CONFLICT DO UPDATE ... RETURNING lets the
+# counter be bumped and read back in a single statement. SQLite only has
+# RETURNING from 3.35, so it also needs can_return_rows_from_bulk_insert.
+UPSERT_RETURNING_VENDORS = ('postgresql', 'sqlite')
+
+
+def _supports_upsert_returning(connection) -> bool:
+    if connection.vendor == 'sqlite':
+        return connection.features.can_return_rows_from_bulk_insert
+    return connection.vendor in UPSERT_RETURNING_VENDORS
+
+
+def _upsert_sequence(connection, year: int, month: int, count: int) -> int:
+    qn = connection.ops.quote_name
+    table = qn(InvoiceNumberSequence._meta.db_table)
+    year_column, month_column, last_value_column = (
+        qn(InvoiceNumberSequence._meta.get_field(name).column)
+        for name in ('year', 'month', 'last_value')
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({year_column}, {month_column}, {last_value_column}) "
+            f"VALUES (%s, %s, %s) "
+            f"ON CONFLICT ({year_column}, {month_column}) "
+            f"DO UPDATE SET {last_value_column} = {table}.{last_value_column} + excluded.{last_value_column} "
+            f"RETURNING {last_value_column}",
+            [year, month, count],
+        )
+        return cursor.fetchone()[0]
+
+
+def _locked_sequence(alias: str, year: int, month: int, count: int) -> int:
+    with transaction.atomic(using=alias):
+        sequence, _ = (
+            InvoiceNumberSequence.objects.using(alias)
+            .select_for_update()
+            .get_or_create(year=year, month=month)
+        )
+        sequence.last_value += count
+        sequence.save(update_fields=['last_value'])
+        return sequence.last_value
+
+
+def reserve_invoice_numbers(year: int, month: int, count: int = 1, using: Optional[str] = None) -> List[str]:
+    """
+    Reserve `count` consecutive invoice numbers for the given month and return
+    them in order.
+
+    The month's counter row is incremented by `count` and read back in one
+    upsert where the backend supports it, so concurrent callers never see the
+    same value and a batch costs one round trip however large it is. The
+    increment is part of the caller's transaction: if that rolls back, the
+    numbers are released and handed out again by the next reservation.
+    """
+    if count < 1:
+        return []
+    alias = using or router.db_for_write(InvoiceNumberSequence)
+    connection = connections[alias]
+    if _supports_upsert_returning(connection):
+        last_value = _upsert_sequence(connection, year, month, count)
+    else:
+        last_value = _locked_sequence(alias, year, month, count)
+    return [
+        INVOICE_NUMBER_FORMAT.format(year=year, month=month, count=value)
+        for value in range(last_value - count + 1, last_value + 1)
+    ]
+
+
+def assign_invoice_numbers(invoices: Iterable[Invoice], using: Optional[str] = None) -> None:
+    """Give every unnumbered invoice a number, with one reservation per issue month."""
+    by_month = defaultdict(list)
+    for invoice in invoices:
+        if not invoice.number:
+            by_month[(invoice.issued_at.year, invoice.issued_at.month)].append(invoice)
+    for (year, month), pending in by_month.items():
+        numbers = reserve_invoice_numbers(year, month, len(pending), using=using)
+        for invoice, number in zip(pending, numbers):
+            invoice.number = number
@@ -0,0 +1,80 @@
+import os
+import threading
+from typing import Dict, Iterable, Optional
+from core.services.histogram import LogLinearHistogram
+
+NANOSECONDS_PER_MICROSECOND = 1000
+MICROSECONDS_PER_MILLISECOND = 1000
+REPORT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class OperationLatency:
+    """Histogram of one operation's durations, recorded in microseconds."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histogram = LogLinearHistogram()
+        self.total_us = 0
+        self.max_us = 0
+
+    def record(self, duration_us: int) -> None:
+        with self.lock:
+            self.histogram.record(duration_us)
+            self.total_us += duration_us
+            if duration_us > self.max_us:
+                self.max_us = duration_us
+
+    def summary(self, quantiles: Iterable[float] = REPORT_QUANTILES) -> Dict[str, Optional[float]]:
+        with self.lock:
+            histogram = LogLinearHistogram(self.histogram.counts)
+            total_us, max_us = self.total_us, self.max_us
+        count = len(histogram)
+        summary = {
+            'count': count,
+            'mean_ms': round(total_us / count / MICROSECONDS_PER_MILLISECOND, 3) if count else None,
+            'max_ms': round(max_us / MICROSECONDS_PER_MILLISECOND, 3),
+        }
+        for quantile in quantiles:
+            value = histogram.quantile(quantile)
+            summary[f"p{round(quantile * 100):g}_ms"] = (
+                round(value / MICROSECONDS_PER_MILLISECOND, 3) if value is not None else None
+            )
+        return summary
+
+
+class LatencyRecorder:
+    """
+    Per-process latency histograms keyed by operation name.
+
+    Each operation has its own lock, so threads only contend when they time the
+    same operation at the same moment; the registry lock is taken once per new
+    operation name.
+    """
+
+    def __init__(self):
+        self._operations: Dict[str, OperationLatency] = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, duration_ns: int) -> None:
+        latency = self._operations.get(operation)
+        if latency is None:
+            with self._lock:
+                latency = self._operations.setdefault(operation, OperationLatency())
+        latency.record(duration_ns // NANOSECONDS_PER_MICROSECOND)
+
+    def report(self, quantiles: Iterable[float] = REPORT_QUANTILES) -> Dict[str, object]:
+        operations = dict(self._operations)
+        return {
+            'pid': os.getpid(),
+            'operations': {
+                operation: latency.summary(quantiles)
+                for operation, latency in sorted(operations.items())
+            },
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._operations = {}
+
+
+latency_recorder = LatencyRecorder()
@@ -0,0 +1,176 @@
+import hashlib
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Dict, List, Optional, Tuple
+from django.core.cache import cache
+from django.db.models import Case, Count, F, FloatField, Sum, Value, When
+from django.db.models.functions import Trunc
+from django.utils import timezone
+from core.models.logger import LogEvent, LogEventRollup
+from core.services.histogram import LogLinearHistogram
+from core.services.log_rollup import ERROR_LEVELS
+from core.services.logger_service import get_logger_config
+from core.constants.logging import (
+    LOG_ANALYTICS_WINDOW_HOUR,
+    LOG_ANALYTICS_WINDOW_DAY,
+    LOG_ANALYTICS_WINDOW_WEEK,
+    LOG_ANALYTICS_INTERVAL_HOUR,
+    LOG_ANALYTICS_INTERVAL_DAY,
+    LOG_ANALYTICS_CACHE_KEY,
+    LOG_ANALYTICS_CACHE_TIMEOUT_SECONDS,
+)
+
+WINDOWS = {
+    LOG_ANALYTICS_WINDOW_HOUR: timedelta(hours=1),
+    LOG_ANALYTICS_WINDOW_DAY: timedelta(days=1),
+    LOG_ANALYTICS_WINDOW_WEEK: timedelta(weeks=1),
+}
+DEFAULT_INTERVALS = {
+    LOG_ANALYTICS_WINDOW_HOUR: LOG_ANALYTICS_INTERVAL_HOUR,
+    LOG_ANALYTICS_WINDOW_DAY: LOG_ANALYTICS_INTERVAL_HOUR,
+    LOG_ANALYTICS_WINDOW_WEEK: LOG_ANALYTICS_INTERVAL_DAY,
+}
+INTERVALS = {
+    LOG_ANALYTICS_INTERVAL_HOUR: timedelta(hours=1),
+    LOG_ANALYTICS_INTERVAL_DAY: timedelta(days=1),
+}
+
+SeriesKey = Tuple[datetime, str, str]
+
+
+def truncate(value: datetime, interval: str) -> datetime:
+    value = value.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+    if interval == LOG_ANALYTICS_INTERVAL_DAY:
+        value = value.replace(hour=0)
+    return value
+
+
+def _filter(queryset, category: Optional[str], endpoint: Optional[str]):
+    if category:
+        queryset = queryset.filter(category=category)
+    if endpoint:
+        queryset = queryset.filter(endpoint=endpoint)
+    return queryset
+
+
+def _series(totals: Dict[SeriesKey, dict], key: SeriesKey) -> dict:
+    if key not in totals:
+        totals[key] = {'events': 0.0, 'errors': 0.0, 'sketch': LogLinearHistogram()}
+    return totals[key]
+
+
+def compute_buckets(
+    start: datetime,
+    end: datetime,
+    interval: str,
+    category: Optional[str] = None,
+    endpoint: Optional[str] = None,
+) -> Dict[datetime, List[dict]]:
+    """
+    Aggregate [start, end) into `interval` buckets per (category, endpoint).
+
+    Hours already folded into LogEventRollup are read from there and the raw
+    rows still in LogEvent on top, both grouped by the database. Latency
+    percentiles come from the log-linear sketches the rollups store, merged
+    with the raw timings, so both sources combine exactly. Raw timings are
+    counted per distinct value in SQL, so the rows read back are bounded by
+    the spread of latencies rather than by traffic.
+    """
+    totals: Dict[SeriesKey, dict] = {}
+
+    events = _filter(LogEvent.objects.filter(timestamp__gte=start, timestamp__lt=end), category, endpoint)
+    events = events.order_by().annotate(bucket_start=Trunc('timestamp', interval, tzinfo=dt_timezone.utc))
+    counts = events.values('bucket_start', 'category', 'endpoint').annotate(
+        events=Sum('sample_weight'),
+        errors=Sum(Case(
+            When(level__in=ERROR_LEVELS, then=F('sample_weight')),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )),
+    )
+    for row in counts:
+        series = _series(totals, (row['bucket_start'], row['category'], row['endpoint'] or ''))
+        series['events'] += row['events'] or 0
+        series['errors'] += row['errors'] or 0
+    timings = (
+        events.filter(execution_time_ms__isnull=False)
+        .values('bucket_start', 'category', 'endpoint', 'execution_time_ms')
+        .annotate(rows=Count('id'))
+        .values_list('bucket_start', 'category', 'endpoint', 'execution_time_ms', 'rows')
+        .iterator(chunk_size=2000)
+    )
+    for bucket_start, row_category, row_endpoint, execution_time_ms, rows in timings:
+        _series(totals, (bucket_start, row_category, row_endpoint or ''))['sketch'].record(execution_time_ms, rows)
+
+    rollups = _filter(LogEventRollup.objects.filter(bucket__gte=start, bucket__lt=end), category, endpoint)
+    rollups = rollups.order_by().annotate(bucket_start=Trunc('bucket', interval, tzinfo=dt_timezone.utc))
+    for row in rollups.values('bucket_start', 'category', 'endpoint').annotate(
+        events=Sum('event_count'), errors=Sum('error_count'),
+    ):
+        series = _series(totals, (row['bucket_start'], row['category'], row['endpoint']))
+        series['events'] += row['events'] or 0
+        series['errors'] += row['errors'] or 0
+    sketches = rollups.filter(timed_count__gt=0).values_list(
+        'bucket_start', 'category', 'endpoint', 'execution_time_sketch'
+    )
+    for bucket_start, row_category, row_endpoint, sketch in sketches:
+        _series(totals, (bucket_start, row_category, row_endpoint))['sketch'].merge(LogLinearHistogram.from_dict(sketch))
+
+    buckets: Dict[datetime, List[dict]] = {}
+    for (bucket_start, row_category, row_endpoint), series in sorted(totals.items()):
+        buckets.setdefault(bucket_start, []).append({
+            'category': row_category,
+            'endpoint': row_endpoint,
+            'events': series['events'],
+            'errors': series['errors'],
+            'error_rate': series['errors'] / series['events'] if series['events'] else 0.0,
+            **series['sketch'].percentiles(),
+        })
+    return buckets
+
+
+def _cache_key(interval: str, bucket_start: datetime, category: Optional[str], endpoint: Optional[str]) -> str:
+    # Endpoints are arbitrary text; hash the filters to keep keys safe for any cache backend.
+    filters = hashlib.sha1(f"{category or ''}|{endpoint or ''}".encode('utf-8')).hexdigest()
+    return LOG_ANALYTICS_CACHE_KEY.format(interval=interval, bucket=bucket_start.isoformat(), filters=filters)
+
+
+def log_analytics(
+    window: str,
+    interval: Optional[str] = None,
+    category: Optional[str] = None,
+    endpoint: Optional[str] = None,
+    now: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Bucketed event counts, error rates and latency percentiles covering `window`.
+
+    A bucket counts as closed once it ended more than ROLLUP_GRACE_MINUTES ago,
+    after which late rows are no longer expected; closed buckets are cached and
+    never recomputed. Open buckets, and closed ones missing from the cache, are
+    computed together in one pass.
+    """
+    now = now or timezone.now()
+    interval = interval or DEFAULT_INTERVALS[window]
+    step = INTERVALS[interval]
+    closed_before = now - timedelta(minutes=get_logger_config()['ROLLUP_GRACE_MINUTES'])
+
+    starts = []
+    bucket_start = truncate(now - WINDOWS[window], interval)
+    while bucket_start <= now:
+        starts.append(bucket_start)
+        bucket_start += step
+
+    keys = {start: _cache_key(interval, start, category, endpoint) for start in starts}
+    closed = [start for start in starts if start + step <= closed_before]
+    results = cache.get_many([keys[start] for start in closed])
+    missing = [start for start in starts if keys[start] not in results]
+    if missing:
+        computed = compute_buckets(missing[0], missing[-1] + step, interval, category, endpoint)
+        to_cache = {}
+        for start in missing:
+            results[keys[start]] = computed.get(start, [])
+            if start in closed:
+                to_cache[keys[start]] = results[keys[start]]
+        cache.set_many(to_cache, LOG_ANALYTICS_CACHE_TIMEOUT_SECONDS)
+
+    return [{'bucket': start, 'series': results[keys[start]]} for start in starts]
@@ -0,0 +1,259 @@
+import gzip
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Min
+from core.models.logger import LogEvent
+from core.services.log_export import log_event_fields, log_event_rows
+from core.services.log_query import EQUALITY_FILTERS
+from core.constants.logging import LOG_ARCHIVE_FILENAME, LOG_ARCHIVE_MANIFEST_FILENAME
+
+ARCHIVE_DAY = timedelta(days=1)
+# Rows per column block; bounds memory on both the write and the read side.
+ARCHIVE_ROW_GROUP_SIZE = 5000
+
+_manifest_lock = threading.Lock()
+_manifest_cache: Dict[str, Tuple[Tuple[int, int], List[dict]]] = {}
+
+
+class ArchiveJSONEncoder(DjangoJSONEncoder):
+    # DjangoJSONEncoder cuts datetimes to milliseconds; archived rows keep every digit.
+    def default(self, o):
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def day_start(value: datetime) -> datetime:
+    return value.astimezone(dt_timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def archive_cutoff(now: datetime, older_than_days: int) -> datetime:
+    """Start of the first day kept in LogEvent; every archived row is older."""
+    return day_start(now - timedelta(days=older_than_days))
+
+
+def archive_file_path(archive_dir: str, day: datetime, batch_id: str) -> str:
+    # Late rows for a day get their own file; a retried batch rewrites the same one.
+    return os.path.join(
+        archive_dir, f"{day:%Y}", f"{day:%m}",
+        LOG_ARCHIVE_FILENAME.format(day=f"{day:%Y%m%d}", batch_id=batch_id),
+    )
+
+
+def oldest_unarchived_day(alias: str, cutoff: datetime) -> Optional[datetime]:
+    oldest = (
+        LogEvent.objects.using(alias)
+        .filter(timestamp__lt=cutoff)
+        .aggregate(oldest=Min('timestamp'))['oldest']
+    )
+    return day_start(oldest) if oldest else None
+
+
+def write_columnar_gz(path: str, rows: Iterable[dict]) -> dict:
+    """
+    Write `rows` to `path` as gzip-compressed column blocks and return the
+    manifest entry describing the file.
+
+    Each line holds up to ARCHIVE_ROW_GROUP_SIZE rows as one list per field, so
+    the repetitive level, category and template values sit next to each other
+    and compress better than row-wise NDJSON. The file is renamed into place
+    once complete.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fields = log_event_fields() + ['message_template', 'stack_trace']
+    entry = {'rows': 0, 'min_timestamp': None, 'max_timestamp': None, 'levels': set(), 'categories': set()}
+
+    def write_block(handle, block):
+        columns = {field: [row[field] for row in block] for field in fields}
+        handle.write(json.dumps({'count': len(block), 'columns': columns}, cls=ArchiveJSONEncoder, separators=(',', ':')))
+        handle.write('\n')
+
+    temp_path = f"{path}.tmp"
+    with gzip.open(temp_path, 'wt', encoding='utf-8') as handle:
+        block = []
+        for row in rows:
+            block.append(row)
+            entry['rows'] += 1
+            entry['levels'].add(row['level'])
+            entry['categories'].add(row['category'])
+            if entry['min_timestamp'] is None or row['timestamp'] < entry['min_timestamp']:
+                entry['min_timestamp'] = row['timestamp']
+            if entry['max_timestamp'] is None or row['timestamp'] > entry['max_timestamp']:
+                entry['max_timestamp'] = row['timestamp']
+            if len(block) >= ARCHIVE_ROW_GROUP_SIZE:
+                write_block(handle, block)
+                block = []
+        if block:
+            write_block(handle, block)
+    os.replace(temp_path, path)
+
+    entry['levels'] = sorted(entry['levels'])
+    entry['categories'] = sorted(entry['categories'])
+    for bound in ('min_timestamp', 'max_timestamp'):
+        entry[bound] = entry[bound].isoformat() if entry[bound] else None
+    return entry
+
+
+def read_columnar_gz(path: str) -> Iterator[dict]:
+    with gzip.open(path, 'rt', encoding='utf-8') as handle:
+        for line in handle:
+            block = json.loads(line)
+            columns = block['columns']
+            for index in range(block['count']):
+                yield {field: values[index] for field, values in columns.items()}
+
+
+def load_manifest(archive_dir: str) -> List[dict]:
+    """The manifest entries of `archive_dir`, re-read only when the file changes."""
+    path = os.path.join(archive_dir, LOG_ARCHIVE_MANIFEST_FILENAME)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return []
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _manifest_cache.get(path)
+    if cached and cached[0] == version:
+        return cached[1]
+    with open(path, encoding='utf-8') as handle:
+        entries = json.load(handle)['files']
+    for entry in entries:
+        entry['min_timestamp'] = datetime.fromisoformat(entry['min_timestamp'])
+        entry['max_timestamp'] = datetime.fromisoformat(entry['max_timestamp'])
+    _manifest_cache[path] = (version, entries)
+    return entries
+
+
+def record_manifest_entry(archive_dir: str, path: str, entry: dict) -> None:
+    manifest_path = os.path.join(archive_dir, LOG_ARCHIVE_MANIFEST_FILENAME)
+    relative_path = os.path.relpath(path, archive_dir)
+    with _manifest_lock:
+        files = []
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding='utf-8') as handle:
+                files = json.load(handle)['files']
+        files = [existing for existing in files if existing['path'] != relative_path]
+        files.append({'path': relative_path, **entry})
+        files.sort(key=lambda existing: (existing['min_timestamp'], existing['path']))
+
+        temp_path = f"{manifest_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as handle:
+            json.dump({'files': files}, handle, indent=1)
+        os.replace(temp_path, manifest_path)
+
+
+def archive_day(day: datetime, alias: str, archive_dir: str) -> int:
+    """
+    Move every LogEvent of the UTC day starting at `day` into a columnar file
+    under `archive_dir` and return the number of rows moved.
+
+    The file is complete before the rows are deleted, and the manifest only
+    lists it once the delete has committed, so a reader sees each row in
+    exactly one place. Only the rows written to the file are deleted; rows
+    for the day committed meanwhile are left for the next run.
+    """
+    events = LogEvent.objects.using(alias).filter(timestamp__gte=day, timestamp__lt=day + ARCHIVE_DAY)
+    archived_ids = []
+
+    def tracked(rows):
+        for row in rows:
+            archived_ids.append(row['id'])
+            yield row
+
+    with transaction.atomic(using=alias):
+        ordered = events.order_by('timestamp', 'id')
+        first_id = ordered.values_list('id', flat=True).first()
+        if first_id is None:
+            return 0
+
+        path = archive_file_path(archive_dir, day, first_id.hex[:12])
+        entry = write_columnar_gz(path, tracked(log_event_rows(ordered).iterator(chunk_size=ARCHIVE_ROW_GROUP_SIZE)))
+        entry['day'] = f"{day:%Y-%m-%d}"
+        transaction.on_commit(lambda: record_manifest_entry(archive_dir, path, entry), using=alias)
+
+        deleted = 0
+        for start in range(0, len(archived_ids), ARCHIVE_ROW_GROUP_SIZE):
+            chunk = archived_ids[start:start + ARCHIVE_ROW_GROUP_SIZE]
+            deleted += events.filter(id__in=chunk).order_by().delete()[0]
+        return deleted
+
+
+def archived_log_event(row: Dict[str, Any]) -> LogEvent:
+    """An unsaved LogEvent rebuilt from an archived row."""
+    event = LogEvent(**{
+        field.attname: field.to_python(row[field.attname])
+        for field in LogEvent._meta.concrete_fields
+        if field.attname in row
+    })
+    event.message_template = row['message_template']
+    event.stack_trace = row['stack_trace']
+    return event
+
+
+def _entry_matches(entry: dict, filters: Dict[str, Any], before: Optional[datetime]) -> bool:
+    if filters.get('since') and entry['max_timestamp'] < filters['since']:
+        return False
+    if filters.get('until') and entry['min_timestamp'] >= filters['until']:
+        return False
+    if before and entry['min_timestamp'] > before:
+        return False
+    if filters.get('level') and filters['level'] not in entry['levels']:
+        return False
+    if filters.get('category') and filters['category'] not in entry['categories']:
+        return False
+    return True
+
+
+def _event_matches(event: LogEvent, filters: Dict[str, Any]) -> bool:
+    for field in EQUALITY_FILTERS:
+        if filters.get(field) and getattr(event, field) != filters[field]:
+            return False
+    if filters.get('since') and event.timestamp < filters['since']:
+        return False
+    if filters.get('until') and event.timestamp >= filters['until']:
+        return False
+    return True
+
+
+def query_archived_log_events(
+    archive_dir: str,
+    filters: Dict[str, Any],
+    limit: int,
+    before: Optional[Tuple[datetime, Any]] = None,
+    newer_than: Optional[datetime] = None,
+) -> List[LogEvent]:
+    """
+    Up to `limit` archived LogEvents matching `filters`, newest first, taken
+    from before the (timestamp, id) position `before` when given.
+
+    The manifest narrows the search to files whose time range, levels and
+    categories can match; files are read newest first and the scan stops once
+    no remaining file can hold a newer match than those already found, or a
+    row from `newer_than` on (the oldest row of the caller's full page).
+    """
+    entries = [
+        entry for entry in load_manifest(archive_dir)
+        if _entry_matches(entry, filters, before[0] if before else None)
+    ]
+    entries.sort(key=lambda entry: entry['max_timestamp'], reverse=True)
+
+    found: List[LogEvent] = []
+    for entry in entries:
+        floor = newer_than
+        if len(found) >= limit and (floor is None or found[limit - 1].timestamp > floor):
+            floor = found[limit - 1].timestamp
+        if floor is not None and entry['max_timestamp'] < floor:
+            break
+        for row in read_columnar_gz(os.path.join(archive_dir, entry['path'])):
+            event = archived_log_event(row)
+            if before and (event.timestamp, event.pk) >= before:
+                continue
+            if _event_matches(event, filters):
+                found.append(event)
+        found.sort(key=lambda event: (event.timestamp, event.pk), reverse=True)
+        del found[limit:]
+    return found
@@ -0,0 +1,176 @@
+import atexit
+import logging
+import os
+import threading
+from collections import deque
+from typing import Callable, List, Optional, Union
+from django.db import close_old_connections, connections, router, transaction
+from core.constants.logging import (
+    LOG_BUFFER_OVERFLOW_DROP_OLDEST,
+    LOG_BUFFER_OVERFLOW_DROP_NEWEST,
+    LOG_BUFFER_OVERFLOW_FLUSH,
+    LOG_BUFFER_OVERFLOW_POLICIES,
+    LOG_FLUSHER_THREAD_NAME,
+    LOG_BUFFER_SHUTDOWN_TIMEOUT_SECONDS,
+    LOG_BUFFER_FLUSH_FAILED,
+    LOG_BUFFER_OVERFLOW_DROPPED,
+    LOG_BULK_INSERT_AUTO,
+    LOG_BULK_INSERT_COPY,
+)
+from core.models.logger import LogEvent
+from core.services.error_groups import record_error_groups
+from core.services.log_coalescing import CoalescedRepeats, apply_coalesced_repeats
+from core.services.log_copy import copy_log_events
+
+
+def bulk_create_log_events(entries: List[LogEvent], method: str = LOG_BULK_INSERT_AUTO) -> None:
+    """
+    Insert `entries` in one transaction. `method` picks COPY or bulk_create;
+    'auto' uses COPY on PostgreSQL and bulk_create everywhere else.
+    """
+    alias = router.db_for_write(LogEvent)
+    connection = connections[alias]
+    use_copy = method == LOG_BULK_INSERT_COPY or (
+        method == LOG_BULK_INSERT_AUTO and connection.vendor == 'postgresql'
+    )
+    with transaction.atomic(using=alias):
+        for entry in entries:
+            entry.resolve_template(alias)
+        record_error_groups(entries, alias)
+        if use_copy:
+            copy_log_events(entries, connection)
+        else:
+            LogEvent.objects.using(alias).bulk_create(entries)
+
+
+class LogEventBuffer:
+    """
+    Bounded in-memory queue of unsaved LogEvent instances.
+
+    A daemon thread drains the queue with bulk inserts whenever it holds
+    `batch_size` entries or `flush_interval` seconds have passed. When the
+    queue is full, `overflow_policy` decides whether to drop the oldest entry,
+    drop the new one, or flush synchronously in the calling thread.
+
+    CoalescedRepeats may be queued too; they are applied after the inserts of
+    their batch, so always after the entry they add to has been written.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        batch_size: int,
+        flush_interval: float,
+        overflow_policy: str = LOG_BUFFER_OVERFLOW_FLUSH,
+        writer: Optional[Callable[[List[LogEvent]], None]] = None,
+        start_flusher: bool = True
+    ):
+        if overflow_policy not in LOG_BUFFER_OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown log buffer overflow policy: {overflow_policy}")
+
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.writer = writer or bulk_create_log_events
+        self.start_flusher = start_flusher
+        self.dropped_count = 0
+        self.django_logger = logging.getLogger('billdr')
+
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = None
+        self._pid = None
+
+    def __len__(self):
+        return len(self._queue)
+
+    def add(self, entry: Union[LogEvent, CoalescedRepeats]) -> bool:
+        flush_now = False
+        with self._lock:
+            if len(self._queue) >= self.max_size:
+                if self.overflow_policy == LOG_BUFFER_OVERFLOW_DROP_NEWEST:
+                    self._record_drop()
+                    return False
+                if self.overflow_policy == LOG_BUFFER_OVERFLOW_DROP_OLDEST:
+                    self._queue.popleft()
+                    self._record_drop()
+                else:
+                    flush_now = True
+            self._queue.append(entry)
+            queue_size = len(self._queue)
+
+        if flush_now or self._stopping:
+            self.flush()
+            return True
+
+        self._ensure_flusher()
+        if queue_size >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def flush(self) -> int:
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    if not self._queue:
+                        return written
+                    batch_size = min(len(self._queue), self.batch_size)
+                    batch = [self._queue.popleft() for _ in range(batch_size)]
+                entries = [item for item in batch if isinstance(item, LogEvent)]
+                repeats = [item for item in batch if isinstance(item, CoalescedRepeats)]
+                try:
+                    if entries:
+                        self.writer(entries)
+                        written += len(entries)
+                    if repeats:
+                        apply_coalesced_repeats(repeats)
+                except Exception as e:
+                    self.django_logger.error(
+                        LOG_BUFFER_FLUSH_FAILED.format(count=len(batch), error=e)
+                    )
+
+    def shutdown(self, timeout: float = LOG_BUFFER_SHUTDOWN_TIMEOUT_SECONDS) -> None:
+        self._stopping = True
+        self._wakeup.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout)
+        self.flush()
+
+    def _record_drop(self):
+        self.dropped_count += 1
+        if self.dropped_count == 1 or self.dropped_count % self.max_size == 0:
+            self.django_logger.warning(
+                LOG_BUFFER_OVERFLOW_DROPPED.format(max_size=self.max_size, dropped=self.dropped_count)
+            )
+
+    def _ensure_flusher(self):
+        if not self.start_flusher or self._stopping:
+            return
+        # A forked worker inherits the parent's buffer object but not its thread.
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            first_start = self._thread is None
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run, name=LOG_FLUSHER_THREAD_NAME, daemon=True
+            )
+            self._thread.start()
+        if first_start:
+            atexit.register(self.shutdown)
+
+    def _run(self):
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            # This thread owns its own connection; recycle it like a request would.
+            close_old_connections()
+            self.flush()
@@ -0,0 +1,186 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, router
+from django.db.models import F
+from django.utils import timezone
+from core.models.logger import LogEvent
+from core.constants.logging import LOG_COALESCE_SWEEP_FAILED, LOG_COALESCER_THREAD_NAME
+
+
+class CoalescedRepeats(NamedTuple):
+    """Repeats folded into `entry` during one window, to be added to its row."""
+    entry: LogEvent
+    repeats: int
+    weight: float
+    last_seen: datetime
+
+
+def apply_coalesced_repeats(closed: List[CoalescedRepeats]) -> None:
+    """
+    Add each window's repeats to its entry's row with one atomic UPDATE.
+
+    The entries themselves are left untouched, and a row that is not there
+    (e.g. dropped from a full buffer) is simply not updated.
+    """
+    alias = router.db_for_write(LogEvent)
+    for repeats in closed:
+        LogEvent.objects.using(alias).filter(pk=repeats.entry.pk, timestamp=repeats.entry.timestamp).update(
+            repeat_count=F('repeat_count') + repeats.repeats,
+            sample_weight=F('sample_weight') + repeats.weight,
+            last_seen=repeats.last_seen,
+        )
+
+
+class _Window:
+    __slots__ = ('entry', 'closes_at', 'repeats', 'weight', 'last_seen')
+
+    def __init__(self, entry: LogEvent, closes_at):
+        self.entry = entry
+        self.closes_at = closes_at
+        self.repeats = 0
+        self.weight = 0.0
+        self.last_seen = None
+
+
+class LogCoalescer:
+    """
+    Folds repeats of an identical event into the row of its first occurrence.
+
+    Events are identical when level, category, template, context and request
+    fields all match. Timed events are never folded since each timing is a
+    separate measurement, nor are events with a stack trace, which their
+    ErrorGroup already counts. The first event of a window is written as usual.
+    Repeats within `window_seconds` of it only bump counters, which are handed
+    out as CoalescedRepeats when the window closes: on the next repeat after
+    it, on the sweep that runs at most once per window, or on `close_all`.
+    With `on_close` set, a daemon thread also sweeps once per window, so the
+    counts of a window that sees no further events are not held indefinitely.
+    At most `max_keys` windows are tracked; beyond that events pass through.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        max_keys: int = 10000,
+        on_close: Optional[Callable[[List[CoalescedRepeats]], None]] = None,
+        start_sweeper: bool = True
+    ):
+        self.window = timedelta(seconds=window_seconds)
+        self.max_keys = max_keys
+        self.on_close = on_close
+        self.start_sweeper = start_sweeper
+        self.django_logger = logging.getLogger('billdr')
+        self._windows: Dict[Tuple, _Window] = {}
+        self._next_sweep = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = None
+        self._pid = None
+
+    @staticmethod
+    def fingerprint(entry: LogEvent) -> Tuple:
+        return (
+            entry.level,
+            entry.category,
+            entry.message_template,
+            json.dumps(entry.context_data, sort_keys=True, cls=DjangoJSONEncoder),
+            entry.user_id,
+            entry.session_id,
+            entry.ip_address,
+            entry.endpoint,
+            entry.request_method,
+            entry.error_type,
+        )
+
+    def add(self, entry: LogEvent) -> Tuple[Optional[LogEvent], List[CoalescedRepeats]]:
+        """
+        Return the entry `entry` was folded into (None when it must be written
+        as a new row) and the repeats of the windows that just closed.
+        """
+        if entry.execution_time_ms is not None or entry.stack_trace:
+            return None, []
+
+        key = self.fingerprint(entry)
+        now = entry.timestamp
+        closed = []
+        with self._lock:
+            if self._next_sweep is None or now >= self._next_sweep:
+                closed.extend(self._close(lambda window: window.closes_at <= now))
+                self._next_sweep = now + self.window
+
+            window = self._windows.get(key)
+            if window is not None and now < window.closes_at:
+                window.repeats += 1
+                window.weight += entry.sample_weight
+                window.last_seen = now
+                folded_into = window.entry
+            else:
+                folded_into = None
+                if window is not None:
+                    del self._windows[key]
+                    if window.repeats:
+                        closed.append(self._repeats(window))
+                if len(self._windows) < self.max_keys:
+                    self._windows[key] = _Window(entry, now + self.window)
+        if folded_into is not None:
+            self._ensure_sweeper()
+        return folded_into, closed
+
+    def sweep(self) -> List[CoalescedRepeats]:
+        """Close the windows that have run out, returning their repeats."""
+        now = timezone.now()
+        with self._lock:
+            return self._close(lambda window: window.closes_at <= now)
+
+    def close_all(self) -> List[CoalescedRepeats]:
+        """Close every open window, returning the repeats of those that had any."""
+        with self._lock:
+            return self._close(lambda window: True)
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._wakeup.set()
+
+    def _close(self, predicate) -> List[CoalescedRepeats]:
+        closed = []
+        for key, window in list(self._windows.items()):
+            if predicate(window):
+                del self._windows[key]
+                if window.repeats:
+                    closed.append(self._repeats(window))
+        return closed
+
+    @staticmethod
+    def _repeats(window: _Window) -> CoalescedRepeats:
+        return CoalescedRepeats(window.entry, window.repeats, window.weight, window.last_seen)
+
+    def _ensure_sweeper(self):
+        if self.on_close is None or not self.start_sweeper or self._stopping:
+            return
+        # A forked worker inherits the parent's coalescer but not its thread.
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name=LOG_COALESCER_THREAD_NAME, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopping:
+            self._wakeup.wait(self.window.total_seconds())
+            closed = self.sweep()
+            if not closed:
+                continue
+            try:
+                close_old_connections()
+                self.on_close(closed)
+            except Exception as e:
+                self.django_logger.error(LOG_COALESCE_SWEEP_FAILED.format(count=len(closed), error=e))
@@ -0,0 +1,92 @@
+import gzip
+import json
+import os
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
+from core.models.logger import LogEvent
+from core.services.log_query import filter_log_events
+
+EXPORT_CHUNK_SIZE = 2000
+# Compressed output is handed on once at least this much input has gone in.
+EXPORT_FLUSH_BYTES = 64 * 1024
+# zlib writes a gzip header and trailer when wbits is 16 + the window size.
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def log_event_fields() -> List[str]:
+    # Template and error group ids are local to one database, so exports carry the text instead.
+    return [
+        field.attname for field in LogEvent._meta.concrete_fields
+        if field.name not in ('template', 'error_group')
+    ]
+
+
+def log_event_rows(queryset):
+    return queryset.values(
+        *log_event_fields(),
+        message_template=F('template__template'),
+        stack_trace=F('error_group__stack_trace'),
+    )
+
+
+def log_event_to_dict(entry: LogEvent) -> dict:
+    row = {field: getattr(entry, field) for field in log_event_fields()}
+    row['message_template'] = entry.message_template
+    row['stack_trace'] = entry.stack_trace
+    return row
+
+
+def log_event_to_json(row: dict) -> str:
+    return json.dumps(row, cls=DjangoJSONEncoder, separators=(',', ':'))
+
+
+def write_ndjson_gz(path: str, rows: Iterable[dict]) -> int:
+    """
+    Write `rows` as gzip-compressed NDJSON to `path` and return how many were written.
+
+    The file is written next to its final location and renamed into place, so a
+    reader never sees a half-written archive and a rerun simply replaces it.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    count = 0
+    with gzip.open(temp_path, 'wt', encoding='utf-8') as handle:
+        for row in rows:
+            handle.write(log_event_to_json(row))
+            handle.write('\n')
+            count += 1
+    os.replace(temp_path, path)
+    return count
+
+
+def export_log_event_rows(filters: Dict[str, Any]) -> Iterator[dict]:
+    """
+    Rows of the LogEvents matching `filters`, oldest first, fetched in chunks
+    (through a server-side cursor on PostgreSQL) so memory stays flat however
+    many rows match.
+    """
+    queryset = filter_log_events(LogEvent.objects.all(), filters).order_by('timestamp', 'id')
+    return log_event_rows(queryset).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def iter_ndjson_gz(rows: Iterable[dict]) -> Iterator[bytes]:
+    """Yield `rows` as consecutive pieces of one gzip-compressed NDJSON stream."""
+    compressor = zlib.compressobj(wbits=GZIP_WBITS)
+    pending = []
+    pending_bytes = 0
+    for row in rows:
+        line = f"{log_event_to_json(row)}\n".encode('utf-8')
+        pending.append(line)
+        pending_bytes += len(line)
+        if pending_bytes >= EXPORT_FLUSH_BYTES:
+            chunk = compressor.compress(b''.join(pending))
+            pending = []
+            pending_bytes = 0
+            if chunk:
+                yield chunk
+    yield compressor.compress(b''.join(pending)) + compressor.flush()
+
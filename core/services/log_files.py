@@ -0,0 +1,87 @@
+import json
+import mmap
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+from django.utils.dateparse import parse_datetime
+from core.services.log_query import EQUALITY_FILTERS
+from core.services.log_sinks import rotated_log_files
+from core.constants.logging import JSONL_ACTIVE_FILENAME
+
+
+def log_file_paths(directory: str, since: Optional[datetime] = None) -> List[str]:
+    """
+    JSON-lines files in `directory`, oldest first.
+
+    A rotated file is named after the moment it was rotated, so files rotated
+    before `since` cannot hold matching events and are skipped unopened.
+    """
+    paths = []
+    for path in rotated_log_files(directory):
+        rotated_ns = int(os.path.basename(path).split('-', 1)[1].split('.', 1)[0])
+        if since is None or rotated_ns >= since.timestamp() * 1e9:
+            paths.append(path)
+    active = os.path.join(directory, JSONL_ACTIVE_FILENAME)
+    if os.path.exists(active):
+        paths.append(active)
+    return paths
+
+
+def _needles(filters: Dict[str, Any]) -> List[bytes]:
+    # The sink writes compact JSON, so an equality filter is also a byte substring.
+    return [
+        f"{json.dumps(field)}:{json.dumps(filters[field])}".encode('utf-8')
+        for field in EQUALITY_FILTERS
+        if filters.get(field)
+    ]
+
+
+def _matches(row: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    for field in EQUALITY_FILTERS:
+        if filters.get(field) and row.get(field) != filters[field]:
+            return False
+    if filters.get('since') or filters.get('until'):
+        # DjangoJSONEncoder writes UTC as a trailing "Z", which fromisoformat rejects before 3.11.
+        timestamp = parse_datetime(row['timestamp'])
+        if filters.get('since') and timestamp < filters['since']:
+            return False
+        if filters.get('until') and timestamp >= filters['until']:
+            return False
+    return True
+
+
+def scan_log_file(path: str, filters: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    needles = _needles(filters)
+    with open(path, 'rb') as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+            start = 0
+            while start < size:
+                end = mapped.find(b'\n', start)
+                if end == -1:
+                    # A line still being appended by a writer.
+                    return
+                line = mapped[start:end]
+                start = end + 1
+                if all(needle in line for needle in needles):
+                    row = json.loads(line)
+                    if _matches(row, filters):
+                        yield row
+
+
+def read_log_files(directory: str, filters: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Events from the JSON-lines sink files, oldest first, applying `filters`.
+
+    The sink appends a coalesced event again each time a window of repeats
+    closes, so matching rows are held until every file is read and only the
+    last line for each id is returned, in the order the ids first appeared.
+    """
+    filters = filters or {}
+    rows: Dict[Any, Dict[str, Any]] = {}
+    for path in log_file_paths(directory, filters.get('since')):
+        for row in scan_log_file(path, filters):
+            rows[row['id']] = row
+    yield from rows.values()
@@ -0,0 +1,50 @@
+from typing import List
+from django.db import connections, router
+from core.models.logger import LogEvent
+from core.constants.logging import LOG_CONTEXT_INDEXED_KEYS, LOG_CONTEXT_COLUMN, LOG_CONTEXT_INDEX
+
+
+def context_column(key: str) -> str:
+    return LOG_CONTEXT_COLUMN.format(key=key)
+
+
+def ensure_context_columns(connection) -> List[str]:
+    """
+    Give the SQLite LogEvent table an indexed generated column per key in
+    LOG_CONTEXT_INDEXED_KEYS, returning the columns that had to be added.
+
+    The columns are VIRTUAL, so they cost nothing on insert, and they are not
+    model fields: Django rebuilds SQLite tables for some schema changes and
+    drops them, which is why this runs after every migrate and is idempotent.
+    Other backends are left alone; PostgreSQL uses a GIN index instead.
+    """
+    if connection.vendor != 'sqlite':
+        return []
+
+    table = LogEvent._meta.db_table
+    qn = connection.ops.quote_name
+    added = []
+    with connection.cursor() as cursor:
+        if table not in connection.introspection.table_names(cursor):
+            return []
+        cursor.execute(f"PRAGMA table_xinfo({qn(table)})")
+        existing = {row[1] for row in cursor.fetchall()}
+        for key in LOG_CONTEXT_INDEXED_KEYS:
+            column = context_column(key)
+            if column not in existing:
+                # No declared type, so values keep the JSON scalar type json_extract returns.
+                cursor.execute(
+                    f"ALTER TABLE {qn(table)} ADD COLUMN {qn(column)} "
+                    f"GENERATED ALWAYS AS (json_extract(\"context_data\", '$.{key}')) VIRTUAL"
+                )
+                added.append(column)
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {qn(LOG_CONTEXT_INDEX.format(key=key))} "
+                f"ON {qn(table)} ({qn(column)}, \"timestamp\")"
+            )
+    return added
+
+
+def ensure_context_columns_after_migrate(sender, using, **kwargs) -> None:
+    if router.allow_migrate_model(using, LogEvent):
+        ensure_context_columns(connections[using])
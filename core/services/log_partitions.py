@@ -0,0 +1,111 @@
+import re
+from datetime import datetime, timezone as dt_timezone
+from typing import List, Tuple
+from core.models.logger import LogEvent
+
+PARTITION_SUFFIX_PATTERN = re.compile(r'_p(\d{4})(\d{2})$')
+
+
+def month_start(value: datetime) -> datetime:
+    return value.astimezone(dt_timezone.utc).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def add_months(month: datetime, count: int) -> datetime:
+    index = month.year * 12 + (month.month - 1) + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime, table: str = None) -> str:
+    table = table or LogEvent._meta.db_table
+    return f"{table}_p{month.year:04d}{month.month:02d}"
+
+
+def default_partition_name(table: str = None) -> str:
+    table = table or LogEvent._meta.db_table
+    return f"{table}_default"
+
+
+def is_partitioned(connection, table: str = None) -> bool:
+    if connection.vendor != 'postgresql':
+        return False
+    table = table or LogEvent._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = %s",
+            [table],
+        )
+        return cursor.fetchone() is not None
+
+
+def list_monthly_partitions(connection, table: str = None) -> List[Tuple[str, datetime]]:
+    table = table or LogEvent._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "WHERE parent.relname = %s",
+            [table],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = []
+    for name in names:
+        match = PARTITION_SUFFIX_PATTERN.search(name)
+        if match:
+            month = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=dt_timezone.utc)
+            partitions.append((name, month))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def create_month_partition(connection, month: datetime, table: str = None) -> bool:
+    """
+    Create the partition for `month` if it does not exist yet.
+
+    Rows for that month that already landed in the default partition are moved
+    into the new partition before it is attached, so ATTACH never fails on a
+    constraint violation.
+    """
+    table = table or LogEvent._meta.db_table
+    name = partition_name(month, table)
+    if name in {existing for existing, _ in list_monthly_partitions(connection, table)}:
+        return False
+
+    qn = connection.ops.quote_name
+    bounds = [month, add_months(month, 1)]
+    with connection.cursor() as cursor:
+        cursor.execute(f"CREATE TABLE {qn(name)} (LIKE {qn(table)} INCLUDING DEFAULTS)")
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {qn(default_partition_name(table))} "
+            f"WHERE \"timestamp\" >= %s AND \"timestamp\" < %s RETURNING *) "
+            f"INSERT INTO {qn(name)} SELECT * FROM moved",
+            bounds,
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ATTACH PARTITION {qn(name)} "
+            f"FOR VALUES FROM (%s) TO (%s)",
+            bounds,
+        )
+    return True
+
+
+def drop_month_partition(connection, name: str, table: str = None) -> None:
+    table = table or LogEvent._meta.db_table
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {qn(table)} DETACH PARTITION {qn(name)}")
+        cursor.execute(f"DROP TABLE {qn(name)}")
+
+
+def delete_expired_default_rows(connection, cutoff: datetime, table: str = None) -> int:
+    table = table or LogEvent._meta.db_table
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {qn(default_partition_name(table))} WHERE \"timestamp\" < %s",
+            [cutoff],
+        )
+        return cursor.rowcount
@@ -0,0 +1,74 @@
+from typing import Any, Dict, List, Optional, Tuple
+from django.db.models import Q
+from django.utils import timezone
+from core.models.logger import LogEvent
+from core.utils.cursor import encode_cursor, decode_cursor
+
+# Each equality filter is served by the (<field>, timestamp) index, and the
+# unfiltered case by (timestamp, level); see LogEvent.Meta.indexes.
+EQUALITY_FILTERS = ('level', 'category', 'user_id', 'endpoint', 'request_id')
+KEYSET_ORDERING = ('-timestamp', '-id')
+
+
+def filter_log_events(queryset, filters: Dict[str, Any]):
+    for field in EQUALITY_FILTERS:
+        if filters.get(field):
+            queryset = queryset.filter(**{field: filters[field]})
+    if filters.get('since'):
+        queryset = queryset.filter(timestamp__gte=filters['since'])
+    if filters.get('until'):
+        queryset = queryset.filter(timestamp__lt=filters['until'])
+    return queryset
+
+
+def _may_reach_archive(filters: Dict[str, Any], archive_after_days: Optional[int]) -> bool:
+    if archive_after_days is None or not filters.get('since'):
+        return True
+    from core.services.log_archive import archive_cutoff
+    return filters['since'] < archive_cutoff(timezone.now(), archive_after_days)
+
+
+def query_log_events(
+    filters: Dict[str, Any],
+    page_size: int,
+    cursor: Optional[str] = None,
+    archive_dir: Optional[str] = None,
+    archive_after_days: Optional[int] = None,
+) -> Tuple[List[LogEvent], Optional[str]]:
+    """
+    Return one page of LogEvents, newest first, and the cursor for the next page.
+
+    Pages are keyed on (timestamp, id) rather than offsets. The cursor predicate
+    is spelled as `timestamp <= t AND (timestamp < t OR id < pk)` so the leading
+    range condition stays sargable on the timestamp column of every index.
+    Raises ValueError for a malformed cursor.
+
+    With `archive_dir`, rows already moved to the cold archive are merged in
+    wherever the archive manifest shows files overlapping the range. Given
+    `archive_after_days`, a `since` inside that hot window skips the archive
+    altogether, and a full page from the database stops the archive scan at
+    files older than its last row.
+    """
+    queryset = filter_log_events(LogEvent.objects.select_related('error_group'), filters)
+    before = None
+    if cursor:
+        timestamp, pk = decode_cursor(cursor)
+        before = (timestamp, pk)
+        queryset = queryset.filter(
+            Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, id__lt=pk),
+            timestamp__lte=timestamp,
+        )
+
+    events = list(queryset.order_by(*KEYSET_ORDERING)[:page_size + 1])
+    if archive_dir and _may_reach_archive(filters, archive_after_days):
+        from core.services.log_archive import query_archived_log_events
+        newer_than = events[-1].timestamp if len(events) > page_size else None
+        archived = query_archived_log_events(archive_dir, filters, page_size + 1, before, newer_than)
+        if archived:
+            events = sorted(events + archived, key=lambda event: (event.timestamp, event.pk), reverse=True)
+            events = events[:page_size + 1]
+    next_cursor = None
+    if len(events) > page_size:
+        events = events[:page_size]
+        next_cursor = encode_cursor(events[-1].timestamp, events[-1].pk)
+    return events, next_cursor
@@ -0,0 +1,172 @@
+import os
+from itertools import chain
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Dict, Optional, Tuple
+from django.db import transaction
+from django.db.models import Count, Max, Min, Sum
+from core.models.logger import LogEvent, LogEventRollup, LogLevel
+from core.services.histogram import LogLinearHistogram
+from core.services.log_export import log_event_rows, write_ndjson_gz
+
+ROLLUP_BUCKET = timedelta(hours=1)
+ERROR_LEVELS = (LogLevel.ERROR, LogLevel.CRITICAL)
+SKETCH_CHUNK_SIZE = 2000
+# Ids per `id__in` batch when aggregating, archiving and deleting an hour's rows.
+ROLLUP_ID_BATCH_SIZE = 5000
+
+RollupKey = Tuple[str, str, str]
+
+
+def hour_start(value: datetime) -> datetime:
+    return value.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def archive_path(archive_dir: str, hour: datetime, batch_id: str) -> str:
+    # Late rows for an hour get their own file; a retried batch rewrites the same one.
+    return os.path.join(
+        archive_dir, f"{hour:%Y}", f"{hour:%m}", f"{hour:%d}",
+        f"logevents-{hour:%Y%m%d%H}-{batch_id}.ndjson.gz",
+    )
+
+
+def oldest_pending_hour(alias: str, cutoff: datetime) -> Optional[datetime]:
+    oldest = (
+        LogEvent.objects.using(alias)
+        .filter(timestamp__lt=cutoff)
+        .aggregate(oldest=Min('timestamp'))['oldest']
+    )
+    return hour_start(oldest) if oldest else None
+
+
+def aggregate_events(events) -> Dict[RollupKey, dict]:
+    """
+    Aggregate a LogEvent queryset into rollup values keyed by (category, level, endpoint).
+
+    Counts, sums and maxima are computed by the database; only the rows that
+    carry an execution time are read back, to build the latency sketches.
+    """
+    totals: Dict[RollupKey, dict] = {}
+    groups = (
+        events.order_by()
+        .values('category', 'level', 'endpoint')
+        .annotate(
+            row_count=Count('id'),
+            event_count=Sum('sample_weight'),
+            timed_count=Count('execution_time_ms'),
+            execution_time_sum_ms=Sum('execution_time_ms'),
+            execution_time_max_ms=Max('execution_time_ms'),
+        )
+    )
+    for group in groups:
+        key = (group['category'], group['level'], group['endpoint'] or '')
+        values = {
+            'row_count': group['row_count'],
+            'event_count': group['event_count'] or 0,
+            'error_count': (group['event_count'] or 0) if group['level'] in ERROR_LEVELS else 0,
+            'timed_count': group['timed_count'],
+            'execution_time_sum_ms': group['execution_time_sum_ms'] or 0,
+            'execution_time_max_ms': group['execution_time_max_ms'],
+            'execution_time_sketch': LogLinearHistogram(),
+        }
+        # NULL and empty endpoints share a rollup row.
+        totals[key] = merge_values(totals[key], values) if key in totals else values
+
+    timings = (
+        events.order_by()
+        .filter(execution_time_ms__isnull=False)
+        .values_list('category', 'level', 'endpoint', 'execution_time_ms')
+        .iterator(chunk_size=SKETCH_CHUNK_SIZE)
+    )
+    for category, level, endpoint, execution_time_ms in timings:
+        totals[(category, level, endpoint or '')]['execution_time_sketch'].record(execution_time_ms)
+    return totals
+
+
+def merge_values(current: dict, new: dict) -> dict:
+    maxima = [value for value in (current['execution_time_max_ms'], new['execution_time_max_ms']) if value is not None]
+    return {
+        'row_count': current['row_count'] + new['row_count'],
+        'event_count': current['event_count'] + new['event_count'],
+        'error_count': current['error_count'] + new['error_count'],
+        'timed_count': current['timed_count'] + new['timed_count'],
+        'execution_time_sum_ms': current['execution_time_sum_ms'] + new['execution_time_sum_ms'],
+        'execution_time_max_ms': max(maxima) if maxima else None,
+        'execution_time_sketch': current['execution_time_sketch'].merge(new['execution_time_sketch']),
+    }
+
+
+def rollup_hour(hour: datetime, alias: str, archive_dir: Optional[str] = None) -> int:
+    """
+    Fold every LogEvent in the hour starting at `hour` into LogEventRollup rows,
+    optionally archive the raw rows, then delete them. Returns the number of
+    raw rows compacted.
+
+    The hour's rows are captured (and locked, where supported) up front, and
+    every later step is limited to those ids, so rows committed while the
+    hour is being compacted are neither deleted uncounted nor counted twice.
+    Rows that arrive late for an hour that was already rolled up are merged
+    into the existing rollup rows on the next run.
+    """
+    events = LogEvent.objects.using(alias).filter(timestamp__gte=hour, timestamp__lt=hour + ROLLUP_BUCKET)
+
+    with transaction.atomic(using=alias):
+        ids = list(events.order_by('timestamp', 'id').select_for_update().values_list('id', flat=True))
+        if not ids:
+            return 0
+        # Batches follow (timestamp, id) order, so reading them in turn keeps the archive ordered.
+        batches = [
+            events.filter(id__in=ids[start:start + ROLLUP_ID_BATCH_SIZE])
+            for start in range(0, len(ids), ROLLUP_ID_BATCH_SIZE)
+        ]
+
+        totals: Dict[RollupKey, dict] = {}
+        for batch in batches:
+            for key, values in aggregate_events(batch).items():
+                totals[key] = merge_values(totals[key], values) if key in totals else values
+
+        existing = {
+            (rollup.category, rollup.level, rollup.endpoint): rollup
+            for rollup in LogEventRollup.objects.using(alias).select_for_update().filter(bucket=hour)
+        }
+        to_create, to_update = [], []
+        for (category, level, endpoint), values in totals.items():
+            rollup = existing.get((category, level, endpoint))
+            if rollup:
+                values = merge_values(
+                    {
+                        'row_count': rollup.row_count,
+                        'event_count': rollup.event_count,
+                        'error_count': rollup.error_count,
+                        'timed_count': rollup.timed_count,
+                        'execution_time_sum_ms': rollup.execution_time_sum_ms,
+                        'execution_time_max_ms': rollup.execution_time_max_ms,
+                        'execution_time_sketch': LogLinearHistogram.from_dict(rollup.execution_time_sketch),
+                    },
+                    values,
+                )
+                to_update.append(rollup)
+            else:
+                rollup = LogEventRollup(bucket=hour, category=category, level=level, endpoint=endpoint)
+                to_create.append(rollup)
+            for field, value in values.items():
+                setattr(rollup, field, value)
+            rollup.execution_time_sketch = values['execution_time_sketch'].to_dict()
+
+        LogEventRollup.objects.using(alias).bulk_create(to_create)
+        if to_update:
+            LogEventRollup.objects.using(alias).bulk_update(
+                to_update,
+                [
+                    'row_count', 'event_count', 'error_count', 'timed_count',
+                    'execution_time_sum_ms', 'execution_time_max_ms', 'execution_time_sketch',
+                ],
+            )
+
+        if archive_dir:
+            rows = chain.from_iterable(
+                log_event_rows(batch.order_by('timestamp', 'id')).iterator(chunk_size=SKETCH_CHUNK_SIZE)
+                for batch in batches
+            )
+            write_ndjson_gz(archive_path(archive_dir, hour, ids[0].hex[:12]), rows)
+
+        return sum(batch.order_by().delete()[0] for batch in batches)
@@ -0,0 +1,115 @@
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from core.models.logger import LogLevel
+
+ALWAYS_KEPT_LEVELS = (LogLevel.ERROR, LogLevel.CRITICAL)
+
+
+class TokenBucket:
+
+    def __init__(self, rate_per_second: float, burst: float):
+        self.rate_per_second = rate_per_second
+        self.capacity = max(burst, 1)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def consume(self, tokens: float = 1) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second)
+        self.updated_at = now
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+
+class ClientRateLimiter:
+    """
+    One TokenBucket per client key (e.g. IP address). Only the `max_clients`
+    most recently seen clients are tracked; a client pushed out of the table
+    starts again with a full bucket.
+    """
+
+    def __init__(self, rate_per_second: float, burst: float, max_clients: int = 10000):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, client: str, tokens: float = 1) -> bool:
+        with self._lock:
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                bucket = TokenBucket(self.rate_per_second, self.burst)
+                self._buckets[client] = bucket
+                if len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(client)
+            return bucket.consume(tokens)
+
+
+class LogSampler:
+    """
+    Decides whether a log event is persisted, based on the first matching rule.
+
+    A rule may set `category`, `level` and `message_template` to match on, a
+    `sample_rate` between 0 and 1, and a token bucket (`rate_per_second` and
+    `burst`) applied per level/category/template. `admit` returns the weight a
+    kept row must carry so that summing weights reconstructs the real event
+    count, or None when the event should be dropped. ERROR and CRITICAL
+    events are always kept with a weight of 1.
+    """
+
+    def __init__(self, rules: Optional[List[Dict[str, Any]]] = None, rng: Optional[random.Random] = None):
+        self.rules = rules or []
+        self.rng = rng or random.Random()
+        self._buckets: Dict[Tuple, TokenBucket] = {}
+        self._pending_weight: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def admit(self, level: str, category: str, message_template: str) -> Optional[float]:
+        if level in ALWAYS_KEPT_LEVELS:
+            return 1.0
+
+        rule_index, rule = self._match(level, category, message_template)
+        if rule is None:
+            return 1.0
+
+        sample_rate = rule.get('sample_rate', 1.0)
+        if sample_rate <= 0:
+            return None
+        if sample_rate < 1 and self.rng.random() >= sample_rate:
+            return None
+        weight = 1.0 / min(sample_rate, 1.0)
+
+        rate_per_second = rule.get('rate_per_second')
+        if rate_per_second is None:
+            return weight
+
+        key = (rule_index, level, category, message_template)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(rate_per_second, rule.get('burst', rate_per_second))
+                self._buckets[key] = bucket
+            if not bucket.consume():
+                # Carry the suppressed weight over to the next row that gets through.
+                self._pending_weight[key] = self._pending_weight.get(key, 0.0) + weight
+                return None
+            return weight + self._pending_weight.pop(key, 0.0)
+
+    def _match(self, level: str, category: str, message_template: str):
+        for index, rule in enumerate(self.rules):
+            if 'category' in rule and rule['category'] != category:
+                continue
+            if 'level' in rule and rule['level'] != level:
+                continue
+            if 'message_template' in rule and rule['message_template'] != message_template:
+                continue
+            return index, rule
+        return None, None
@@ -0,0 +1,187 @@
+import copy
+import glob
+import os
+import threading
+import time
+from functools import partial
+from typing import Any, Dict, List, Optional
+from django.utils.module_loading import import_string
+from core.models.logger import LogEvent
+from core.services.log_buffer import LogEventBuffer, bulk_create_log_events
+from core.services.log_coalescing import CoalescedRepeats, apply_coalesced_repeats
+from core.services.log_export import log_event_to_dict, log_event_to_json
+from core.constants.logging import (
+    LOG_SINK_DATABASE,
+    LOG_SINK_JSONL,
+    JSONL_ACTIVE_FILENAME,
+    JSONL_ROTATED_FILENAME,
+    JSONL_ROTATED_GLOB,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+class LogSink:
+    """Destination for the LogEvents DatabaseLogger creates."""
+
+    def emit(self, entry: LogEvent) -> None:
+        raise NotImplementedError
+
+    def emit_many(self, entries: List[LogEvent]) -> None:
+        for entry in entries:
+            self.emit(entry)
+
+    def add_repeats(self, repeats: CoalescedRepeats) -> None:
+        """Add coalesced repeats to an entry emitted earlier; ignored by default."""
+
+    def flush(self) -> int:
+        return 0
+
+    def close(self) -> None:
+        self.flush()
+
+
+class DatabaseSink(LogSink):
+    """Writes events to the LogEvent table, directly or through a LogEventBuffer."""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.bulk_insert_method = config['BULK_INSERT_METHOD']
+        self.buffer = None
+        if config['BUFFERED']:
+            self.buffer = LogEventBuffer(
+                max_size=config['BUFFER_MAX_SIZE'],
+                batch_size=config['FLUSH_BATCH_SIZE'],
+                flush_interval=config['FLUSH_INTERVAL_SECONDS'],
+                overflow_policy=config['OVERFLOW_POLICY'],
+                writer=partial(bulk_create_log_events, method=self.bulk_insert_method),
+            )
+
+    def emit(self, entry: LogEvent) -> None:
+        if self.buffer is not None:
+            self.buffer.add(entry)
+        else:
+            entry.save(force_insert=True)
+
+    def emit_many(self, entries: List[LogEvent]) -> None:
+        if self.buffer is not None:
+            for entry in entries:
+                self.buffer.add(entry)
+        elif entries:
+            bulk_create_log_events(entries, method=self.bulk_insert_method)
+
+    def add_repeats(self, repeats: CoalescedRepeats) -> None:
+        # Queued behind the entry itself, so the UPDATE runs once its insert has committed.
+        if self.buffer is not None:
+            self.buffer.add(repeats)
+        else:
+            apply_coalesced_repeats([repeats])
+
+    def flush(self) -> int:
+        if self.buffer is None:
+            return 0
+        return self.buffer.flush()
+
+    def close(self) -> None:
+        if self.buffer is not None:
+            self.buffer.shutdown()
+
+
+class JsonLinesSink(LogSink):
+    """
+    Appends one JSON object per event to `<directory>/events.jsonl`.
+
+    Once the active file reaches `max_bytes` it is renamed to a timestamped
+    file and a new one is started; only the newest `backup_count` rotated
+    files are kept. Several processes may share the directory: writes use
+    O_APPEND, rotation happens under an advisory file lock, and a process
+    that finds the active file rotated underneath it simply reopens it.
+    Updated entries are appended again; read_log_files keeps the last line
+    for each id.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, backup_count: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.path = os.path.join(directory, JSONL_ACTIVE_FILENAME)
+        self._lock = threading.Lock()
+        self._fd = None
+        self._inode = None
+
+    def emit(self, entry: LogEvent) -> None:
+        line = (log_event_to_json(log_event_to_dict(entry)) + '\n').encode('utf-8')
+        with self._lock:
+            self._ensure_open()
+            if os.fstat(self._fd).st_size + len(line) > self.max_bytes:
+                self._rotate()
+            os.write(self._fd, line)
+
+    def add_repeats(self, repeats: CoalescedRepeats) -> None:
+        entry = copy.copy(repeats.entry)
+        entry.repeat_count += repeats.repeats
+        entry.sample_weight += repeats.weight
+        entry.last_seen = repeats.last_seen
+        self.emit(entry)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_fd()
+
+    def _ensure_open(self):
+        if self._fd is not None:
+            try:
+                if os.stat(self.path).st_ino == self._inode:
+                    return
+            except FileNotFoundError:
+                pass
+            self._close_fd()
+        os.makedirs(self.directory, exist_ok=True)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._inode = os.fstat(self._fd).st_ino
+
+    def _close_fd(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._inode = None
+
+    def _rotate(self):
+        lock_fd = os.open(f"{self.path}.lock", os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            # Another process may have rotated while we waited for the lock.
+            if os.stat(self.path).st_ino == self._inode:
+                rotated = os.path.join(self.directory, JSONL_ROTATED_FILENAME.format(suffix=time.time_ns()))
+                os.rename(self.path, rotated)
+                self._prune()
+        finally:
+            os.close(lock_fd)
+        self._close_fd()
+        self._ensure_open()
+
+    def _prune(self):
+        rotated = rotated_log_files(self.directory)
+        for path in rotated[:max(len(rotated) - self.backup_count, 0)]:
+            os.remove(path)
+
+
+def rotated_log_files(directory: str) -> List[str]:
+    """Rotated JSON-lines files in `directory`, oldest first."""
+    return sorted(glob.glob(os.path.join(directory, JSONL_ROTATED_GLOB)))
+
+
+def build_sink(config: Dict[str, Any], sink: Optional[str] = None) -> LogSink:
+    sink = sink or config['SINK']
+    if sink == LOG_SINK_DATABASE:
+        return DatabaseSink(config)
+    if sink == LOG_SINK_JSONL:
+        return JsonLinesSink(
+            directory=config['JSONL_DIRECTORY'],
+            max_bytes=config['JSONL_MAX_BYTES'],
+            backup_count=config['JSONL_BACKUP_COUNT'],
+        )
+    return import_string(sink)(config)
@@ -0,0 +1,62 @@
+import threading
+from typing import Dict, Optional
+from django.db import router, transaction
+from core.models.logger import LogMessageTemplate
+
+
+class MessageTemplateCache:
+    """
+    Process-wide map between message template text and LogMessageTemplate ids.
+
+    All templates of a database are loaded on first use. New templates are
+    created on demand, but only cached once the creating transaction commits,
+    so a rollback never leaves a dangling id in the cache.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, Dict[str, int]] = {}
+        self._texts: Dict[str, Dict[int, str]] = {}
+        self._lock = threading.Lock()
+
+    def _alias(self, using: Optional[str]) -> str:
+        return using or router.db_for_write(LogMessageTemplate)
+
+    def _load(self, alias: str) -> None:
+        if alias in self._ids:
+            return
+        rows = list(LogMessageTemplate.objects.using(alias).values_list('id', 'template'))
+        with self._lock:
+            self._ids.setdefault(alias, {}).update({text: pk for pk, text in rows})
+            self._texts.setdefault(alias, {}).update(dict(rows))
+
+    def _remember(self, alias: str, template_id: int, text: str) -> None:
+        with self._lock:
+            self._ids.setdefault(alias, {})[text] = template_id
+            self._texts.setdefault(alias, {})[template_id] = text
+
+    def resolve(self, text: str, using: Optional[str] = None) -> int:
+        alias = self._alias(using)
+        self._load(alias)
+        template_id = self._ids[alias].get(text)
+        if template_id is None:
+            template, _ = LogMessageTemplate.objects.using(alias).get_or_create(template=text)
+            template_id = template.pk
+            transaction.on_commit(lambda: self._remember(alias, template_id, text), using=alias)
+        return template_id
+
+    def text(self, template_id: int, using: Optional[str] = None) -> str:
+        alias = self._alias(using)
+        self._load(alias)
+        text = self._texts[alias].get(template_id)
+        if text is None:
+            text = LogMessageTemplate.objects.using(alias).values_list('template', flat=True).get(pk=template_id)
+            transaction.on_commit(lambda: self._remember(alias, template_id, text), using=alias)
+        return text
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+            self._texts.clear()
+
+
+template_cache = MessageTemplateCache()
@@ -1,15 +1,134 @@
 import logging
+import re
 import time
 import traceback
-from typing import Dict, Any, Optional
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional
+from django.conf import settings
 from core.models.logger import LogEvent, LogLevel, LogCategory
+from core.services.latency import LatencyRecorder, latency_recorder
+from core.services.log_coalescing import LogCoalescer
+from core.services.log_sampling import ClientRateLimiter, LogSampler
+from core.services.log_sinks import LogSink, build_sink
+from core.constants.logging import (
+    DB_LOGGER_SETTINGS_KEY,
+    DB_LOGGER_DEFAULTS,
+    LOG_CONTEXT_INDEXED_KEYS,
+    REQUEST_ID_META_KEY,
+    REQUEST_ID_PATTERN,
+)
+
+LEVEL_VALUES = {level: getattr(logging, level) for level in LogLevel.values}
+ERROR_LEVELS = (LogLevel.ERROR, LogLevel.CRITICAL)
+REQUEST_ID_RE = re.compile(REQUEST_ID_PATTERN)
+
+
+class RequestLogCollector:
+    """
+    Non-error events logged while one request is handled, in order. The
+    request logging middleware writes them as the `events` list of the
+    request's single record instead of one row each.
+    """
+
+    def __init__(self):
+        self.started_ns = time.perf_counter_ns()
+        self.events = []
+        self.level = LogLevel.DEBUG
+
+    def add(self, entry: LogEvent) -> None:
+        event = {
+            'offset_ms': (time.perf_counter_ns() - self.started_ns) // 1_000_000,
+            'level': entry.level,
+            'category': entry.category,
+            'message_template': entry.message_template,
+            'context_data': entry.context_data,
+        }
+        if entry.execution_time_ms is not None:
+            event['execution_time_ms'] = entry.execution_time_ms
+        if entry.sample_weight != 1:
+            event['sample_weight'] = entry.sample_weight
+        self.events.append(event)
+        if LEVEL_VALUES[entry.level] > LEVEL_VALUES[self.level]:
+            self.level = entry.level
+
+    def indexed_context(self) -> Dict[str, Any]:
+        """First value of each indexed context key, so LogEvent.objects.with_context finds the record."""
+        context = {}
+        for event in self.events:
+            for key in LOG_CONTEXT_INDEXED_KEYS:
+                if key in event['context_data']:
+                    context.setdefault(key, event['context_data'][key])
+        return context
+
+
+_request_log_collector: ContextVar[Optional[RequestLogCollector]] = ContextVar('request_log_collector', default=None)
+
+
+_request_context: ContextVar[Optional[Dict[str, Any]]] = ContextVar('request_context', default=None)
+
+
+@contextmanager
+def use_request_context(context: Dict[str, Any]):
+    """Attribute every event logged inside the block to `context` unless the call says otherwise."""
+    token = _request_context.set(context)
+    try:
+        yield context
+    finally:
+        _request_context.reset(token)
+
+
+def current_request_context() -> Dict[str, Any]:
+    return _request_context.get() or {}
+
+
+@contextmanager
+def collect_request_logs():
+    collector = RequestLogCollector()
+    token = _request_log_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _request_log_collector.reset(token)
+
+
+def get_logger_config(overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    config = {**DB_LOGGER_DEFAULTS, **getattr(settings, DB_LOGGER_SETTINGS_KEY, {})}
+    if overrides:
+        config.update(overrides)
+    return config
 
 
 class DatabaseLogger:
 
-    def __init__(self, logger_name: str = 'billdr'):
+    def __init__(
+        self,
+        logger_name: str = 'billdr',
+        config: Optional[Dict[str, Any]] = None,
+        sink: Optional[LogSink] = None
+    ):
         self.django_logger = logging.getLogger(logger_name)
         self.error_logger = logging.getLogger('billdr.errors')
+        self.config = get_logger_config(config)
+        self.sampler = LogSampler(self.config['SAMPLING_RULES'])
+        self.min_level = LEVEL_VALUES[self.config['MIN_LEVEL'].upper()]
+        self.min_levels = {
+            category: LEVEL_VALUES[level.upper()]
+            for category, level in self.config['MIN_LEVELS'].items()
+        }
+        self.coalescer = None
+        if self.config['COALESCE_WINDOW_SECONDS'] > 0:
+            self.coalescer = LogCoalescer(
+                self.config['COALESCE_WINDOW_SECONDS'],
+                self.config['COALESCE_MAX_KEYS'],
+                on_close=self._record_repeats,
+            )
+        self.sink = sink or build_sink(self.config)
+
+    def is_enabled(self, level: str, category: str) -> bool:
+        """Return whether events at `level` in `category` are persisted at all."""
+        return LEVEL_VALUES.get(level, logging.INFO) >= self.min_levels.get(category, self.min_level)
 
     def _create_log_entry(
         self,
@@ -17,7 +136,6 @@ class DatabaseLogger:
         category: str,
         message_template: str,
         context_data: Dict[str, Any],
-        formatted_message: str,
         user_id: Optional[str] = None,
         session_id: Optional[str] = None,
         ip_address: Optional[str] = None,
@@ -25,14 +143,14 @@ class DatabaseLogger:
         request_method: Optional[str] = None,
         execution_time_ms: Optional[int] = None,
         error_type: Optional[str] = None,
-        stack_trace: Optional[str] = None
+        stack_trace: Optional[str] = None,
+        sample_weight: float = 1.0
     ) -> LogEvent:
         try:
-            log_entry = LogEvent.objects.create(
+            log_entry = LogEvent(
                 level=level,
                 category=category,
                 message_template=message_template,
-                formatted_message=formatted_message,
                 context_data=context_data,
                 user_id=user_id,
                 session_id=session_id,
@@ -41,13 +159,35 @@ class DatabaseLogger:
                 request_method=request_method,
                 execution_time_ms=execution_time_ms,
                 error_type=error_type,
-                stack_trace=stack_trace
+                stack_trace=stack_trace,
+                sample_weight=sample_weight
             )
+            self._apply_request_context(log_entry)
+            collector = _request_log_collector.get()
+            if collector is not None and level not in ERROR_LEVELS:
+                collector.add(log_entry)
+                return log_entry
+            if self.coalescer is not None:
+                folded_into, closed = self.coalescer.add(log_entry)
+                self._record_repeats(closed)
+                if folded_into is not None:
+                    return folded_into
+            self.sink.emit(log_entry)
             return log_entry
         except Exception as e:
-            self.django_logger.error(f"Failed to create database log entry: {e}")
+            self.django_logger.error("Failed to create database log entry: %s", e)
             return None
 
+    @staticmethod
+    def _apply_request_context(entry: LogEvent) -> None:
+        for field, value in current_request_context().items():
+            if getattr(entry, field) is None:
+                setattr(entry, field, value)
+
+    def _record_repeats(self, closed) -> None:
+        for repeats in closed:
+            self.sink.add_repeats(repeats)
+
     def log(
         self,
         level: str,
@@ -61,28 +201,28 @@ class DatabaseLogger:
         request_method: Optional[str] = None,
         execution_time_ms: Optional[int] = None,
         error_type: Optional[str] = None,
-        include_stack_trace: bool = False
+        include_stack_trace: bool = False,
+        force: bool = False
     ) -> Optional[LogEvent]:
+        # Cheapest checks first: nothing below is paid for a disabled or sampled-out event.
+        # `force` skips both, for request records carrying a WARNING event that was already admitted.
+        sample_weight = 1.0
+        if not force:
+            if not self.is_enabled(level, category):
+                return None
+            sample_weight = self.sampler.admit(level, category, message_template)
+            if sample_weight is None:
+                return None
+
         if context_data is None:
             context_data = {}
 
-        # Format the message with context data
-        try:
-            formatted_message = message_template.format(**context_data)
-        except (KeyError, ValueError) as e:
-            formatted_message = f"{message_template} (formatting error: {e})"
-
         # Get stack trace if requested and level is ERROR or CRITICAL
         stack_trace = None
-        if include_stack_trace and level in [LogLevel.ERROR, LogLevel.CRITICAL]:
+        if include_stack_trace and level in ERROR_LEVELS:
             stack_trace = traceback.format_exc()
 
-        # Log to Django logger
-        django_log_level = getattr(logging, level, logging.INFO)
-        if level in [LogLevel.ERROR, LogLevel.CRITICAL]:
-            self.error_logger.log(django_log_level, formatted_message)
-        else:
-            self.django_logger.log(django_log_level, formatted_message)
+        self._log_to_python(level, message_template, context_data)
 
         # Create database entry
         return self._create_log_entry(
@@ -90,7 +230,6 @@ class DatabaseLogger:
             category=category,
             message_template=message_template,
             context_data=context_data,
-            formatted_message=formatted_message,
             user_id=user_id,
             session_id=session_id,
             ip_address=ip_address,
@@ -98,9 +237,68 @@ class DatabaseLogger:
             request_method=request_method,
             execution_time_ms=execution_time_ms,
             error_type=error_type,
-            stack_trace=stack_trace
+            stack_trace=stack_trace,
+            sample_weight=sample_weight
         )
 
+    def log_many(self, events: List[Dict[str, Any]], **request_context) -> List[LogEvent]:
+        """
+        Persist several events in one write, a single bulk insert with the
+        database sink, and return the entries written.
+
+        Each item of `events` takes `level`, `category`, `message_template`
+        and optionally `context_data` and `execution_time_ms`;
+        `request_context` (user_id, session_id, ip_address, ...) applies to all
+        of them, on top of the current request context. Level gates, sampling
+        and coalescing apply as for `log`, but the events always get rows of
+        their own, even inside a request.
+        """
+        entries = []
+        for event in events:
+            level, category, message_template = event['level'], event['category'], event['message_template']
+            if not self.is_enabled(level, category):
+                continue
+            sample_weight = self.sampler.admit(level, category, message_template)
+            if sample_weight is None:
+                continue
+
+            context_data = event.get('context_data') or {}
+            self._log_to_python(level, message_template, context_data)
+            entry = LogEvent(**{
+                **request_context,
+                'level': level,
+                'category': category,
+                'message_template': message_template,
+                'context_data': context_data,
+                'execution_time_ms': event.get('execution_time_ms'),
+                'sample_weight': sample_weight,
+            })
+            self._apply_request_context(entry)
+            if self.coalescer is not None:
+                folded_into, closed = self.coalescer.add(entry)
+                self._record_repeats(closed)
+                if folded_into is not None:
+                    continue
+            entries.append(entry)
+
+        try:
+            self.sink.emit_many(entries)
+        except Exception as e:
+            self.django_logger.error("Failed to create %d database log entries: %s", len(entries), e)
+            return []
+        return entries
+
+    def _log_to_python(self, level: str, message_template: str, context_data: Dict[str, Any]) -> None:
+        # Log to Django logger, formatting only when a handler will see it
+        django_log_level = LEVEL_VALUES.get(level, logging.INFO)
+        python_logger = self.error_logger if level in ERROR_LEVELS else self.django_logger
+        if python_logger.isEnabledFor(django_log_level):
+            try:
+                formatted_message = message_template.format(**context_data)
+            except Exception as e:
+                formatted_message = f"{message_template} (formatting error: {e})"
+            python_logger.log(django_log_level, formatted_message)
+
     def info(self, category: str, message_template: str, **kwargs) -> Optional[LogEvent]:
         """Log an info message."""
         return self.log(LogLevel.INFO, category, message_template, **kwargs)
@@ -111,6 +309,8 @@ class DatabaseLogger:
 
     def error(self, category: str, message_template: str, error: Exception = None, **kwargs) -> Optional[LogEvent]:
         """Log an error message."""
+        if not self.is_enabled(LogLevel.ERROR, category):
+            return None
         if error:
             kwargs['error_type'] = type(error).__name__
             kwargs['include_stack_trace'] = True
@@ -126,6 +326,8 @@ class DatabaseLogger:
 
     def critical(self, category: str, message_template: str, error: Exception = None, **kwargs) -> Optional[LogEvent]:
         """Log a critical message."""
+        if not self.is_enabled(LogLevel.CRITICAL, category):
+            return None
         if error:
             kwargs['error_type'] = type(error).__name__
             kwargs['include_stack_trace'] = True
@@ -135,6 +337,19 @@ class DatabaseLogger:
 
         return self.log(LogLevel.CRITICAL, category, message_template, **kwargs)
 
+    def flush(self) -> int:
+        """Close open coalescing windows and write any buffered log entries now."""
+        if self.coalescer is not None:
+            self._record_repeats(self.coalescer.close_all())
+        return self.sink.flush()
+
+    def shutdown(self) -> None:
+        """Flush and release the sink, e.g. stop the background flusher."""
+        if self.coalescer is not None:
+            self.coalescer.stop()
+            self._record_repeats(self.coalescer.close_all())
+        self.sink.close()
+
 
 class LoggerContextManager:
 
@@ -146,7 +361,8 @@ class LoggerContextManager:
         context_data: Optional[Dict[str, Any]] = None,
         user_id: Optional[str] = None,
         endpoint: Optional[str] = None,
-        request_method: Optional[str] = None
+        request_method: Optional[str] = None,
+        recorder: Optional[LatencyRecorder] = None
     ):
         self.logger = logger
         self.category = category
@@ -155,16 +371,21 @@ class LoggerContextManager:
         self.user_id = user_id
         self.endpoint = endpoint
         self.request_method = request_method
+        self.recorder = recorder or latency_recorder
         self.start_time = None
 
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        execution_time_ms = int((time.time() - self.start_time) * 1000)
+        duration_ns = time.perf_counter_ns() - self.start_time
+        self.recorder.record(self.operation_name, duration_ns)
+        execution_time_ms = duration_ns // 1_000_000
 
         if exc_type is None:
+            if not self.logger.is_enabled(LogLevel.INFO, self.category):
+                return
             self.logger.info(
                 category=self.category,
                 message_template=f"{self.operation_name} completed successfully",
@@ -175,6 +396,8 @@ class LoggerContextManager:
                 execution_time_ms=execution_time_ms
             )
         else:
+            if not self.logger.is_enabled(LogLevel.ERROR, self.category):
+                return
             self.logger.error(
                 category=self.category,
                 message_template=f"{self.operation_name} failed: {{error}}",
@@ -189,22 +412,62 @@ class LoggerContextManager:
 
 
 db_logger = DatabaseLogger()
+client_event_limiter = ClientRateLimiter(
+    db_logger.config['CLIENT_EVENTS_RATE_PER_SECOND'],
+    db_logger.config['CLIENT_EVENTS_BURST'],
+    db_logger.config['CLIENT_EVENTS_MAX_CLIENTS'],
+)
 
 
 def get_request_context(request) -> Dict[str, Any]:
+    """
+    The attribution fields of `request`, computed once per request by
+    RequestContextMiddleware. The user is only resolved when a session
+    cookie came with the request, so anonymous requests never load a session.
+    """
+    user_id = None
+    if settings.SESSION_COOKIE_NAME in request.COOKIES:
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            user_id = str(user.id)
     return {
+        'request_id': get_request_id(request),
         'ip_address': get_client_ip(request),
-        'session_id': request.session.session_key,
-        'user_id': str(request.user.id) if request.user.is_authenticated else None,
+        'session_id': request.session.session_key if hasattr(request, 'session') else None,
+        'user_id': user_id,
         'endpoint': request.path,
         'request_method': request.method
     }
 
 
+def get_request_id(request) -> str:
+    request_id = request.META.get(REQUEST_ID_META_KEY, '')
+    if REQUEST_ID_RE.fullmatch(request_id):
+        return request_id
+    return uuid.uuid4().hex
+
+
 def get_client_ip(request) -> str:
     x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
     if x_forwarded_for:
         ip = x_forwarded_for.split(',')[0]
     else:
         ip = request.META.get('REMOTE_ADDR')
-    return ip
\ No newline at end of file
+    return ip
+
+
+def get_rate_limit_key(request, trusted_proxies: int) -> str:
+    """
+    The client address to rate-limit `request` by.
+
+    The leftmost X-Forwarded-For entry is whatever the client sent, so only
+    the hops appended by our own `trusted_proxies` proxies are believed; with
+    none configured, or fewer hops than expected, the peer address is used.
+    """
+    remote_addr = request.META.get('REMOTE_ADDR') or ''
+    if trusted_proxies <= 0:
+        return remote_addr
+    hops = [hop.strip() for hop in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if hop.strip()]
+    if len(hops) < trusted_proxies:
+        return remote_addr
+    return hops[-trusted_proxies]
@@ -72,7 +72,7 @@ class PaymentService:
                 stripe_payment.update_from_stripe_payment_intent(stripe_payment_intent)
 
                 if not stripe_payment.is_successful():
-                    logger.warning(f"Payment {payment_intent_id} is not successful, skipping processing")
+                    logger.warning("Payment %s is not successful, skipping processing", payment_intent_id)
                     return None
 
                 invoice = stripe_payment.invoice
@@ -81,11 +81,11 @@ class PaymentService:
 
                 PaymentService._update_invoice_payment_status(invoice)
 
-                logger.info(f"Successfully processed payment {payment_intent_id} for invoice {invoice.number}")
+                logger.info("Successfully processed payment %s for invoice %s", payment_intent_id, invoice.number)
                 return stripe_payment
 
         except Exception as e:
-            logger.error(f"Failed to process payment {payment_intent_id}: {str(e)}")
+            logger.error("Failed to process payment %s: %s", payment_intent_id, e)
             raise
 
     @staticmethod
@@ -99,12 +99,12 @@ class PaymentService:
             
             if stripe_payment:
                 stripe_payment.update_from_stripe_payment_intent(stripe_payment_intent)
-                logger.info(f"Updated failed payment record for {payment_intent_id}")
+                logger.info("Updated failed payment record for %s", payment_intent_id)
             else:
-                logger.warning(f"No payment record found for failed payment {payment_intent_id}")
+                logger.warning("No payment record found for failed payment %s", payment_intent_id)
                 
         except Exception as e:
-            logger.error(f"Failed to process failed payment {payment_intent_id}: {str(e)}")
+            logger.error("Failed to process failed payment %s: %s", payment_intent_id, e)
 
     @staticmethod
     def _extract_invoice_id_from_metadata(metadata):
@@ -138,16 +138,16 @@ class PaymentService:
         invoice.save()
 
         logger.info(
-            f"Updated invoice {invoice.number}: "
-            f"paid {invoice.amount_paid}/{invoice.total_amount} {invoice.currency} "
-            f"(total payments: {total_payments}, total refunds: {total_refunds})"
+            "Updated invoice %s: paid %s/%s %s (total payments: %s, total refunds: %s)",
+            invoice.number, invoice.amount_paid, invoice.total_amount, invoice.currency,
+            total_payments, total_refunds,
         )
 
     @staticmethod
     def create_payment_intent(invoice, customer_email=None, payment_amount=None):
         try:
             if payment_amount is not None:
-                logger.info(f"Creating partial payment intent: ${payment_amount} for invoice {invoice.number}")
+                logger.info("Creating partial payment intent: $%s for invoice %s", payment_amount, invoice.number)
                 if payment_amount <= 0:
                     raise ValueError(PAYMENT_AMOUNT_MUST_BE_POSITIVE_MESSAGE)
                 if payment_amount > invoice.amount_due():
@@ -157,10 +157,10 @@ class PaymentService:
                 amount_to_pay = payment_amount
             else:
                 amount_to_pay = invoice.amount_due()
-                logger.info(f"Creating full payment intent: ${amount_to_pay} for invoice {invoice.number}")
+                logger.info("Creating full payment intent: $%s for invoice %s", amount_to_pay, invoice.number)
             
             amount_in_cents = int(amount_to_pay * 100)
-            logger.info(f"Stripe amount in cents: {amount_in_cents}")
+            logger.info("Stripe amount in cents: %s", amount_in_cents)
             
             payment_intent = stripe.PaymentIntent.create(
                 amount=amount_in_cents,
@@ -190,14 +190,14 @@ class PaymentService:
                 stripe_metadata=payment_intent.metadata,
             )
             
-            logger.info(f"Created payment intent {payment_intent.id} for invoice {invoice.number}")
+            logger.info("Created payment intent %s for invoice %s", payment_intent.id, invoice.number)
             return payment_intent
             
         except stripe.error.StripeError as e:
-            logger.error(f"Stripe error creating payment intent: {str(e)}")
+            logger.error("Stripe error creating payment intent: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Error creating payment intent: {str(e)}")
+            logger.error("Error creating payment intent: %s", e)
             raise
 
     @staticmethod
@@ -232,10 +232,10 @@ class PaymentService:
                         }
                     )
 
-                    logger.info(f"Created Stripe refund {stripe_refund.id} for payment {stripe_payment.stripe_payment_intent_id}")
+                    logger.info("Created Stripe refund %s for payment %s", stripe_refund.id, stripe_payment.stripe_payment_intent_id)
 
                 except stripe.error.StripeError as e:
-                    logger.error(f"Stripe error creating refund: {str(e)}")
+                    logger.error("Stripe error creating refund: %s", e)
 
 
                     if hasattr(e, 'code') and e.code == STRIPE_ERROR_CODE_CHARGE_ALREADY_REFUNDED:
@@ -262,14 +262,14 @@ class PaymentService:
 
                 PaymentService._update_invoice_payment_status(stripe_payment.invoice)
 
-                logger.info(f"Successfully processed refund for payment {stripe_payment.stripe_payment_intent_id}")
+                logger.info("Successfully processed refund for payment %s", stripe_payment.stripe_payment_intent_id)
                 return refund_payment
 
         except StripePayment.DoesNotExist:
-            logger.error(f"StripePayment {stripe_payment_id} not found")
+            logger.error("StripePayment %s not found", stripe_payment_id)
             raise ValueError(REFUND_INVALID_PAYMENT_MESSAGE)
         except Exception as e:
-            logger.error(f"Failed to process refund for payment {stripe_payment_id}: {str(e)}")
+            logger.error("Failed to process refund for payment %s: %s", stripe_payment_id, e)
             raise
 
     @staticmethod
@@ -281,7 +281,7 @@ class PaymentService:
                         stripe_payment_intent_id=payment_intent_id
                     )
                 except StripePayment.DoesNotExist:
-                    logger.error(f"StripePayment not found for payment_intent {payment_intent_id}")
+                    logger.error("StripePayment not found for payment_intent %s", payment_intent_id)
                     return None
 
                 invoice = stripe_payment.invoice
@@ -291,7 +291,7 @@ class PaymentService:
                 refund_id = refund_data.get('id')
                 refund_status = refund_data.get('status')
 
-                logger.info(f"Processing refund webhook: {refund_id} for ${refund_amount} (status: {refund_status})")
+                logger.info("Processing refund webhook: %s for $%s (status: %s)", refund_id, refund_amount, refund_status)
 
                 if refund_status == REFUND_STATUS_SUCCEEDED:
 
@@ -315,14 +315,14 @@ class PaymentService:
 
                     PaymentService._update_invoice_payment_status(invoice)
 
-                    logger.info(f"Successfully created refund record for payment {payment_intent_id}")
+                    logger.info("Successfully created refund record for payment %s", payment_intent_id)
                     return refund_payment
                 else:
-                    logger.info(f"Refund {refund_id} status is {refund_status}, not creating refund record")
+                    logger.info("Refund %s status is %s, not creating refund record", refund_id, refund_status)
 
                 return stripe_payment
 
         except Exception as e:
-            logger.error(f"Failed to process refund webhook for payment_intent {payment_intent_id}: {str(e)}")
+            logger.error("Failed to process refund webhook for payment_intent %s: %s", payment_intent_id, e)
             raise
 
@@ -0,0 +1,280 @@
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from core.models.logger import LogEvent, LogEventRollup, LogLevel, LogCategory
+from core.services.histogram import LogLinearHistogram
+from core.services.log_partitions import month_start, add_months, partition_name, is_partitioned
+from core.services.log_archive import load_manifest, write_columnar_gz
+from core.services.log_query import query_log_events
+from core.services.log_rollup import aggregate_events, hour_start
+from core.services.log_templates import template_cache
+from core.constants.logging import HEALTH_CHECK_SUCCESS
+
+
+def create_log_event(timestamp, **kwargs):
+    fields = {
+        'level': LogLevel.INFO,
+        'category': LogCategory.HEALTH,
+        'message_template': HEALTH_CHECK_SUCCESS,
+        'context_data': {'check_type': 'basic'},
+        'timestamp': timestamp,
+    }
+    fields.update(kwargs)
+    return LogEvent.objects.create(**fields)
+
+
+class LogPartitionHelpersTest(TestCase):
+    def test_month_start(self):
+        value = datetime(2025, 3, 17, 15, 42, 10, tzinfo=dt_timezone.utc)
+        self.assertEqual(month_start(value), datetime(2025, 3, 1, tzinfo=dt_timezone.utc))
+
+    def test_add_months_across_years(self):
+        month = datetime(2025, 11, 1, tzinfo=dt_timezone.utc)
+        self.assertEqual(add_months(month, 3), datetime(2026, 2, 1, tzinfo=dt_timezone.utc))
+        self.assertEqual(add_months(month, -11), datetime(2024, 12, 1, tzinfo=dt_timezone.utc))
+
+    def test_partition_name(self):
+        month = datetime(2025, 4, 1, tzinfo=dt_timezone.utc)
+        self.assertEqual(partition_name(month), "core_logevent_p202504")
+
+
+class ManageLogPartitionsCommandTest(TestCase):
+    def test_expired_rows_are_removed(self):
+        now = timezone.now()
+        old_event = create_log_event(now - timedelta(days=500))
+        recent_event = create_log_event(now)
+
+        out = StringIO()
+        call_command('manage_log_partitions', retention_months=12, stdout=out)
+
+        self.assertFalse(LogEvent.objects.filter(pk=old_event.pk).exists())
+        self.assertTrue(LogEvent.objects.filter(pk=recent_event.pk).exists())
+
+    def test_dry_run_keeps_rows(self):
+        old_event = create_log_event(timezone.now() - timedelta(days=500))
+
+        call_command('manage_log_partitions', retention_months=12, dry_run=True, stdout=StringIO())
+
+        self.assertTrue(LogEvent.objects.filter(pk=old_event.pk).exists())
+
+    def test_partitions_are_created_ahead(self):
+        if not is_partitioned(connection):
+            self.skipTest("LogEvent is only partitioned on PostgreSQL")
+
+        call_command('manage_log_partitions', months_ahead=2, stdout=StringIO())
+
+        future_month = add_months(month_start(timezone.now()), 2)
+        create_log_event(future_month + timedelta(days=3))
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT tableoid::regclass::text FROM core_logevent")
+            self.assertEqual(cursor.fetchone()[0], partition_name(future_month))
+
+
+class RollupLogEventsCommandTest(TestCase):
+    def setUp(self):
+        self.hour = hour_start(timezone.now()) - timedelta(hours=3)
+
+    def test_closed_hour_is_rolled_up(self):
+        create_log_event(self.hour + timedelta(minutes=5), category=LogCategory.API, endpoint='/api/invoices/', execution_time_ms=40)
+        create_log_event(self.hour + timedelta(minutes=9), category=LogCategory.API, endpoint='/api/invoices/', execution_time_ms=120)
+        create_log_event(self.hour + timedelta(minutes=30), sample_weight=20.0)
+        create_log_event(self.hour + timedelta(minutes=31), level=LogLevel.ERROR, category=LogCategory.API, endpoint='/api/invoices/')
+        current = create_log_event(timezone.now())
+
+        call_command('rollup_log_events', stdout=StringIO())
+
+        self.assertEqual(list(LogEvent.objects.values_list('pk', flat=True)), [current.pk])
+        api = LogEventRollup.objects.get(bucket=self.hour, category=LogCategory.API, level=LogLevel.INFO)
+        self.assertEqual(api.endpoint, '/api/invoices/')
+        self.assertEqual(api.row_count, 2)
+        self.assertEqual(api.timed_count, 2)
+        self.assertEqual(api.execution_time_sum_ms, 160)
+        self.assertEqual(api.execution_time_max_ms, 120)
+        self.assertEqual(len(LogLinearHistogram.from_dict(api.execution_time_sketch)), 2)
+        health = LogEventRollup.objects.get(bucket=self.hour, category=LogCategory.HEALTH)
+        self.assertEqual((health.row_count, health.event_count, health.error_count), (1, 20.0, 0))
+        errors = LogEventRollup.objects.get(bucket=self.hour, level=LogLevel.ERROR)
+        self.assertEqual(errors.error_count, 1)
+
+    def test_late_rows_merge_into_existing_rollup(self):
+        create_log_event(self.hour + timedelta(minutes=1), execution_time_ms=10)
+        call_command('rollup_log_events', stdout=StringIO())
+        create_log_event(self.hour + timedelta(minutes=2), execution_time_ms=30)
+        call_command('rollup_log_events', stdout=StringIO())
+
+        rollup = LogEventRollup.objects.get(bucket=self.hour)
+        self.assertEqual(rollup.row_count, 2)
+        self.assertEqual(rollup.execution_time_max_ms, 30)
+        self.assertEqual(len(LogLinearHistogram.from_dict(rollup.execution_time_sketch)), 2)
+
+    def test_rows_committed_during_rollup_are_kept(self):
+        create_log_event(self.hour + timedelta(minutes=1))
+        late = []
+
+        def aggregate_then_receive_late_row(events):
+            totals = aggregate_events(events)
+            if not late:
+                late.append(create_log_event(self.hour + timedelta(minutes=2)))
+            return totals
+
+        with patch('core.services.log_rollup.aggregate_events', side_effect=aggregate_then_receive_late_row):
+            call_command('rollup_log_events', max_hours=1, stdout=StringIO())
+
+        self.assertEqual(list(LogEvent.objects.values_list('pk', flat=True)), [late[0].pk])
+        self.assertEqual(LogEventRollup.objects.get(bucket=self.hour).row_count, 1)
+
+        call_command('rollup_log_events', stdout=StringIO())
+        self.assertEqual(LogEventRollup.objects.get(bucket=self.hour).row_count, 2)
+
+    def test_archive_dir_keeps_raw_rows(self):
+        event = create_log_event(self.hour + timedelta(minutes=1))
+
+        with tempfile.TemporaryDirectory() as archive_dir:
+            call_command('rollup_log_events', archive_dir=archive_dir, stdout=StringIO())
+            paths = [os.path.join(root, name) for root, _, names in os.walk(archive_dir) for name in names]
+            self.assertEqual(len(paths), 1)
+            with gzip.open(paths[0], 'rt', encoding='utf-8') as handle:
+                rows = [json.loads(line) for line in handle]
+
+        self.assertEqual([row['id'] for row in rows], [str(event.pk)])
+        self.assertFalse(LogEvent.objects.exists())
+
+
+class ExportLogEventsCommandTest(TestCase):
+    def test_exports_range_to_gzipped_ndjson(self):
+        now = timezone.now()
+        inside = create_log_event(now - timedelta(minutes=5), category=LogCategory.API)
+        create_log_event(now - timedelta(minutes=6), category=LogCategory.HEALTH)
+        create_log_event(now - timedelta(days=2), category=LogCategory.API)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'export.ndjson.gz')
+            call_command(
+                'export_log_events', path,
+                since=(now - timedelta(hours=1)).isoformat(), until=now.isoformat(),
+                category=LogCategory.API, stdout=StringIO(),
+            )
+            with gzip.open(path, 'rt', encoding='utf-8') as handle:
+                rows = [json.loads(line) for line in handle]
+
+        self.assertEqual([row['id'] for row in rows], [str(inside.pk)])
+
+    def test_exports_to_bare_filename(self):
+        now = timezone.now()
+        event = create_log_event(now - timedelta(minutes=5))
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.addCleanup(os.chdir, os.getcwd())
+            os.chdir(directory)
+            call_command(
+                'export_log_events', 'export.ndjson.gz',
+                since=(now - timedelta(hours=1)).isoformat(), until=now.isoformat(), stdout=StringIO(),
+            )
+            with gzip.open(os.path.join(directory, 'export.ndjson.gz'), 'rt', encoding='utf-8') as handle:
+                rows = [json.loads(line) for line in handle]
+
+        self.assertEqual([row['id'] for row in rows], [str(event.pk)])
+
+
+class ArchiveLogEventsCommandTest(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.archive_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.archive_dir)
+
+    def archive(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('archive_log_events', archive_dir=self.archive_dir, stdout=StringIO())
+
+    def test_old_days_move_to_archive_files(self):
+        old = [
+            create_log_event(self.now - timedelta(days=40), level=LogLevel.ERROR),
+            create_log_event(self.now - timedelta(days=41), category=LogCategory.API),
+        ]
+        recent = create_log_event(self.now - timedelta(days=2))
+
+        self.archive()
+
+        self.assertEqual(list(LogEvent.objects.values_list('pk', flat=True)), [recent.pk])
+        manifest = load_manifest(self.archive_dir)
+        self.assertEqual([entry['rows'] for entry in manifest], [1, 1])
+        self.assertEqual(manifest[0]['categories'], [LogCategory.API])
+        self.assertEqual(manifest[1]['levels'], [LogLevel.ERROR])
+
+        events, _ = query_log_events({}, page_size=10, archive_dir=self.archive_dir)
+        self.assertEqual([event.pk for event in events], [recent.pk, old[0].pk, old[1].pk])
+        self.assertEqual(events[1].timestamp, old[0].timestamp)
+        self.assertEqual(events[1].message_template, HEALTH_CHECK_SUCCESS)
+
+    def test_rows_committed_during_the_write_are_kept(self):
+        day = self.now - timedelta(days=40)
+        archived = create_log_event(day)
+        late = []
+        # The late row's template id is cached by a commit callback the test runs but then rolls back.
+        self.addCleanup(template_cache.clear)
+
+        def write_then_receive_late_row(path, rows):
+            entry = write_columnar_gz(path, rows)
+            if not late:
+                late.append(create_log_event(day))
+            return entry
+
+        with patch('core.services.log_archive.write_columnar_gz', side_effect=write_then_receive_late_row):
+            self.archive()
+
+        self.assertFalse(LogEvent.objects.exists())
+        self.assertEqual([entry['rows'] for entry in load_manifest(self.archive_dir)], [1, 1])
+        events, _ = query_log_events({}, page_size=10, archive_dir=self.archive_dir)
+        self.assertEqual({event.pk for event in events}, {archived.pk, late[0].pk})
+        self.assertFalse(LogEvent.objects.exists())
+
+    def test_query_pages_through_hot_and_archived_rows(self):
+        old = [create_log_event(self.now - timedelta(days=40, minutes=i)) for i in range(3)]
+        self.archive()
+        recent = [create_log_event(self.now - timedelta(minutes=i)) for i in range(2)]
+
+        seen = []
+        cursor = None
+        while True:
+            events, cursor = query_log_events(
+                {'category': LogCategory.HEALTH}, page_size=2, cursor=cursor, archive_dir=self.archive_dir,
+            )
+            seen.extend(event.pk for event in events)
+            if not cursor:
+                break
+
+        self.assertEqual(seen, [event.pk for event in recent + old])
+        since_recent, _ = query_log_events(
+            {'since': self.now - timedelta(days=1)}, page_size=10, archive_dir=self.archive_dir,
+        )
+        self.assertEqual(len(since_recent), 2)
+
+
+    def test_hot_window_queries_do_not_read_the_archive(self):
+        create_log_event(self.now - timedelta(days=40))
+        self.archive()
+        recent = [create_log_event(self.now - timedelta(minutes=i)) for i in range(3)]
+
+        with patch('core.services.log_archive.read_columnar_gz') as read_columnar_gz:
+            events, _ = query_log_events(
+                {'since': self.now - timedelta(days=1)}, page_size=10,
+                archive_dir=self.archive_dir, archive_after_days=30,
+            )
+            self.assertEqual([event.pk for event in events], [event.pk for event in recent])
+
+            events, cursor = query_log_events({}, page_size=2, archive_dir=self.archive_dir, archive_after_days=30)
+            self.assertEqual([event.pk for event in events], [event.pk for event in recent[:2]])
+            self.assertIsNotNone(cursor)
+        read_columnar_gz.assert_not_called()
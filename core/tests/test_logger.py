@@ -0,0 +1,661 @@
+import csv
+import tempfile
+import threading
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, SimpleTestCase, override_settings
+from django.utils import timezone
+from core.db_routers import LogRouter
+from core.models.invoices import Invoice
+from core.models.logger import ErrorGroup, LogEvent, LogEventRollup, LogMessageTemplate, LogLevel, LogCategory
+from core.services.histogram import LogLinearHistogram, bucket_index, bucket_bounds
+from core.services.log_buffer import LogEventBuffer, bulk_create_log_events
+from core.services.error_groups import fingerprint_stack_trace, normalize_stack_trace
+from core.services.log_coalescing import CoalescedRepeats, LogCoalescer
+from core.services.log_indexes import ensure_context_columns
+from core.services.log_copy import log_events_to_csv
+from core.services.latency import LatencyRecorder
+from core.services.log_files import read_log_files
+from core.services.log_query import EQUALITY_FILTERS
+from core.services.log_rollup import hour_start
+from core.services.log_analytics import log_analytics
+from core.services.log_sampling import ClientRateLimiter, LogSampler
+from core.services.log_sinks import JsonLinesSink, rotated_log_files
+from core.services.log_templates import MessageTemplateCache
+from core.services.logger_service import DatabaseLogger, LoggerContextManager, use_request_context
+from core.constants.logging import (
+    HEALTH_CHECK_SUCCESS,
+    HEALTH_CHECK_FAILED,
+    API_REQUEST_RECEIVED,
+    LOG_BUFFER_OVERFLOW_DROP_OLDEST,
+    LOG_BUFFER_OVERFLOW_DROP_NEWEST,
+    LOG_BUFFER_OVERFLOW_FLUSH,
+    LOG_BULK_INSERT_COPY,
+    LOG_ANALYTICS_WINDOW_DAY,
+)
+
+
+def make_log_event(check_type='basic'):
+    return LogEvent(
+        level=LogLevel.INFO,
+        category=LogCategory.HEALTH,
+        message_template=HEALTH_CHECK_SUCCESS,
+        context_data={'check_type': check_type},
+    )
+
+
+class LogEventBufferTest(TestCase):
+    def make_buffer(self, **kwargs):
+        options = {
+            'max_size': 3,
+            'batch_size': 2,
+            'flush_interval': 60,
+            'start_flusher': False,
+        }
+        options.update(kwargs)
+        return LogEventBuffer(**options)
+
+    def test_flush_writes_entries_in_batches(self):
+        buffer = self.make_buffer(max_size=10)
+        for i in range(5):
+            buffer.add(make_log_event(str(i)))
+
+        self.assertEqual(LogEvent.objects.count(), 0)
+        self.assertEqual(buffer.flush(), 5)
+        self.assertEqual(LogEvent.objects.count(), 5)
+        self.assertEqual(len(buffer), 0)
+
+    def test_drop_oldest_policy(self):
+        buffer = self.make_buffer(overflow_policy=LOG_BUFFER_OVERFLOW_DROP_OLDEST)
+        for i in range(5):
+            buffer.add(make_log_event(str(i)))
+
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.dropped_count, 2)
+        buffer.flush()
+        check_types = sorted(e.context_data['check_type'] for e in LogEvent.objects.all())
+        self.assertEqual(check_types, ['2', '3', '4'])
+
+    def test_drop_newest_policy(self):
+        buffer = self.make_buffer(overflow_policy=LOG_BUFFER_OVERFLOW_DROP_NEWEST)
+        results = [buffer.add(make_log_event(str(i))) for i in range(5)]
+
+        self.assertEqual(results, [True, True, True, False, False])
+        buffer.flush()
+        check_types = sorted(e.context_data['check_type'] for e in LogEvent.objects.all())
+        self.assertEqual(check_types, ['0', '1', '2'])
+
+    def test_flush_policy_writes_synchronously_when_full(self):
+        buffer = self.make_buffer(overflow_policy=LOG_BUFFER_OVERFLOW_FLUSH)
+        for i in range(4):
+            buffer.add(make_log_event(str(i)))
+
+        self.assertEqual(LogEvent.objects.count(), 4)
+        self.assertEqual(buffer.dropped_count, 0)
+
+    def test_failed_write_does_not_raise(self):
+        def failing_writer(entries):
+            raise RuntimeError("database unavailable")
+
+        buffer = self.make_buffer(writer=failing_writer)
+        buffer.add(make_log_event())
+        self.assertEqual(buffer.flush(), 0)
+        self.assertEqual(len(buffer), 0)
+
+    def test_shutdown_flushes_remaining_entries(self):
+        buffer = self.make_buffer()
+        buffer.add(make_log_event())
+        buffer.shutdown()
+        self.assertEqual(LogEvent.objects.count(), 1)
+
+
+class LogSamplerTest(TestCase):
+    def test_unmatched_events_are_kept_with_unit_weight(self):
+        sampler = LogSampler([{'category': LogCategory.HEALTH, 'sample_rate': 0}])
+        self.assertEqual(sampler.admit(LogLevel.INFO, LogCategory.API, API_REQUEST_RECEIVED), 1.0)
+
+    def test_sample_rate_sets_weight(self):
+        sampler = LogSampler([{'category': LogCategory.HEALTH, 'sample_rate': 0.25}])
+        weights = [
+            sampler.admit(LogLevel.INFO, LogCategory.HEALTH, HEALTH_CHECK_SUCCESS)
+            for _ in range(400)
+        ]
+        kept = [w for w in weights if w is not None]
+
+        self.assertTrue(0 < len(kept) < 400)
+        self.assertTrue(all(w == 4.0 for w in kept))
+
+    def test_errors_are_always_kept(self):
+        sampler = LogSampler([{'category': LogCategory.HEALTH, 'sample_rate': 0}])
+        self.assertIsNone(sampler.admit(LogLevel.INFO, LogCategory.HEALTH, HEALTH_CHECK_SUCCESS))
+        self.assertEqual(sampler.admit(LogLevel.ERROR, LogCategory.HEALTH, HEALTH_CHECK_FAILED), 1.0)
+        self.assertEqual(sampler.admit(LogLevel.CRITICAL, LogCategory.HEALTH, HEALTH_CHECK_FAILED), 1.0)
+
+    @patch('core.services.log_sampling.time.monotonic')
+    def test_rate_limit_carries_suppressed_weight(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        sampler = LogSampler([{'category': LogCategory.API, 'rate_per_second': 1, 'burst': 2}])
+        weights = [
+            sampler.admit(LogLevel.INFO, LogCategory.API, API_REQUEST_RECEIVED)
+            for _ in range(5)
+        ]
+        self.assertEqual(weights, [1.0, 1.0, None, None, None])
+
+        mock_monotonic.return_value = 101.0
+        self.assertEqual(sampler.admit(LogLevel.INFO, LogCategory.API, API_REQUEST_RECEIVED), 4.0)
+
+    def test_rules_match_on_level_and_template(self):
+        sampler = LogSampler([
+            {'category': LogCategory.HEALTH, 'level': LogLevel.DEBUG, 'sample_rate': 0},
+            {'message_template': API_REQUEST_RECEIVED, 'sample_rate': 0},
+        ])
+        self.assertIsNone(sampler.admit(LogLevel.DEBUG, LogCategory.HEALTH, HEALTH_CHECK_SUCCESS))
+        self.assertEqual(sampler.admit(LogLevel.INFO, LogCategory.HEALTH, HEALTH_CHECK_SUCCESS), 1.0)
+        self.assertIsNone(sampler.admit(LogLevel.INFO, LogCategory.USER, API_REQUEST_RECEIVED))
+
+
+
+class ClientRateLimiterTest(TestCase):
+    @patch('core.services.log_sampling.time.monotonic')
+    def test_buckets_are_per_client(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        limiter = ClientRateLimiter(rate_per_second=1, burst=5, max_clients=2)
+
+        self.assertTrue(limiter.consume('10.0.0.1', 5))
+        self.assertFalse(limiter.consume('10.0.0.1'))
+        self.assertTrue(limiter.consume('10.0.0.2', 5))
+
+        limiter.consume('10.0.0.3')
+        # The least recently seen client was evicted and starts over with a full bucket.
+        self.assertTrue(limiter.consume('10.0.0.1', 5))
+
+class LogLinearHistogramTest(TestCase):
+    def test_bucket_bounds_contain_value(self):
+        for value in [0, 7, 31, 32, 33, 250, 1000, 123456]:
+            lower, upper = bucket_bounds(bucket_index(value))
+            self.assertLessEqual(lower, value)
+            self.assertGreaterEqual(upper, value)
+            self.assertLessEqual(upper - lower, max(value, 1) / 16)
+
+    def test_quantiles_and_merge(self):
+        first = LogLinearHistogram()
+        first.record_many(range(1, 51))
+        second = LogLinearHistogram()
+        second.record_many(range(51, 101))
+
+        merged = LogLinearHistogram.from_dict(first.to_dict()).merge(second)
+
+        self.assertEqual(len(merged), 100)
+        self.assertAlmostEqual(merged.quantile(0.5), 50, delta=2)
+        self.assertAlmostEqual(merged.quantile(0.99), 99, delta=4)
+        self.assertIsNone(LogLinearHistogram().quantile(0.5))
+
+
+class LatencyRecorderTest(TestCase):
+    def test_report_percentiles_per_operation(self):
+        recorder = LatencyRecorder()
+        for ms in range(1, 101):
+            recorder.record('invoice_lookup', ms * 1_000_000)
+        recorder.record('payment', 5_000_000)
+
+        report = recorder.report()['operations']
+
+        self.assertEqual(report['invoice_lookup']['count'], 100)
+        self.assertAlmostEqual(report['invoice_lookup']['p50_ms'], 50, delta=2)
+        self.assertAlmostEqual(report['invoice_lookup']['p99_ms'], 99, delta=4)
+        self.assertEqual(report['invoice_lookup']['max_ms'], 100)
+        self.assertEqual(report['payment']['count'], 1)
+
+    def test_context_manager_records_without_persisting(self):
+        recorder = LatencyRecorder()
+        logger = DatabaseLogger(config={'SAMPLING_RULES': [], 'MIN_LEVELS': {LogCategory.DATABASE: 'ERROR'}})
+
+        with self.assertNumQueries(0):
+            with LoggerContextManager(logger, LogCategory.DATABASE, "Invoice lookup", recorder=recorder):
+                pass
+
+        self.assertEqual(recorder.report()['operations']['Invoice lookup']['count'], 1)
+
+
+class MessageTemplateCacheTest(TestCase):
+    def test_events_share_one_template_row(self):
+        make_log_event('basic').save()
+        make_log_event('database').save()
+
+        self.assertEqual(LogMessageTemplate.objects.filter(template=HEALTH_CHECK_SUCCESS).count(), 1)
+        event = LogEvent.objects.get(context_data__check_type='database')
+        self.assertEqual(event.message_template, HEALTH_CHECK_SUCCESS)
+        self.assertEqual(event.formatted_message, "Health check passed: database")
+
+    def test_formatting_error_is_reported_on_read(self):
+        event = make_log_event()
+        event.message_template = HEALTH_CHECK_FAILED
+        event.save()
+
+        self.assertIn("formatting error", LogEvent.objects.get(pk=event.pk).formatted_message)
+
+        event = make_log_event()
+        event.message_template = "Health check passed: {check_type.missing}"
+        self.assertIn("formatting error", event.formatted_message)
+
+    def test_ids_are_cached_only_after_commit(self):
+        cache = MessageTemplateCache()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            template_id = cache.resolve(HEALTH_CHECK_SUCCESS)
+        with self.assertNumQueries(0):
+            self.assertEqual(cache.resolve(HEALTH_CHECK_SUCCESS), template_id)
+            self.assertEqual(cache.text(template_id), HEALTH_CHECK_SUCCESS)
+
+        try:
+            with transaction.atomic():
+                cache.resolve(HEALTH_CHECK_FAILED)
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        self.assertNotIn(HEALTH_CHECK_FAILED, cache._ids['default'])
+
+
+class LogCoalescerTest(TestCase):
+    def make_event(self, seconds, check_type='basic'):
+        event = make_log_event(check_type)
+        event.timestamp = self.start + timedelta(seconds=seconds)
+        return event
+
+    def setUp(self):
+        self.start = timezone.now()
+        self.coalescer = LogCoalescer(window_seconds=10)
+
+    def test_repeats_fold_into_first_entry_until_window_closes(self):
+        first = self.make_event(0)
+        self.assertEqual(self.coalescer.add(first), (None, []))
+        self.assertEqual(self.coalescer.add(self.make_event(3)), (first, []))
+        self.assertEqual(self.coalescer.add(self.make_event(4, 'database')), (None, []))
+        self.assertEqual(self.coalescer.add(self.make_event(6)), (first, []))
+
+        later = self.make_event(12)
+        folded_into, closed = self.coalescer.add(later)
+
+        self.assertIsNone(folded_into)
+        self.assertEqual(closed, [CoalescedRepeats(first, 2, 2.0, self.start + timedelta(seconds=6))])
+        self.assertEqual((first.repeat_count, first.sample_weight), (1, 1.0))
+        self.assertEqual(self.coalescer.close_all(), [])
+
+    def test_idle_windows_are_closed_by_the_sweeper(self):
+        swept = []
+        done = threading.Event()
+        coalescer = LogCoalescer(window_seconds=0.05, on_close=lambda closed: (swept.extend(closed), done.set()))
+        self.addCleanup(coalescer.stop)
+        first = make_log_event()
+        first.timestamp = timezone.now()
+        repeat = make_log_event()
+        repeat.timestamp = first.timestamp
+
+        coalescer.add(first)
+        coalescer.add(repeat)
+
+        self.assertTrue(done.wait(5))
+        self.assertEqual([(repeats.entry, repeats.repeats) for repeats in swept], [(first, 1)])
+
+    def test_timed_events_are_never_folded(self):
+        first = self.make_event(0)
+        first.execution_time_ms = 5
+        repeat = self.make_event(1)
+        repeat.execution_time_ms = 5
+
+        self.assertEqual(self.coalescer.add(first), (None, []))
+        self.assertEqual(self.coalescer.add(repeat), (None, []))
+
+
+class LogEventContextSearchTest(TestCase):
+    def setUp(self):
+        for index in range(3):
+            event = make_log_event()
+            event.context_data = {'invoice_id': f'inv-{index}', 'attempt': index % 2}
+            event.save()
+
+    def test_with_context_matches_all_pairs(self):
+        self.assertEqual(LogEvent.objects.with_context(invoice_id='inv-1').get().context_data['attempt'], 1)
+        self.assertEqual(LogEvent.objects.with_context(attempt=0).count(), 2)
+        self.assertFalse(LogEvent.objects.with_context(invoice_id='inv-1', attempt=0).exists())
+
+    def test_indexed_key_uses_an_index(self):
+        queryset = LogEvent.objects.with_context(invoice_id='inv-1')
+        if connection.vendor == 'sqlite':
+            self.assertIn('core_logevent_context_invoice_id_idx', queryset.explain())
+        elif connection.vendor == 'postgresql':
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                self.assertIn('context_data_idx', queryset.explain())
+        else:
+            self.skipTest("No context index strategy for this database")
+
+    def test_ensure_context_columns_is_idempotent(self):
+        self.assertEqual(ensure_context_columns(connection), [])
+
+
+class LogQueryIndexTest(SimpleTestCase):
+    def test_every_equality_filter_has_a_timestamp_index(self):
+        indexed = {tuple(index.fields) for index in LogEvent._meta.indexes}
+        for field in EQUALITY_FILTERS:
+            self.assertIn((field, 'timestamp'), indexed)
+
+
+class LogAnalyticsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.now = timezone.now()
+        self.hour = hour_start(self.now) - timedelta(hours=3)
+
+    def create_event(self, timestamp, **kwargs):
+        event = make_log_event()
+        event.timestamp = timestamp
+        for field, value in kwargs.items():
+            setattr(event, field, value)
+        event.save()
+        return event
+
+    def series_for(self, result, bucket):
+        return next(row['series'] for row in result if row['bucket'] == bucket)
+
+    def test_rollups_and_raw_rows_combine(self):
+        self.create_event(self.hour + timedelta(minutes=5), category=LogCategory.API, endpoint='/api/invoices/', execution_time_ms=40)
+        self.create_event(self.hour + timedelta(minutes=6), level=LogLevel.ERROR, category=LogCategory.API, endpoint='/api/invoices/')
+        call_command('rollup_log_events', stdout=StringIO())
+        self.create_event(self.hour + timedelta(minutes=50), category=LogCategory.API, endpoint='/api/invoices/', execution_time_ms=400)
+        self.create_event(self.now, category=LogCategory.HEALTH)
+
+        result = log_analytics(LOG_ANALYTICS_WINDOW_DAY, category=LogCategory.API, now=self.now)
+
+        self.assertEqual(len(result), 25)
+        [api] = self.series_for(result, self.hour)
+        self.assertEqual(api['endpoint'], '/api/invoices/')
+        self.assertEqual((api['events'], api['errors']), (3, 1))
+        self.assertAlmostEqual(api['error_rate'], 1 / 3)
+        self.assertLess(api['p50'], api['p99'])
+        self.assertEqual(self.series_for(result, hour_start(self.now)), [])
+
+    def test_repeated_raw_timings_keep_their_weight(self):
+        for minutes, execution_time_ms in ((5, 40), (6, 400), (7, 400), (8, 400)):
+            self.create_event(self.hour + timedelta(minutes=minutes), execution_time_ms=execution_time_ms)
+
+        [health] = self.series_for(log_analytics(LOG_ANALYTICS_WINDOW_DAY, now=self.now), self.hour)
+
+        self.assertEqual(health['events'], 4)
+        self.assertEqual(health['p50'], LogLinearHistogram({bucket_index(400): 1}).quantile(0.5))
+
+    def test_closed_buckets_are_served_from_cache(self):
+        self.create_event(self.hour + timedelta(minutes=5))
+        log_analytics(LOG_ANALYTICS_WINDOW_DAY, now=self.now)
+        self.create_event(self.hour + timedelta(minutes=6))
+        self.create_event(self.now)
+
+        result = log_analytics(LOG_ANALYTICS_WINDOW_DAY, now=self.now)
+
+        self.assertEqual(self.series_for(result, self.hour)[0]['events'], 1)
+        self.assertEqual(self.series_for(result, hour_start(self.now))[0]['events'], 1)
+
+
+class ErrorGroupTest(TestCase):
+    TRACE = (
+        'Traceback (most recent call last):\n'
+        '  File "{base_dir}/core/services/payment_service.py", line {line}, in refund\n'
+        '    raise ValueError(message)\n'
+        'ValueError: Payment {payment_id} was not found\n'
+    )
+
+    def format_trace(self, line, payment_id):
+        return self.TRACE.format(base_dir=settings.BASE_DIR, line=line, payment_id=payment_id)
+
+    def make_error_event(self, line=10, payment_id='a'):
+        event = make_log_event()
+        event.level = LogLevel.ERROR
+        event.error_type = 'ValueError'
+        event.stack_trace = self.format_trace(line, payment_id)
+        return event
+
+    def test_fingerprint_ignores_line_numbers_and_messages(self):
+        first = self.format_trace(10, 'a')
+        second = self.format_trace(42, 'b')
+
+        self.assertEqual(normalize_stack_trace(first), "core/services/payment_service.py:refund\nValueError")
+        self.assertEqual(fingerprint_stack_trace(first, 'ValueError'), fingerprint_stack_trace(second, 'ValueError'))
+        self.assertNotEqual(fingerprint_stack_trace(first, 'ValueError'), fingerprint_stack_trace(first, 'KeyError'))
+
+    def test_occurrences_share_one_group(self):
+        self.make_error_event(line=10).save()
+        bulk_create_log_events([self.make_error_event(line=11, payment_id=str(i)) for i in range(3)])
+
+        group = ErrorGroup.objects.get()
+        self.assertEqual(group.occurrence_count, 4)
+        self.assertIn('line 10', group.stack_trace)
+        self.assertEqual(LogEvent.objects.filter(error_group=group).count(), 4)
+        self.assertEqual(LogEvent.objects.first().stack_trace, group.stack_trace)
+
+
+class LogCopyTest(TestCase):
+    def test_csv_distinguishes_null_from_empty_text(self):
+        event = make_log_event('say "hi", bye')
+        event.endpoint = ''
+        event.execution_time_ms = 12
+        fields = [LogEvent._meta.get_field(name) for name in ('endpoint', 'user_id', 'context_data', 'execution_time_ms')]
+
+        row = log_events_to_csv([event], fields).getvalue()
+
+        self.assertEqual(row.split(',', 2)[:2], ['""', ''])
+        parsed = next(csv.reader([row.rstrip('\n')]))
+        self.assertEqual(parsed[2], '{"check_type": "say \\"hi\\", bye"}')
+        self.assertEqual(parsed[3], '12')
+
+    def test_copy_round_trips_rows(self):
+        if connection.vendor != 'postgresql':
+            self.skipTest("COPY is only available on PostgreSQL")
+
+        events = [make_log_event('basic'), make_log_event('database')]
+        bulk_create_log_events(events, method=LOG_BULK_INSERT_COPY)
+
+        stored = LogEvent.objects.get(pk=events[1].pk)
+        self.assertEqual(stored.context_data, {'check_type': 'database'})
+        self.assertEqual(stored.message_template, HEALTH_CHECK_SUCCESS)
+        self.assertIsNone(stored.user_id)
+        self.assertFalse(events[0]._state.adding)
+
+
+class JsonLinesSinkTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def make_logger(self, **kwargs):
+        options = {'max_bytes': 1024 * 1024, 'backup_count': 5}
+        options.update(kwargs)
+        sink = JsonLinesSink(self.directory.name, **options)
+        self.addCleanup(sink.close)
+        return DatabaseLogger(config={'SAMPLING_RULES': [], 'MIN_LEVEL': 'DEBUG'}, sink=sink)
+
+    def test_events_bypass_the_database(self):
+        logger = self.make_logger()
+        with self.assertNumQueries(0):
+            logger.info(LogCategory.HEALTH, HEALTH_CHECK_SUCCESS, context_data={'check_type': 'basic'})
+            logger.error(LogCategory.HEALTH, HEALTH_CHECK_FAILED, context_data={'check_type': 'db', 'error': 'down'})
+
+        rows = list(read_log_files(self.directory.name))
+        self.assertEqual([row['level'] for row in rows], [LogLevel.INFO, LogLevel.ERROR])
+        self.assertEqual(rows[0]['message_template'], HEALTH_CHECK_SUCCESS)
+        self.assertFalse(LogEvent.objects.exists())
+
+    def test_rotation_keeps_backup_count_files(self):
+        logger = self.make_logger(max_bytes=600, backup_count=2)
+        for i in range(20):
+            logger.info(LogCategory.HEALTH, HEALTH_CHECK_SUCCESS, context_data={'check_type': str(i)})
+
+        self.assertEqual(len(rotated_log_files(self.directory.name)), 2)
+        rows = list(read_log_files(self.directory.name))
+        self.assertEqual(rows[-1]['context_data'], {'check_type': '19'})
+        self.assertEqual(
+            [int(row['context_data']['check_type']) for row in rows],
+            list(range(20 - len(rows), 20)),
+        )
+
+    def test_reader_filters(self):
+        logger = self.make_logger()
+        logger.info(LogCategory.HEALTH, HEALTH_CHECK_SUCCESS, context_data={'check_type': 'basic'})
+        logger.info(LogCategory.API, API_REQUEST_RECEIVED, context_data={'method': 'GET', 'endpoint': '/', 'ip_address': None})
+
+        rows = list(read_log_files(self.directory.name, {'category': LogCategory.API}))
+        self.assertEqual([row['category'] for row in rows], [LogCategory.API])
+        self.assertEqual(list(read_log_files(self.directory.name, {'since': timezone.now() + timedelta(minutes=1)})), [])
+
+    def test_reader_returns_coalesced_events_once(self):
+        sink = JsonLinesSink(self.directory.name, max_bytes=1024 * 1024, backup_count=5)
+        logger = DatabaseLogger(
+            config={'SAMPLING_RULES': [], 'MIN_LEVEL': 'DEBUG', 'COALESCE_WINDOW_SECONDS': 60}, sink=sink,
+        )
+        self.addCleanup(logger.shutdown)
+        for _ in range(3):
+            logger.info(LogCategory.HEALTH, HEALTH_CHECK_SUCCESS, context_data={'check_type': 'basic'})
+        logger.info(LogCategory.API, API_REQUEST_RECEIVED, context_data={'method': 'GET', 'endpoint': '/', 'ip_address': None})
+        logger.flush()
+
+        rows = list(read_log_files(self.directory.name))
+        self.assertEqual([row['category'] for row in rows], [LogCategory.HEALTH, LogCategory.API])
+        self.assertEqual(rows[0]['repeat_count'], 3)
+        [health] = read_log_files(self.directory.name, {'category': LogCategory.HEALTH})
+        self.assertEqual(health['repeat_count'], 3)
+
+
+class LogRouterTest(SimpleTestCase):
+    router = LogRouter()
+
+    def test_default_alias_leaves_routing_alone(self):
+        self.assertEqual(self.router.db_for_write(LogEvent), 'default')
+        self.assertIsNone(self.router.db_for_write(Invoice))
+        self.assertIsNone(self.router.allow_migrate('default', 'core', model_name='logevent'))
+
+    @override_settings(DB_LOGGER={'DATABASE_ALIAS': 'logs'})
+    def test_log_models_use_dedicated_alias(self):
+        for model in (LogEvent, LogEventRollup, LogMessageTemplate):
+            self.assertEqual(self.router.db_for_read(model), 'logs')
+            self.assertEqual(self.router.db_for_write(model), 'logs')
+        self.assertIsNone(self.router.db_for_write(Invoice))
+
+    @override_settings(DB_LOGGER={'DATABASE_ALIAS': 'logs'})
+    def test_tables_are_migrated_to_one_side_only(self):
+        self.assertTrue(self.router.allow_migrate('logs', 'core', model_name='logevent'))
+        self.assertFalse(self.router.allow_migrate('default', 'core', model_name='logevent'))
+        self.assertFalse(self.router.allow_migrate('logs', 'core', model_name='invoice'))
+        self.assertFalse(self.router.allow_migrate('logs', 'auth', model_name='user'))
+        self.assertIsNone(self.router.allow_migrate('default', 'core', model_name='invoice'))
+
+
+class DatabaseLoggerTest(TestCase):
+    def make_logger(self, **config):
+        options = {'BUFFERED': False, 'SAMPLING_RULES': []}
+        options.update(config)
+        return DatabaseLogger(config=options)
+
+    def test_unbuffered_log_writes_immediately(self):
+        logger = self.make_logger()
+        entry = logger.info(
+            category=LogCategory.HEALTH,
+            message_template=HEALTH_CHECK_SUCCESS,
+            context_data={'check_type': 'basic'}
+        )
+
+        self.assertTrue(LogEvent.objects.filter(pk=entry.pk).exists())
+        self.assertEqual(entry.formatted_message, "Health check passed: basic")
+
+    def test_request_context_fills_unset_fields(self):
+        logger = self.make_logger()
+        with use_request_context({'request_id': 'req-1', 'user_id': '7', 'endpoint': '/api/invoices/'}):
+            entry = logger.info(
+                category=LogCategory.HEALTH,
+                message_template=HEALTH_CHECK_SUCCESS,
+                context_data={'check_type': 'basic'},
+                endpoint='/health/',
+            )
+        outside = logger.info(category=LogCategory.HEALTH, message_template=HEALTH_CHECK_SUCCESS, context_data={'check_type': 'x'})
+
+        entry.refresh_from_db()
+        self.assertEqual((entry.request_id, entry.user_id, entry.endpoint), ('req-1', '7', '/health/'))
+        self.assertIsNone(outside.request_id)
+
+    @patch.object(LogEventBuffer, '_ensure_flusher')
+    def test_buffered_log_defers_write_until_flush(self, mock_ensure_flusher):
+        logger = self.make_logger(BUFFERED=True, FLUSH_BATCH_SIZE=100)
+        logger.info(
+            category=LogCategory.HEALTH,
+            message_template=HEALTH_CHECK_SUCCESS,
+            context_data={'check_type': 'basic'}
+        )
+
+        self.assertEqual(LogEvent.objects.count(), 0)
+        mock_ensure_flusher.assert_called_once()
+        self.assertEqual(logger.flush(), 1)
+        self.assertEqual(LogEvent.objects.count(), 1)
+
+    def test_sampled_out_event_is_not_persisted(self):
+        logger = self.make_logger(
+            SAMPLING_RULES=[{'category': LogCategory.HEALTH, 'sample_rate': 0}]
+        )
+        entry = logger.info(
+            category=LogCategory.HEALTH,
+            message_template=HEALTH_CHECK_SUCCESS,
+            context_data={'check_type': 'basic'}
+        )
+
+        self.assertIsNone(entry)
+        self.assertEqual(LogEvent.objects.count(), 0)
+
+    def test_events_below_min_level_are_skipped_without_queries(self):
+        logger = self.make_logger(MIN_LEVEL='INFO', MIN_LEVELS={LogCategory.HEALTH: 'WARNING'})
+
+        with self.assertNumQueries(0), patch.object(logger.django_logger, 'log') as mock_log:
+            self.assertIsNone(logger.debug(LogCategory.API, API_REQUEST_RECEIVED))
+            self.assertIsNone(logger.info(LogCategory.HEALTH, HEALTH_CHECK_SUCCESS, context_data={'check_type': 'basic'}))
+        mock_log.assert_not_called()
+
+        self.assertIsNotNone(logger.warning(LogCategory.HEALTH, HEALTH_CHECK_FAILED, context_data={'check_type': 'basic', 'error': 'down'}))
+        self.assertIsNotNone(logger.info(LogCategory.API, API_REQUEST_RECEIVED, context_data={'method': 'GET', 'endpoint': '/', 'ip_address': None}))
+
+    def test_context_manager_skips_disabled_category(self):
+        logger = self.make_logger(MIN_LEVELS={LogCategory.DATABASE: 'ERROR'})
+
+        with LoggerContextManager(logger, LogCategory.DATABASE, "Invoice lookup"):
+            pass
+        self.assertEqual(LogEvent.objects.count(), 0)
+
+        with self.assertRaises(ValueError):
+            with LoggerContextManager(logger, LogCategory.DATABASE, "Invoice lookup"):
+                raise ValueError("boom")
+        self.assertEqual(LogEvent.objects.get().formatted_message, "Invoice lookup failed: boom")
+
+    def test_identical_events_are_coalesced_into_one_row(self):
+        logger = self.make_logger(COALESCE_WINDOW_SECONDS=60)
+        self.addCleanup(logger.shutdown)
+        entries = [
+            logger.warning(LogCategory.HEALTH, HEALTH_CHECK_FAILED, context_data={'check_type': 'basic', 'error': 'down'})
+            for _ in range(3)
+        ]
+
+        self.assertIs(entries[2], entries[0])
+        logger.flush()
+        event = LogEvent.objects.get()
+        self.assertEqual((event.repeat_count, event.sample_weight), (3, 3.0))
+        self.assertIsNotNone(event.last_seen)
+
+    def test_repeats_of_a_buffered_entry_are_added_after_its_insert(self):
+        logger = self.make_logger(COALESCE_WINDOW_SECONDS=60, BUFFERED=True)
+        logger.sink.buffer.start_flusher = False
+        self.addCleanup(logger.shutdown)
+        for _ in range(3):
+            logger.warning(LogCategory.HEALTH, HEALTH_CHECK_FAILED, context_data={'check_type': 'basic', 'error': 'down'})
+
+        logger.flush()
+        event = LogEvent.objects.get()
+        self.assertEqual((event.repeat_count, event.sample_weight), (3, 3.0))
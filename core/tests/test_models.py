@@ -1,10 +1,15 @@
 from decimal import Decimal
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from datetime import timedelta
+from unittest import mock
 from core.models.user import BusinessOwner, Customer
-from core.models.invoices import Invoice
+from core.models.invoices import Invoice, InvoiceNumberSequence
 from core.models.payments import StripePayment
+from core.models.logger import LogEvent
+from core.services.invoice_numbers import assign_invoice_numbers, reserve_invoice_numbers
 from core.constants.db import (
     INVOICE_STATUS_SENT,
     INVOICE_STATUS_PAID,
@@ -13,6 +18,7 @@ from core.constants.db import (
     PAYMENT_STATUS_REQUIRES_PAYMENT_METHOD,
     DEFAULT_CURRENCY,
 )
+from core.constants.logging import INVOICE_CREATED, INVOICE_STATUS_CHANGED
 
 
 class BusinessOwnerModelTest(TestCase):
@@ -89,6 +95,52 @@ class InvoiceModelTest(TestCase):
         expected_start = f"INV-{year}{month:02d}-"
         self.assertTrue(self.invoice.number.startswith(expected_start))
 
+    def test_invoice_numbers_follow_month_sequence(self):
+        year, month = self.now.year, self.now.month
+        second = Invoice.objects.create(
+            owner=self.business_owner,
+            customer=self.customer,
+            issued_at=self.now,
+            due_date=self.now + timedelta(days=30),
+            total_amount=Decimal("500.00")
+        )
+        self.assertEqual(self.invoice.number, f"INV-{year}{month:02d}-0001")
+        self.assertEqual(second.number, f"INV-{year}{month:02d}-0002")
+
+        with CaptureQueriesContext(connection) as queries:
+            numbers = reserve_invoice_numbers(year, month, 3)
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(numbers, [f"INV-{year}{month:02d}-{n:04d}" for n in (3, 4, 5)])
+        self.assertEqual(
+            InvoiceNumberSequence.objects.get(year=year, month=month).last_value, 5
+        )
+
+    def test_reserve_falls_back_to_row_lock_without_returning(self):
+        year, month = self.now.year, self.now.month
+        with mock.patch.object(
+            type(connection.features), 'can_return_rows_from_bulk_insert',
+            new_callable=mock.PropertyMock, return_value=False,
+        ):
+            numbers = reserve_invoice_numbers(year, month, 2)
+        self.assertEqual(numbers, [f"INV-{year}{month:02d}-{n:04d}" for n in (2, 3)])
+        self.assertEqual(
+            InvoiceNumberSequence.objects.get(year=year, month=month).last_value, 3
+        )
+
+    def test_assign_invoice_numbers_reserves_per_month(self):
+        earlier = self.now - timedelta(days=40)
+        invoices = [
+            Invoice(owner=self.business_owner, customer=self.customer, issued_at=issued_at,
+                    due_date=issued_at + timedelta(days=30), total_amount=Decimal("10.00"))
+            for issued_at in (self.now, earlier, self.now)
+        ]
+        assign_invoice_numbers(invoices)
+
+        current = f"INV-{self.now.year}{self.now.month:02d}-"
+        self.assertEqual(invoices[0].number, current + "0002")
+        self.assertEqual(invoices[2].number, current + "0003")
+        self.assertEqual(invoices[1].number, f"INV-{earlier.year}{earlier.month:02d}-0001")
+
     def test_invoice_str_method(self):
         expected_str = f"Invoice {self.invoice.number} - {self.invoice.issued_at}"
         self.assertEqual(str(self.invoice), expected_str)
@@ -122,6 +174,38 @@ class InvoiceModelTest(TestCase):
         self.invoice.save()
         self.assertFalse(self.invoice.is_partially_paid())
 
+    def test_unchanged_invoice_is_not_written(self):
+        invoice = Invoice.objects.get(pk=self.invoice.pk)
+        invoice.total_amount = Decimal("1000")
+
+        with self.assertNumQueries(0):
+            invoice.save()
+
+    def test_assigned_deferred_field_is_written(self):
+        invoice = Invoice.objects.only('id').get(pk=self.invoice.pk)
+        invoice.status = INVOICE_STATUS_PAID
+        invoice.save()
+
+        self.invoice.refresh_from_db()
+        self.assertEqual(self.invoice.status, INVOICE_STATUS_PAID)
+
+    def test_save_updates_changed_fields_and_logs_status_change(self):
+        self.assertTrue(LogEvent.objects.filter(template__template=INVOICE_CREATED).exists())
+        invoice = Invoice.objects.get(pk=self.invoice.pk)
+        invoice.status = INVOICE_STATUS_PAID
+
+        with CaptureQueriesContext(connection) as queries:
+            invoice.save()
+
+        invoice_queries = [query['sql'] for query in queries if '"core_invoice"' in query['sql']]
+        self.assertEqual(len(invoice_queries), 1)
+        self.assertTrue(invoice_queries[0].startswith('UPDATE'))
+        self.assertIn('"status"', invoice_queries[0])
+        self.assertNotIn('"total_amount"', invoice_queries[0])
+        event = LogEvent.objects.get(template__template=INVOICE_STATUS_CHANGED)
+        self.assertEqual(event.context_data['old_status'], INVOICE_STATUS_SENT)
+        self.assertEqual(invoice.get_dirty_fields(), {})
+
     def test_invoice_ordering(self):
         earlier_invoice = Invoice.objects.create(
             owner=self.business_owner,
@@ -2,6 +2,7 @@ from django.test import TestCase
 from django.http import JsonResponse
 from core.utils.custom_response import custom_response
 from core.utils.serializer import get_serializer_data
+from core.utils.log_handlers import QueuedRotatingFileHandler, SharedRotatingFileHandler
 import json
 from core.models.user import BusinessOwner, Customer
 from core.models.invoices import Invoice
@@ -18,6 +19,10 @@ from core.constants.api import (
 from decimal import Decimal
 from django.utils import timezone
 from datetime import timedelta
+from unittest.mock import patch
+import logging
+import os
+import tempfile
 
 
 class CustomResponseTest(TestCase):
@@ -224,4 +229,59 @@ class ModelMethodsTest(TestCase):
             total_amount=Decimal("750.00")
         )
 
-        self.assertTrue(re.match(pattern, invoice2.number))
\ No newline at end of file
+        self.assertTrue(re.match(pattern, invoice2.number))
+
+
+class QueuedRotatingFileHandlerTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'billdr.log')
+        self.handler = QueuedRotatingFileHandler(self.path, maxBytes=200, backupCount=2)
+        self.handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+        self.addCleanup(self.handler.close)
+        self.logger = logging.getLogger('billdr.tests.queued')
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def test_records_are_written_by_the_listener_after_stop(self):
+        self.logger.warning("Payment %s failed", 'pi_123')
+        self.handler.stop()
+
+        with open(self.path) as handle:
+            self.assertEqual(handle.read(), "WARNING Payment pi_123 failed\n")
+
+    def test_files_rotate_by_size(self):
+        for index in range(20):
+            self.logger.warning("Record number %s with some padding", index)
+        self.handler.stop()
+
+        self.assertTrue(os.path.exists(f"{self.path}.1"))
+        self.assertFalse(os.path.exists(f"{self.path}.3"))
+
+    def test_listener_restarts_in_forked_child(self):
+        self.logger.warning("parent")
+        parent_listener = self.handler._listener
+
+        with patch('core.utils.log_handlers.os.getpid', return_value=os.getpid() + 1):
+            self.logger.warning("child")
+            self.assertIsNot(self.handler._listener, parent_listener)
+            self.handler.stop()
+        parent_listener.stop()
+
+    def test_writers_follow_a_rotation_by_another_process(self):
+        first = SharedRotatingFileHandler(self.path, maxBytes=30, backupCount=2)
+        second = SharedRotatingFileHandler(self.path, maxBytes=30, backupCount=2)
+        self.addCleanup(first.close)
+        self.addCleanup(second.close)
+        record = lambda message: logging.makeLogRecord({'msg': message})
+
+        first.emit(record("first before rotation"))
+        second.emit(record("second rotates"))
+        first.emit(record("first after"))
+
+        with open(f"{self.path}.1") as handle:
+            self.assertEqual(handle.read(), "first before rotation\n")
+        with open(self.path) as handle:
+            self.assertEqual(handle.read(), "second rotates\nfirst after\n")
@@ -1,4 +1,6 @@
+import gzip
 import json
+import uuid
 from decimal import Decimal
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
@@ -22,7 +24,9 @@ class MockEvent(dict):
             if key == 'data' and isinstance(value, dict) and 'object' in value:
                 value['object'] = MockPaymentIntent(value['object'])
             setattr(self, key, value)
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework.test import APIClient
@@ -30,6 +34,8 @@ from rest_framework import status
 from core.models.user import BusinessOwner, Customer
 from core.models.invoices import Invoice
 from core.models.payments import StripePayment
+from core.models.logger import ErrorGroup, LogEvent, LogLevel, LogCategory
+from django.contrib.auth.models import User
 from core.constants.db import (
     INVOICE_STATUS_SENT,
     PAYMENT_STATUS_SUCCEEDED,
@@ -38,13 +44,30 @@ from core.constants.db import (
 from core.constants.api import (
     HTTP_200_OK,
     HTTP_201_CREATED,
+    HTTP_202_ACCEPTED,
     HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
+    HTTP_411_LENGTH_REQUIRED,
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    HTTP_429_TOO_MANY_REQUESTS,
     BUSINESS_OWNER_RETRIEVAL_SUCCESS_MESSAGE,
     CUSTOMER_RETRIEVAL_SUCCESS_MESSAGE,
     INVOICE_RETRIEVAL_SUCCESS_MESSAGE,
     INVOICE_NOT_FOUND_MESSAGE,
+    LOG_EVENTS_MAX_PAGE_SIZE,
 )
+from core.constants.logging import (
+    HEALTH_CHECK_SUCCESS,
+    API_REQUEST_COMPLETED,
+    INVOICES_BULK_CREATED,
+    LATENCY_UNMATCHED_ROUTE,
+    USER_RETRIEVED,
+    CLIENT_EVENT_REPORTED,
+)
+from core.services.latency import LatencyRecorder
+from core.services.log_sampling import ClientRateLimiter, LogSampler
+from core.services.logger_service import db_logger
+from core.services.log_buffer import bulk_create_log_events
 
 
 class BaseViewTest(TestCase):
@@ -201,6 +224,56 @@ class InvoiceViewTest(BaseViewTest):
         self.assertEqual(response_data['code'], HTTP_201_CREATED)
         self.assertEqual(response_data['data']['total_amount'], "2000.00")
 
+    def bulk_items(self, customers):
+        return [
+            {
+                'owner': str(self.business_owner.id),
+                'customer': str(customer.id),
+                'due_date': (self.now + timedelta(days=30)).isoformat(),
+                'total_amount': '150.00',
+            }
+            for customer in customers
+        ]
+
+    def test_bulk_create_invoices(self):
+        second = Customer.objects.create(name="Jane Doe", email="jane@example.com")
+        LogEvent.objects.all().delete()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                '/api/invoices/bulk/', self.bulk_items([self.customer, second, second]), format='json'
+            )
+
+        self.assertEqual(response.status_code, HTTP_201_CREATED)
+        created = response.json()['data']
+        self.assertEqual([item['customer_name'] for item in created], ["John Doe", "Jane Doe", "Jane Doe"])
+        prefix = f"INV-{self.now.year}{self.now.month:02d}-"
+        self.assertEqual([item['invoice_number'] for item in created], [prefix + "0002", prefix + "0003", prefix + "0004"])
+        self.assertEqual(Invoice.objects.count(), 4)
+
+        sql = [query['sql'] for query in queries]
+        self.assertEqual(sum('FROM "core_businessowner"' in statement for statement in sql), 1)
+        self.assertEqual(sum('FROM "core_customer"' in statement for statement in sql), 1)
+        self.assertEqual(sum(statement.startswith('INSERT INTO "core_invoice"') for statement in sql), 1)
+
+        event = LogEvent.objects.get(category=LogCategory.API)
+        self.assertEqual(
+            [(row['message_template'], row['context_data']['invoice_count']) for row in event.context_data['events']],
+            [(INVOICES_BULK_CREATED, 3)],
+        )
+
+    def test_bulk_create_invoices_reports_item_errors(self):
+        items = self.bulk_items([self.customer, self.customer])
+        items[1]['customer'] = str(uuid.uuid4())
+
+        response = self.client.post('/api/invoices/bulk/', items, format='json')
+
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+        errors = response.json()['data']
+        self.assertEqual(errors[0], {})
+        self.assertIn('customer', errors[1])
+        self.assertEqual(Invoice.objects.count(), 1)
+
     def test_delete_invoice(self):
         response = self.client.delete(f'/api/invoices/{self.invoice.id}/')
         self.assertEqual(response.status_code, HTTP_200_OK)
@@ -394,4 +467,335 @@ class WebhookViewTest(BaseViewTest):
             HTTP_STRIPE_SIGNATURE='test_signature'
         )
 
-        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
\ No newline at end of file
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+
+
+class RequestLoggingMiddlewareTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        sampler = patch.object(db_logger, 'sampler', LogSampler([]))
+        sampler.start()
+        self.addCleanup(sampler.stop)
+        self.recorder = LatencyRecorder()
+        recorder = patch('core.middleware.request_logging.latency_recorder', self.recorder)
+        recorder.start()
+        self.addCleanup(recorder.stop)
+
+    def api_events(self):
+        return LogEvent.objects.filter(category=LogCategory.API)
+
+    def test_one_record_per_request(self):
+        response = self.client.get('/api/business-owners/')
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        event = self.api_events().get()
+        self.assertEqual(event.message_template, API_REQUEST_COMPLETED)
+        self.assertEqual(event.level, LogLevel.INFO)
+        self.assertEqual(event.context_data['status_code'], HTTP_200_OK)
+        self.assertEqual(event.endpoint, '/api/business-owners/')
+        self.assertEqual(event.request_method, 'GET')
+        self.assertIsNotNone(event.execution_time_ms)
+        self.assertEqual(self.recorder.report()['operations']['GET /api/business-owners/']['count'], 1)
+
+    def test_client_errors_are_warnings_keyed_by_route(self):
+        response = self.client.get(f'/api/invoices/{uuid.uuid4()}/')
+
+        self.assertEqual(response.status_code, HTTP_404_NOT_FOUND)
+        self.assertEqual(self.api_events().get().level, LogLevel.WARNING)
+        self.assertIn('GET /api/invoices/<uuid:invoice_id>/', self.recorder.report()['operations'])
+
+    def test_unmatched_paths_share_one_latency_key(self):
+        self.client.get('/api/no-such-endpoint/')
+        self.client.get(f'/api/{uuid.uuid4()}/')
+
+        operations = self.recorder.report()['operations']
+        self.assertEqual(list(operations), [f'GET {LATENCY_UNMATCHED_ROUTE}'])
+        self.assertEqual(operations[f'GET {LATENCY_UNMATCHED_ROUTE}']['count'], 2)
+
+    def test_excluded_paths_are_not_logged(self):
+        self.client.get('/health/')
+
+        self.assertFalse(self.api_events().exists())
+        self.assertEqual(self.recorder.report()['operations'], {})
+
+    def test_events_logged_during_request_fold_into_its_record(self):
+        owner = BusinessOwner.objects.create(company_name="Folded Co")
+        LogEvent.objects.all().delete()
+
+        response = self.client.get(f'/api/business-owners/{owner.id}/')
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        event = LogEvent.objects.get()
+        self.assertEqual(event.category, LogCategory.API)
+        self.assertEqual(event.context_data['user_type'], 'BusinessOwner')
+        self.assertEqual(
+            [(row['category'], row['message_template']) for row in event.context_data['events']],
+            [(LogCategory.USER, USER_RETRIEVED)],
+        )
+
+    def test_records_are_sampled_unless_they_hold_a_warning(self):
+        owner = BusinessOwner.objects.create(company_name="Sampled Co")
+        rules = [{'category': LogCategory.API, 'message_template': API_REQUEST_COMPLETED, 'sample_rate': 0}]
+        LogEvent.objects.all().delete()
+
+        with patch.object(db_logger, 'sampler', LogSampler(rules)):
+            self.client.get(f'/api/business-owners/{owner.id}/')
+            self.assertFalse(LogEvent.objects.exists())
+
+            with patch.object(db_logger, 'info', db_logger.warning):
+                self.client.get(f'/api/business-owners/{owner.id}/')
+        event = self.api_events().get()
+        self.assertEqual(event.level, LogLevel.WARNING)
+        self.assertEqual(
+            [(row['level'], row['message_template']) for row in event.context_data['events']],
+            [(LogLevel.WARNING, USER_RETRIEVED)],
+        )
+
+    def test_error_events_are_written_on_their_own(self):
+        response = self.client.post('/api/business-owners/', {}, format='json')
+
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+        self.assertEqual(LogEvent.objects.get(category=LogCategory.USER).level, LogLevel.ERROR)
+        self.assertNotIn('events', self.api_events().get().context_data)
+
+    def test_request_context_attributes_every_event(self):
+        response = self.client.post(
+            '/api/business-owners/', {}, format='json', HTTP_X_REQUEST_ID='req-42', REMOTE_ADDR='10.9.8.7',
+        )
+
+        self.assertEqual(response['X-Request-ID'], 'req-42')
+        error = LogEvent.objects.get(category=LogCategory.USER)
+        record = self.api_events().get()
+        for event in (error, record):
+            self.assertEqual(event.request_id, 'req-42')
+            self.assertEqual(event.ip_address, '10.9.8.7')
+            self.assertEqual(event.endpoint, '/api/business-owners/')
+
+    def test_malformed_request_id_is_replaced(self):
+        response = self.client.get('/api/business-owners/', HTTP_X_REQUEST_ID='not an id!')
+
+        self.assertRegex(response['X-Request-ID'], r'^[0-9a-f]{32}$')
+        self.assertEqual(self.api_events().get().request_id, response['X-Request-ID'])
+
+
+class LogEventsViewTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = User.objects.create_user('admin', password='secret', is_staff=True)
+        self.client.force_authenticate(self.admin)
+        self.now = timezone.now()
+
+    def create_events(self, count, timestamp=None, **kwargs):
+        events = [
+            LogEvent(
+                level=kwargs.get('level', LogLevel.INFO),
+                category=kwargs.get('category', LogCategory.HEALTH),
+                message_template=HEALTH_CHECK_SUCCESS,
+                context_data={'check_type': str(i)},
+                timestamp=timestamp or self.now - timedelta(seconds=i),
+            )
+            for i in range(count)
+        ]
+        bulk_create_log_events(events)
+        return events
+
+    def test_requires_admin(self):
+        self.client.force_authenticate(None)
+        response = self.client.get('/api/logs/')
+        self.assertIn(response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+
+    def test_cursor_pages_through_tied_timestamps(self):
+        events = self.create_events(5, timestamp=self.now) + self.create_events(3)
+
+        seen = []
+        cursor = None
+        while True:
+            params = {'category': LogCategory.HEALTH, 'page_size': 3}
+            if cursor:
+                params['cursor'] = cursor
+            data = self.client.get('/api/logs/', params).json()['data']
+            seen.extend(row['id'] for row in data['results'])
+            cursor = data['next_cursor']
+            if not cursor:
+                break
+
+        self.assertEqual(len(seen), len(events))
+        self.assertEqual(set(seen), {str(event.pk) for event in events})
+
+    def test_filters_and_rendered_message(self):
+        self.create_events(2)
+        self.create_events(1, level=LogLevel.ERROR)
+
+        response = self.client.get('/api/logs/', {'level': LogLevel.ERROR})
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        results = response.json()['data']['results']
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['formatted_message'], "Health check passed: 0")
+
+    def test_page_size_is_capped(self):
+        self.create_events(LOG_EVENTS_MAX_PAGE_SIZE + 1)
+
+        response = self.client.get('/api/logs/', {'page_size': 10000})
+
+        self.assertEqual(len(response.json()['data']['results']), LOG_EVENTS_MAX_PAGE_SIZE)
+        self.assertIsNotNone(response.json()['data']['next_cursor'])
+
+    @patch('core.views.logs.latency_recorder')
+    def test_latency_report(self, mock_recorder):
+        mock_recorder.report.return_value = {'pid': 1, 'operations': {'Invoice lookup': {'count': 3}}}
+
+        response = self.client.get('/api/logs/latency/')
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(response.json()['data']['operations']['Invoice lookup']['count'], 3)
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/logs/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+
+    def test_error_groups_are_ranked_by_occurrences(self):
+        rare = ErrorGroup.objects.create(fingerprint='a' * 64, error_type='KeyError', stack_trace='KeyError', occurrence_count=2)
+        common = ErrorGroup.objects.create(fingerprint='b' * 64, error_type='ValueError', stack_trace='ValueError', occurrence_count=9)
+
+        response = self.client.get('/api/logs/errors/')
+        self.assertEqual([row['id'] for row in response.json()['data']], [common.pk, rare.pk])
+
+        response = self.client.get('/api/logs/errors/', {'error_type': 'KeyError', 'limit': 1})
+        self.assertEqual([row['fingerprint'] for row in response.json()['data']], [rare.fingerprint])
+
+    def test_log_analytics(self):
+        self.create_events(2)
+        self.create_events(1, level=LogLevel.ERROR)
+
+        response = self.client.get('/api/logs/analytics/', {'window': 'hour', 'category': LogCategory.HEALTH})
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        series = [row for bucket in response.json()['data'] for row in bucket['series']]
+        self.assertEqual(sum(row['events'] for row in series), 3)
+        self.assertEqual(sum(row['errors'] for row in series), 1)
+
+        response = self.client.get('/api/logs/analytics/', {'window': 'year'})
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+
+    @patch('core.services.log_export.EXPORT_FLUSH_BYTES', 100)
+    def test_export_streams_gzipped_ndjson(self):
+        events = self.create_events(5)
+        self.create_events(1, timestamp=self.now - timedelta(hours=2))
+
+        response = self.client.get('/api/logs/export/', {
+            'category': LogCategory.HEALTH,
+            'since': (self.now - timedelta(hours=1)).isoformat(),
+            'until': (self.now + timedelta(seconds=1)).isoformat(),
+        })
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        chunks = list(response.streaming_content)
+        self.assertGreater(len(chunks), 1)
+        rows = [json.loads(line) for line in gzip.decompress(b''.join(chunks)).splitlines()]
+        self.assertEqual([row['id'] for row in rows], [str(event.pk) for event in reversed(events)])
+        self.assertEqual(rows[0]['message_template'], HEALTH_CHECK_SUCCESS)
+
+        response = self.client.get('/api/logs/export/', {'since': self.now.isoformat(), 'until': self.now.isoformat()})
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+
+
+class ClientEventsViewTest(TestCase):
+    URL = '/api/logs/client-events/'
+
+    def setUp(self):
+        self.client = APIClient()
+        patcher = patch('core.views.logs.client_event_limiter', ClientRateLimiter(rate_per_second=0, burst=5))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_events(self, count, **overrides):
+        return [
+            {
+                'level': LogLevel.ERROR,
+                'message': 'Payment form error',
+                'context_data': {'field': f'field-{i}'},
+                **overrides,
+            }
+            for i in range(count)
+        ]
+
+    def test_batch_is_stored_with_one_bulk_write(self):
+        with patch.object(db_logger.sink, 'emit_many', wraps=db_logger.sink.emit_many) as emit_many:
+            response = self.client.post(self.URL, self.make_events(3), format='json', REMOTE_ADDR='10.1.2.3')
+
+        self.assertEqual(response.status_code, HTTP_202_ACCEPTED)
+        self.assertEqual(response.json()['data'], {'received': 3, 'stored': 3})
+        emit_many.assert_called_once()
+        events = LogEvent.objects.filter(category=LogCategory.CLIENT)
+        self.assertEqual(events.count(), 3)
+        self.assertEqual({event.ip_address for event in events}, {'10.1.2.3'})
+        self.assertEqual({event.endpoint for event in events}, {self.URL})
+        self.assertEqual(events.first().formatted_message, "Client event: Payment form error")
+
+    def test_clients_choose_neither_category_nor_template(self):
+        events = self.make_events(1, category=LogCategory.PAYMENT, message='{a.b}', context_data={'a': 1})
+        events += self.make_events(1, message='{a:>50000000}', context_data={'a': 1})
+        response = self.client.post(self.URL, events, format='json')
+
+        self.assertEqual(response.status_code, HTTP_202_ACCEPTED)
+        self.assertFalse(LogEvent.objects.filter(category=LogCategory.PAYMENT).exists())
+        stored = LogEvent.objects.filter(category=LogCategory.CLIENT)
+        self.assertEqual({event.message_template for event in stored}, {CLIENT_EVENT_REPORTED})
+        self.assertEqual(
+            {event.formatted_message for event in stored},
+            {"Client event: {a.b}", "Client event: {a:>50000000}"},
+        )
+        self.assertEqual(stored.first().context_data['context'], {'a': 1})
+
+    def test_invalid_and_oversized_batches_are_rejected(self):
+        response = self.client.post(self.URL, self.make_events(1, level=LogLevel.CRITICAL), format='json')
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(self.URL, self.make_events(1, context_data={'blob': 'x' * 5000}), format='json')
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+
+        with override_settings(DB_LOGGER={'CLIENT_EVENTS_MAX_BATCH': 2}):
+            response = self.client.post(self.URL, self.make_events(3), format='json')
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+
+        with override_settings(DB_LOGGER={'CLIENT_EVENTS_MAX_BODY_BYTES': 100}):
+            response = self.client.post(self.URL, self.make_events(3), format='json')
+        self.assertEqual(response.status_code, HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertFalse(LogEvent.objects.filter(category=LogCategory.CLIENT).exists())
+
+    def test_clients_are_rate_limited_per_ip(self):
+        response = self.client.post(self.URL, self.make_events(4), format='json', REMOTE_ADDR='10.0.0.1')
+        self.assertEqual(response.status_code, HTTP_202_ACCEPTED)
+
+        response = self.client.post(self.URL, self.make_events(2), format='json', REMOTE_ADDR='10.0.0.1')
+        self.assertEqual(response.status_code, HTTP_429_TOO_MANY_REQUESTS)
+
+        response = self.client.post(self.URL, self.make_events(2), format='json', REMOTE_ADDR='10.0.0.2')
+        self.assertEqual(response.status_code, HTTP_202_ACCEPTED)
+
+    def test_forwarded_for_is_only_trusted_behind_configured_proxies(self):
+        for spoofed in ('1.1.1.1', '2.2.2.2'):
+            response = self.client.post(
+                self.URL, self.make_events(3), format='json',
+                REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR=spoofed,
+            )
+        self.assertEqual(response.status_code, HTTP_429_TOO_MANY_REQUESTS)
+
+        with override_settings(DB_LOGGER={'CLIENT_EVENTS_TRUSTED_PROXIES': 1}):
+            for spoofed in ('1.1.1.1', '2.2.2.2'):
+                response = self.client.post(
+                    self.URL, self.make_events(3), format='json',
+                    REMOTE_ADDR='10.0.0.9', HTTP_X_FORWARDED_FOR=f'{spoofed}, 203.0.113.7',
+                )
+        self.assertEqual(response.status_code, HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_missing_or_malformed_content_length_is_rejected(self):
+        response = self.client.post(self.URL, self.make_events(1), format='json', CONTENT_LENGTH='')
+        self.assertEqual(response.status_code, HTTP_411_LENGTH_REQUIRED)
+
+        response = self.client.post(self.URL, self.make_events(1), format='json', CONTENT_LENGTH='12abc')
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+        self.assertFalse(LogEvent.objects.filter(category=LogCategory.CLIENT).exists())
+
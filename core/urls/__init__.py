@@ -7,4 +7,5 @@ urlpatterns = [
     path("invoices/", include("core.urls.invoices")),
     path("transactions/", include("core.urls.transactions")),
     path("payments/", include("core.urls.payments")),
+    path("logs/", include("core.urls.logs")),
 ]
\ No newline at end of file
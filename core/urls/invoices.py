@@ -1,13 +1,15 @@
 from django.urls import path
-from core.views.invoices import InvoicesView
+from core.views.invoices import InvoicesBulkView, InvoicesView
 from core.views.transactions import InvoiceTransactionsView
 from core.views.payments import CreatePaymentIntentView
 from core.constants.urls import (
     INVOICES_ROOT_PATH,
+    INVOICES_BULK_PATH,
     INVOICE_DETAIL_PATH,
     INVOICE_TRANSACTIONS_PATH,
     INVOICE_CREATE_PAYMENT_INTENT_PATH,
     INVOICES_NAME,
+    INVOICES_BULK_NAME,
     INVOICE_DETAIL_NAME,
     INVOICE_TRANSACTIONS_NAME,
     CREATE_PAYMENT_INTENT_NAME,
@@ -18,6 +20,7 @@ app_name = INVOICES_APP_NAME
 
 urlpatterns = [
     path(INVOICES_ROOT_PATH, InvoicesView.as_view(), name=INVOICES_NAME),
+    path(INVOICES_BULK_PATH, InvoicesBulkView.as_view(), name=INVOICES_BULK_NAME),
     path(INVOICE_DETAIL_PATH, InvoicesView.as_view(), name=INVOICE_DETAIL_NAME),
 
     path(INVOICE_TRANSACTIONS_PATH, InvoiceTransactionsView.as_view(), name=INVOICE_TRANSACTIONS_NAME),
@@ -0,0 +1,35 @@
+from django.urls import path
+from core.views.logs import (
+    LogEventsView,
+    LatencyReportView,
+    ErrorGroupsView,
+    LogAnalyticsView,
+    LogExportView,
+    ClientEventsView,
+)
+from core.constants.urls import (
+    LOG_EVENTS_ROOT_PATH,
+    LOG_LATENCY_PATH,
+    LOG_ERRORS_PATH,
+    LOG_ANALYTICS_PATH,
+    LOG_EXPORT_PATH,
+    LOG_CLIENT_EVENTS_PATH,
+    LOG_EVENTS_NAME,
+    LOG_LATENCY_NAME,
+    LOG_ERRORS_NAME,
+    LOG_ANALYTICS_NAME,
+    LOG_EXPORT_NAME,
+    LOG_CLIENT_EVENTS_NAME,
+    LOGS_APP_NAME,
+)
+
+app_name = LOGS_APP_NAME
+
+urlpatterns = [
+    path(LOG_EVENTS_ROOT_PATH, LogEventsView.as_view(), name=LOG_EVENTS_NAME),
+    path(LOG_LATENCY_PATH, LatencyReportView.as_view(), name=LOG_LATENCY_NAME),
+    path(LOG_ERRORS_PATH, ErrorGroupsView.as_view(), name=LOG_ERRORS_NAME),
+    path(LOG_ANALYTICS_PATH, LogAnalyticsView.as_view(), name=LOG_ANALYTICS_NAME),
+    path(LOG_EXPORT_PATH, LogExportView.as_view(), name=LOG_EXPORT_NAME),
+    path(LOG_CLIENT_EVENTS_PATH, ClientEventsView.as_view(), name=LOG_CLIENT_EVENTS_NAME),
+]
@@ -0,0 +1,21 @@
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(timestamp: datetime, pk: uuid.UUID) -> str:
+    payload = json.dumps([timestamp.isoformat(), str(pk)], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Inverse of encode_cursor; raises ValueError for anything it did not produce."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        timestamp, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(timestamp), uuid.UUID(pk)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -0,0 +1,161 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import weakref
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+_queued_handlers = weakref.WeakSet()
+
+
+class QueuedHandler(QueueHandler):
+    """
+    Hands records to a background thread that passes them to `target`, so
+    the logging call never waits on the file or stream.
+
+    The message and any traceback are rendered on the calling thread; layout
+    formatting and I/O happen on the listener. The listener starts on first
+    use and again in a forked child (each gunicorn worker gets its own, even
+    with --preload). `stop_queue_listeners` drains and stops them.
+    """
+
+    def __init__(self, target: logging.Handler):
+        super().__init__(queue.SimpleQueue())
+        self.target = target
+        self._listener = None
+        self._pid = None
+        self._lock = threading.Lock()
+        _queued_handlers.add(self)
+
+    def setFormatter(self, fmt):
+        self.target.setFormatter(fmt)
+
+    def enqueue(self, record):
+        if self._pid != os.getpid():
+            self._start()
+        super().enqueue(record)
+
+    def _start(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # A parent's listener thread does not survive a fork; start afresh.
+            self.queue = queue.SimpleQueue()
+            self._listener = QueueListener(self.queue, self.target)
+            self._listener.start()
+            self._pid = os.getpid()
+
+    def stop(self):
+        """Write out queued records and stop the listener; the next record restarts it."""
+        with self._lock:
+            if self._listener is not None and self._pid == os.getpid():
+                self._listener.stop()
+            self._listener = None
+            self._pid = None
+        self.target.flush()
+
+    def close(self):
+        self.stop()
+        self.target.close()
+        super().close()
+
+
+class SharedRotatingFileHandler(logging.Handler):
+    """
+    Size-rotated log file that several processes may append to, with the
+    scheme JsonLinesSink uses: records are written with O_APPEND, rotation to
+    `<file>.1` ... `<file>.<backupCount>` happens under an advisory lock on
+    `<file>.lock`, and a process that finds the file rotated underneath it
+    reopens it before its next write. Like RotatingFileHandler, it never
+    rotates unless both `maxBytes` and `backupCount` are set.
+    """
+
+    def __init__(self, filename, maxBytes=0, backupCount=0, encoding='utf-8'):
+        super().__init__()
+        self.baseFilename = os.path.abspath(os.fspath(filename))
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+        self.encoding = encoding
+        self._fd = None
+        self._inode = None
+
+    def emit(self, record):
+        try:
+            data = (self.format(record) + '\n').encode(self.encoding)
+            with self.lock:
+                self._ensure_open()
+                if self.maxBytes > 0 and self.backupCount > 0:
+                    size = os.fstat(self._fd).st_size
+                    if size and size + len(data) > self.maxBytes:
+                        self._rotate()
+                os.write(self._fd, data)
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        with self.lock:
+            self._close_fd()
+        super().close()
+
+    def _ensure_open(self):
+        if self._fd is not None:
+            try:
+                if os.stat(self.baseFilename).st_ino == self._inode:
+                    return
+            except FileNotFoundError:
+                pass
+            self._close_fd()
+        self._fd = os.open(self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._inode = os.fstat(self._fd).st_ino
+
+    def _close_fd(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._inode = None
+
+    def _rotate(self):
+        lock_fd = os.open(f"{self.baseFilename}.lock", os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            # Another process may have rotated while we waited for the lock.
+            if os.stat(self.baseFilename).st_ino == self._inode:
+                for index in range(self.backupCount - 1, 0, -1):
+                    source = f"{self.baseFilename}.{index}"
+                    if os.path.exists(source):
+                        os.replace(source, f"{self.baseFilename}.{index + 1}")
+                os.replace(self.baseFilename, f"{self.baseFilename}.1")
+        finally:
+            os.close(lock_fd)
+        self._close_fd()
+        self._ensure_open()
+
+
+class QueuedRotatingFileHandler(QueuedHandler):
+    """Queued SharedRotatingFileHandler; every worker process may write and rotate the same file."""
+
+    def __init__(self, filename, maxBytes=0, backupCount=0, encoding='utf-8'):
+        super().__init__(
+            SharedRotatingFileHandler(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding)
+        )
+
+
+class QueuedStreamHandler(QueuedHandler):
+
+    def __init__(self, stream=None):
+        super().__init__(logging.StreamHandler(stream))
+
+
+def stop_queue_listeners() -> None:
+    for handler in list(_queued_handlers):
+        handler.stop()
+
+
+atexit.register(stop_queue_listeners)
@@ -17,7 +17,7 @@ from core.constants.logging import (
 )
 from django.db import connection
 from django.db.utils import OperationalError
-from core.services.logger_service import db_logger, get_client_ip
+from core.services.logger_service import db_logger
 from core.models.logger import LogCategory
 
 
@@ -26,10 +26,7 @@ def health_check(request):
     db_logger.info(
         category=LogCategory.HEALTH,
         message_template=HEALTH_CHECK_SUCCESS,
-        context_data={'check_type': 'basic'},
-        ip_address=get_client_ip(request),
-        endpoint=request.path,
-        request_method=request.method
+        context_data={'check_type': 'basic'}
     )
     return custom_response(HTTP_200_OK, HEALTH_OK_MESSAGE)
 
@@ -44,17 +41,13 @@ def health_check_db(request):
         db_logger.info(
             category=LogCategory.HEALTH,
             message_template=HEALTH_CHECK_SUCCESS,
-            context_data={'check_type': 'database'},
-            ip_address=get_client_ip(request),
-            endpoint=request.path,
-            request_method=request.method
+            context_data={'check_type': 'database'}
         )
 
         db_logger.info(
             category=LogCategory.DATABASE,
             message_template=DB_CONNECTION_SUCCESS,
-            context_data={},
-            ip_address=get_client_ip(request)
+            context_data={}
         )
 
     except OperationalError as e:
@@ -62,9 +55,6 @@ def health_check_db(request):
             category=LogCategory.HEALTH,
             message_template=HEALTH_CHECK_FAILED,
             context_data={'check_type': 'database', 'error': str(e)},
-            ip_address=get_client_ip(request),
-            endpoint=request.path,
-            request_method=request.method,
             error_type=type(e).__name__,
             include_stack_trace=True
         )
@@ -73,7 +63,6 @@ def health_check_db(request):
             category=LogCategory.DATABASE,
             message_template=DB_CONNECTION_FAILED,
             context_data={'error': str(e)},
-            ip_address=get_client_ip(request),
             error_type=type(e).__name__
         )
 
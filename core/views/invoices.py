@@ -8,6 +8,9 @@ from core.utils.serializer import handle_serializer_save
 from core.constants.api import (
     INVOICE_CREATION_SUCCESS_MESSAGE,
     INVOICE_CREATION_FAILED_MESSAGE,
+    INVOICE_BULK_CREATION_SUCCESS_MESSAGE,
+    INVOICE_BULK_CREATION_FAILED_MESSAGE,
+    INVOICE_BULK_MAX_BATCH,
     HTTP_200_OK,
     HTTP_404_NOT_FOUND,
     INVOICE_RETRIEVAL_SUCCESS_MESSAGE,
@@ -99,6 +102,23 @@ class InvoicesView(APIView):
             )
 
 
+class InvoicesBulkView(APIView):
+    """
+    Creates a list of invoices in one request, all or none. Validation errors
+    are returned as a list aligned with the submitted items.
+    """
+
+    def post(self, request):
+        serializer = InvoiceSerializer(
+            data=request.data, many=True, allow_empty=False, max_length=INVOICE_BULK_MAX_BATCH,
+        )
+        return handle_serializer_save(
+            serializer,
+            INVOICE_BULK_CREATION_SUCCESS_MESSAGE,
+            INVOICE_BULK_CREATION_FAILED_MESSAGE,
+        )
+
+
 class BusinessOwnerInvoicesView(APIView):
     def get(self, request, company_name):
         try:
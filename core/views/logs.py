@@ -0,0 +1,193 @@
+from django.http import StreamingHttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+from core.models.logger import ErrorGroup
+from core.serializers.logger import (
+    LogEventSerializer,
+    LogEventQuerySerializer,
+    ErrorGroupSerializer,
+    ErrorGroupQuerySerializer,
+    LogAnalyticsQuerySerializer,
+    LogExportQuerySerializer,
+    ClientEventSerializer,
+)
+from core.services.log_analytics import log_analytics
+from core.services.log_export import export_log_event_rows, iter_ndjson_gz
+from core.services.latency import latency_recorder
+from core.services.log_query import query_log_events
+from core.services.logger_service import (
+    client_event_limiter,
+    db_logger,
+    get_logger_config,
+    get_rate_limit_key,
+)
+from core.constants.api import (
+    LOG_EVENTS_RETRIEVAL_SUCCESS_MESSAGE,
+    LOG_EVENTS_QUERY_INVALID_MESSAGE,
+    LOG_EVENTS_CURSOR_INVALID_MESSAGE,
+    LOG_EVENTS_MAX_PAGE_SIZE,
+    LOG_EVENTS_RESULTS_FIELD,
+    LOG_EVENTS_NEXT_CURSOR_FIELD,
+    LATENCY_REPORT_RETRIEVAL_SUCCESS_MESSAGE,
+    ERROR_GROUPS_RETRIEVAL_SUCCESS_MESSAGE,
+    ERROR_GROUPS_QUERY_INVALID_MESSAGE,
+    ERROR_GROUPS_MAX_LIMIT,
+    LOG_ANALYTICS_RETRIEVAL_SUCCESS_MESSAGE,
+    LOG_ANALYTICS_QUERY_INVALID_MESSAGE,
+    LOG_EXPORT_QUERY_INVALID_MESSAGE,
+    LOG_EXPORT_CONTENT_TYPE,
+    LOG_EXPORT_FILENAME,
+    CLIENT_EVENTS_ACCEPTED_MESSAGE,
+    CLIENT_EVENTS_INVALID_MESSAGE,
+    CLIENT_EVENTS_TOO_LARGE_MESSAGE,
+    CLIENT_EVENTS_LENGTH_REQUIRED_MESSAGE,
+    CLIENT_EVENTS_RATE_LIMITED_MESSAGE,
+    CLIENT_EVENTS_RECEIVED_FIELD,
+    CLIENT_EVENTS_STORED_FIELD,
+    HTTP_200_OK,
+    HTTP_202_ACCEPTED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_411_LENGTH_REQUIRED,
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    HTTP_429_TOO_MANY_REQUESTS,
+)
+from core.utils.custom_response import custom_response
+
+
+class LogEventsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        query = LogEventQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return custom_response(HTTP_400_BAD_REQUEST, LOG_EVENTS_QUERY_INVALID_MESSAGE, query.errors)
+
+        filters = query.validated_data
+        config = get_logger_config()
+        try:
+            events, next_cursor = query_log_events(
+                filters,
+                page_size=min(filters['page_size'], LOG_EVENTS_MAX_PAGE_SIZE),
+                cursor=filters.get('cursor'),
+                archive_dir=config['ARCHIVE_DIR'],
+                archive_after_days=config['ARCHIVE_AFTER_DAYS'],
+            )
+        except ValueError:
+            return custom_response(HTTP_400_BAD_REQUEST, LOG_EVENTS_CURSOR_INVALID_MESSAGE, None)
+
+        return custom_response(
+            HTTP_200_OK,
+            LOG_EVENTS_RETRIEVAL_SUCCESS_MESSAGE,
+            {
+                LOG_EVENTS_RESULTS_FIELD: LogEventSerializer(events, many=True).data,
+                LOG_EVENTS_NEXT_CURSOR_FIELD: next_cursor,
+            },
+        )
+
+
+class LatencyReportView(APIView):
+    """Latency percentiles recorded by the worker process that serves the request."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return custom_response(HTTP_200_OK, LATENCY_REPORT_RETRIEVAL_SUCCESS_MESSAGE, latency_recorder.report())
+
+
+class ErrorGroupsView(APIView):
+    """Most frequent error groups, read from their counters rather than from LogEvent rows."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        query = ErrorGroupQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return custom_response(HTTP_400_BAD_REQUEST, ERROR_GROUPS_QUERY_INVALID_MESSAGE, query.errors)
+
+        filters = query.validated_data
+        groups = ErrorGroup.objects.order_by('-occurrence_count', '-last_seen')
+        if filters.get('error_type'):
+            groups = groups.filter(error_type=filters['error_type'])
+        if filters.get('since'):
+            groups = groups.filter(last_seen__gte=filters['since'])
+        groups = groups[:min(filters['limit'], ERROR_GROUPS_MAX_LIMIT)]
+
+        return custom_response(
+            HTTP_200_OK, ERROR_GROUPS_RETRIEVAL_SUCCESS_MESSAGE, ErrorGroupSerializer(groups, many=True).data
+        )
+
+
+class LogAnalyticsView(APIView):
+    """Event volume, error rate and latency percentiles per category and endpoint, bucketed by time."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        query = LogAnalyticsQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return custom_response(HTTP_400_BAD_REQUEST, LOG_ANALYTICS_QUERY_INVALID_MESSAGE, query.errors)
+
+        return custom_response(HTTP_200_OK, LOG_ANALYTICS_RETRIEVAL_SUCCESS_MESSAGE, log_analytics(**query.validated_data))
+
+
+class LogExportView(APIView):
+    """LogEvents in [since, until) as a gzip-compressed NDJSON download, streamed as rows are read."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        query = LogExportQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return custom_response(HTTP_400_BAD_REQUEST, LOG_EXPORT_QUERY_INVALID_MESSAGE, query.errors)
+
+        filters = query.validated_data
+        response = StreamingHttpResponse(
+            iter_ndjson_gz(export_log_event_rows(filters)),
+            content_type=LOG_EXPORT_CONTENT_TYPE,
+        )
+        filename = LOG_EXPORT_FILENAME.format(
+            since=filters['since'].strftime('%Y%m%dT%H%M%S'),
+            until=filters['until'].strftime('%Y%m%dT%H%M%S'),
+        )
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+class ClientEventsView(APIView):
+    """
+    Batched events reported by the frontend, stored as LogEvents with one bulk
+    insert. Batches are capped in bytes and events, and each client IP gets a
+    token bucket refilled at CLIENT_EVENTS_RATE_PER_SECOND events per second.
+    The endpoint is unauthenticated, so events always land in the CLIENT
+    category under a fixed template (see ClientEventSerializer).
+
+    The byte cap is checked against Content-Length before the body is read,
+    so bodies without one (chunked uploads) are refused rather than buffered.
+    """
+
+    def post(self, request):
+        config = get_logger_config()
+        content_length = request.META.get('CONTENT_LENGTH')
+        if not content_length:
+            return custom_response(HTTP_411_LENGTH_REQUIRED, CLIENT_EVENTS_LENGTH_REQUIRED_MESSAGE, None)
+        try:
+            content_length = int(content_length)
+        except ValueError:
+            return custom_response(HTTP_400_BAD_REQUEST, CLIENT_EVENTS_INVALID_MESSAGE, None)
+        if content_length > config['CLIENT_EVENTS_MAX_BODY_BYTES']:
+            return custom_response(HTTP_413_REQUEST_ENTITY_TOO_LARGE, CLIENT_EVENTS_TOO_LARGE_MESSAGE, None)
+
+        serializer = ClientEventSerializer(
+            data=request.data, many=True, allow_empty=False, max_length=config['CLIENT_EVENTS_MAX_BATCH'],
+        )
+        if not serializer.is_valid():
+            return custom_response(HTTP_400_BAD_REQUEST, CLIENT_EVENTS_INVALID_MESSAGE, serializer.errors)
+
+        events = serializer.validated_data
+        client = get_rate_limit_key(request, config['CLIENT_EVENTS_TRUSTED_PROXIES'])
+        if not client_event_limiter.consume(client, len(events)):
+            return custom_response(HTTP_429_TOO_MANY_REQUESTS, CLIENT_EVENTS_RATE_LIMITED_MESSAGE, None)
+
+        stored = db_logger.log_many(events)
+        return custom_response(
+            HTTP_202_ACCEPTED,
+            CLIENT_EVENTS_ACCEPTED_MESSAGE,
+            {CLIENT_EVENTS_RECEIVED_FIELD: len(events), CLIENT_EVENTS_STORED_FIELD: len(stored)},
+        )
+
@@ -54,15 +54,15 @@ class CreatePaymentIntentView(APIView):
             customer_email = request.data.get(CUSTOMER_EMAIL_FIELD)
             payment_amount = request.data.get(PAYMENT_AMOUNT_FIELD)
             
-            logger.info(f"Payment request for invoice {invoice_id}: customer_email={customer_email}, payment_amount={payment_amount}")
+            logger.info("Payment request for invoice %s: customer_email=%s, payment_amount=%s", invoice_id, customer_email, payment_amount)
             
             if payment_amount is not None:
                 try:
                     from decimal import Decimal
                     payment_amount = Decimal(str(payment_amount))
-                    logger.info(f"Converted payment amount to Decimal: {payment_amount}")
+                    logger.info("Converted payment amount to Decimal: %s", payment_amount)
                 except (ValueError, TypeError):
-                    logger.error(f"Invalid payment amount format: {payment_amount}")
+                    logger.error("Invalid payment amount format: %s", payment_amount)
                     return custom_response(
                         HTTP_400_BAD_REQUEST,
                         PAYMENT_AMOUNT_INVALID_MESSAGE,
@@ -107,7 +107,7 @@ class CreatePaymentIntentView(APIView):
                 None,
             )
         except Exception as e:
-            logger.error(f"Error creating payment intent for invoice {invoice_id}: {str(e)}")
+            logger.error("Error creating payment intent for invoice %s: %s", invoice_id, e)
             return custom_response(
                 HTTP_400_BAD_REQUEST,
                 f"Failed to create payment intent: {str(e)}",
@@ -140,7 +140,7 @@ class RefundPaymentView(APIView):
                 None,
             )
         except Exception as e:
-            logger.error(f"Error processing refund for payment {stripe_payment_id}: {str(e)}")
+            logger.error("Error processing refund for payment %s: %s", stripe_payment_id, e)
 
             error_message = str(e)
             if "already been refunded" in error_message.lower():
@@ -186,7 +186,7 @@ class PaymentDetailView(APIView):
                 None,
             )
         except Exception as e:
-            logger.error(f"Error retrieving payment {payment_id}: {str(e)}")
+            logger.error("Error retrieving payment %s: %s", payment_id, e)
             return custom_response(
                 HTTP_400_BAD_REQUEST,
                 f"Failed to retrieve payment: {str(e)}",
@@ -19,33 +19,18 @@ from core.constants.api import (
     CUSTOMER_DELETION_FAILED_MESSAGE,
 )
 from core.constants.logging import (
-    API_REQUEST_RECEIVED,
-    API_REQUEST_COMPLETED,
     USER_RETRIEVED,
     USER_RETRIEVAL_FAILED,
     USER_CREATION_FAILED as LOG_USER_CREATION_FAILED
 )
 from core.models.user import BusinessOwner, Customer
 from core.utils.custom_response import custom_response
-from core.services.logger_service import db_logger, get_request_context
+from core.services.logger_service import db_logger
 from core.models.logger import LogCategory
 
 
 class BusinessOwnerView(APIView):
     def get(self, request, company_name=None):
-        context = get_request_context(request)
-
-        db_logger.info(
-            category=LogCategory.API,
-            message_template=API_REQUEST_RECEIVED,
-            context_data={
-                'method': request.method,
-                'endpoint': request.path,
-                'ip_address': context['ip_address']
-            },
-            **context
-        )
-
         if company_name:
             try:
                 business_owner = BusinessOwner.objects.get(id=company_name)
@@ -57,8 +42,7 @@ class BusinessOwnerView(APIView):
                     context_data={
                         'user_type': 'BusinessOwner',
                         'user_id': str(business_owner.id)
-                    },
-                    **context
+                    }
                 )
 
                 return custom_response(
@@ -71,8 +55,7 @@ class BusinessOwnerView(APIView):
                     context_data={
                         'user_type': 'BusinessOwner',
                         'user_id': company_name
-                    },
-                    **context
+                    }
                 )
 
                 return custom_response(
@@ -89,8 +72,7 @@ class BusinessOwnerView(APIView):
                     'user_type': 'BusinessOwner',
                     'user_id': 'all',
                     'count': len(business_owners)
-                },
-                **context
+                }
             )
 
             return custom_response(
@@ -98,19 +80,6 @@ class BusinessOwnerView(APIView):
             )
 
     def post(self, request):
-        context = get_request_context(request)
-
-        db_logger.info(
-            category=LogCategory.API,
-            message_template=API_REQUEST_RECEIVED,
-            context_data={
-                'method': request.method,
-                'endpoint': request.path,
-                'ip_address': context['ip_address']
-            },
-            **context
-        )
-
         serializer = BusinessOwnerSerializer(
             data=request.data, context={REQUEST_CONTEXT_KEY: request}
         )
@@ -122,8 +91,7 @@ class BusinessOwnerView(APIView):
                 context_data={
                     'user_type': 'BusinessOwner',
                     'error': str(serializer.errors)
-                },
-                **context
+                }
             )
 
         return handle_serializer_save(
@@ -131,34 +99,10 @@ class BusinessOwnerView(APIView):
         )
 
     def delete(self, request, company_name):
-        context = get_request_context(request)
-
-        db_logger.info(
-            category=LogCategory.API,
-            message_template=API_REQUEST_RECEIVED,
-            context_data={
-                'method': request.method,
-                'endpoint': request.path,
-                'ip_address': context['ip_address']
-            },
-            **context
-        )
-
         try:
             business_owner = BusinessOwner.objects.get(id=company_name)
             business_owner.delete()
 
-            db_logger.info(
-                category=LogCategory.API,
-                message_template=API_REQUEST_COMPLETED,
-                context_data={
-                    'method': request.method,
-                    'endpoint': request.path,
-                    'status_code': HTTP_200_OK
-                },
-                **context
-            )
-
             return custom_response(
                 HTTP_200_OK,
                 BUSINESS_OWNER_DELETION_SUCCESS_MESSAGE,
@@ -171,8 +115,7 @@ class BusinessOwnerView(APIView):
                 context_data={
                     'user_type': 'BusinessOwner',
                     'user_id': company_name
-                },
-                **context
+                }
             )
 
             return custom_response(
@@ -184,19 +127,6 @@ class BusinessOwnerView(APIView):
 
 class CustomerView(APIView):
     def get(self, request, customer_id=None):
-        context = get_request_context(request)
-
-        db_logger.info(
-            category=LogCategory.API,
-            message_template=API_REQUEST_RECEIVED,
-            context_data={
-                'method': request.method,
-                'endpoint': request.path,
-                'ip_address': context['ip_address']
-            },
-            **context
-        )
-
         if customer_id:
             try:
                 customer = Customer.objects.get(id=customer_id)
@@ -208,8 +138,7 @@ class CustomerView(APIView):
                     context_data={
                         'user_type': 'Customer',
                         'user_id': str(customer.id)
-                    },
-                    **context
+                    }
                 )
 
                 return custom_response(
@@ -222,8 +151,7 @@ class CustomerView(APIView):
                     context_data={
                         'user_type': 'Customer',
                         'user_id': customer_id
-                    },
-                    **context
+                    }
                 )
 
                 return custom_response(
@@ -240,8 +168,7 @@ class CustomerView(APIView):
                     'user_type': 'Customer',
                     'user_id': 'all',
                     'count': len(customers)
-                },
-                **context
+                }
             )
 
             return custom_response(
@@ -249,19 +176,6 @@ class CustomerView(APIView):
             )
 
     def post(self, request):
-        context = get_request_context(request)
-
-        db_logger.info(
-            category=LogCategory.API,
-            message_template=API_REQUEST_RECEIVED,
-            context_data={
-                'method': request.method,
-                'endpoint': request.path,
-                'ip_address': context['ip_address']
-            },
-            **context
-        )
-
         serializer = CustomerSerializer(
             data=request.data, context={REQUEST_CONTEXT_KEY: request}
         )
@@ -273,8 +187,7 @@ class CustomerView(APIView):
                 context_data={
                     'user_type': 'Customer',
                     'error': str(serializer.errors)
-                },
-                **context
+                }
             )
 
         return handle_serializer_save(
@@ -282,34 +195,10 @@ class CustomerView(APIView):
         )
 
     def delete(self, request, customer_id):
-        context = get_request_context(request)
-
-        db_logger.info(
-            category=LogCategory.API,
-            message_template=API_REQUEST_RECEIVED,
-            context_data={
-                'method': request.method,
-                'endpoint': request.path,
-                'ip_address': context['ip_address']
-            },
-            **context
-        )
-
         try:
             customer = Customer.objects.get(id=customer_id)
             customer.delete()
 
-            db_logger.info(
-                category=LogCategory.API,
-                message_template=API_REQUEST_COMPLETED,
-                context_data={
-                    'method': request.method,
-                    'endpoint': request.path,
-                    'status_code': HTTP_200_OK
-                },
-                **context
-            )
-
             return custom_response(
                 HTTP_200_OK,
                 CUSTOMER_DELETION_SUCCESS_MESSAGE,
@@ -322,8 +211,7 @@ class CustomerView(APIView):
                 context_data={
                     'user_type': 'Customer',
                     'user_id': customer_id
-                },
-                **context
+                }
             )
 
             return custom_response(
@@ -0,0 +1,13 @@
+# Loaded automatically by gunicorn from the working directory.
+
+
+def worker_exit(server, worker):
+    # Write out buffered audit log entries, then queued file/console records,
+    # before the worker goes away.
+    try:
+        from core.services.logger_service import db_logger
+        from core.utils.log_handlers import stop_queue_listeners
+    except Exception:
+        return
+    db_logger.shutdown()
+    stop_queue_listeners()